@@ -0,0 +1,89 @@
+from collections import deque
+
+
+class AhoCorasickAutomaton:
+    """
+    Aho-Corasick automaton over a fixed set of patterns.
+
+    A single left-to-right pass over a text reports every occurrence of
+    every pattern, whatever the number of patterns. The automaton is
+    immutable once built: when the patterns change, a new automaton is built
+    and swapped in with a single reference assignment.
+    """
+
+    def __init__(self, patterns):
+        """
+        Args:
+            patterns (iterable): (pattern string, payload) tuples; empty
+                patterns are ignored
+        """
+        self._goto = [{}]
+        self._fail = [0]
+        # Per state: (pattern length, payload) of every pattern ending there
+        self._outputs = [[]]
+
+        for pattern, payload in patterns:
+            if pattern:
+                self._insert(pattern, payload)
+        self._link()
+
+    def __len__(self):
+        return len(self._goto)
+
+    def _insert(self, pattern, payload):
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+            state = next_state
+        self._outputs[state].append((len(pattern), payload))
+
+    def _link(self):
+        # Breadth-first, so the failure state of a node is always resolved
+        # before the node's children need it
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+
+                # Patterns that are suffixes of this one end here too
+                self._outputs[next_state] = self._outputs[next_state] + self._outputs[self._fail[next_state]]
+
+    def find_all(self, text):
+        """
+        Find every pattern occurrence in the text.
+
+        Args:
+            text (str): Text to scan
+
+        Returns:
+            list: (start, end, payload) tuples ordered by end offset, where
+            text[start:end] equals the pattern
+        """
+        matches = []
+        state = 0
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            for length, payload in outputs[state]:
+                matches.append((position + 1 - length, position + 1, payload))
+
+        return matches
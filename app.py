@@ -1,99 +1,509 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, g, request, jsonify, redirect, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
-from fuzzywuzzy import process
-from translation_dictionaries import TEMPORARY_DICTIONARIES
+from json_encoding import decode_json, encode_json
+from request_logging import configure_logging, is_failure, log_request, should_sample
+from translation_service import (
+    AUTOMATON_MAX_DISTANCE, DEFAULT_FUZZY_BACKEND, FUZZY_BACKENDS, LOOKUP_CACHE, MAX_BATCH_ITEMS, MAX_SUGGESTIONS,
+    NEGATIVE_CACHE, SEARCH_MODES, annotate, current_generation, is_supported_pair, needs_pivot, pin_generation,
+    pivot_translate, reload_dictionaries, search_keys, start_dictionary_watcher, suggest, translate_batch,
+    translation_fields, unpin_generation
+)
+from text_normalization import fold_key, normalize_language
+from translation_api import (
+    HTTP_CACHE_MAX_AGE, canonical_query, canonical_url, exact_response_body, languages_payload,
+    parse_translate_query, parse_translate_request, translate_fast_path, translate_slow_path, translation_etag
+)
+import hashlib
+import hmac
 import logging
+import os
+import time
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Configure logging: records are written by a background thread
+configure_logging(logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider encoding and decoding with json_encoding (orjson when installed)"""
+
+    def dumps(self, obj, **kwargs):
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return encode_json(obj, default=self.default).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return decode_json(s)
+
+    def response(self, *args, **kwargs):
+        # Pretty-printed in debug mode, like the default provider
+        if self.compact is None and self._app.debug:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(encode_json(obj, default=self.default), mimetype=self.mimetype)
+
+
 app = Flask(__name__)
+app.json = FastJSONProvider(app)
 CORS(app)  # Enable CORS for all routes
 
+# Longest line accepted by /api/translate/stream; longer lines are skipped
+# and reported with a single error result
+MAX_STREAM_LINE_BYTES = 64 * 1024
+
+# Token expected in the X-Admin-Token header of admin routes; without one,
+# they are disabled (behind a reverse proxy every client is the local host,
+# so the remote address cannot tell who is asking)
+ADMIN_TOKEN = os.environ.get('ADMIN_TOKEN')
+
+
+@app.before_request
+def pin_dictionaries():
+    # Every lookup of a request sees the same dictionaries, even if a reload
+    # publishes new ones meanwhile
+    g.generation_token = pin_generation()
+
+
+@app.teardown_request
+def unpin_dictionaries(exception=None):
+    token = g.pop('generation_token', None)
+    if token is not None:
+        unpin_generation(token)
+
+
+def _route():
+    return request.url_rule.rule if request.url_rule is not None else request.path
+
+
+@app.before_request
+def start_request_log():
+    # Only sampled and failed requests are logged, with their payload
+    g.request_start = time.perf_counter()
+    g.log_sampled = should_sample(_route())
+
+
+@app.after_request
+def finish_request_log(response):
+    if 'request_start' in g and (g.log_sampled or is_failure(response.status_code)):
+        payload = g.get('log_payload', request.args.to_dict() or None)
+        log_request(_route(), request.method, response.status_code, time.perf_counter() - g.request_start, payload,
+                    g.log_sampled)
+    return response
+
 # Temporary in-memory dictionaries
 
 @app.route('/api/translate', methods=['POST'])
 def translate():
     try:
-        data = request.json
-        logger.info(f"Raw received data: {data}")
-        # Normalize language names (remove apostrophes and accents)
-        source_lang = data.get('sourceLang', '').lower().replace("'", "").replace("á", "a")
-        target_lang = data.get('targetLang', '').lower().replace("'", "").replace("á", "a")
-        text = data.get('text', '').lower().strip()
+        data = g.log_payload = request.json
         
-        logger.info(f"Normalized translation request: {source_lang} -> {target_lang}: '{text}'")
+        params, error = parse_translate_request(data)
+        if error is not None:
+            return jsonify(error[0]), error[1]
         
-        # Validate input
+        # Exact hits are answered with their pre-encoded body
+        body = exact_response_body(params)
+        if body is not None:
+            return Response(body, mimetype='application/json')
+        
+        payload, status = translate_fast_path(params) or translate_slow_path(params)
+        return jsonify(payload), status
+    
+    except Exception as e:
+        logger.error("Error processing translation request: %s", e)
+        return jsonify({'error': 'Internal server error', 'message': str(e)}), 500
+
+
+def cacheable(response, etag=None):
+    """Let shared caches keep a response for HTTP_CACHE_MAX_AGE, tagged with a weak ETag if given"""
+    if etag is not None:
+        response.set_etag(etag, weak=True)
+    response.cache_control.public = True
+    response.cache_control.max_age = HTTP_CACHE_MAX_AGE
+    return response
+
+
+@app.route('/api/translate', methods=['GET'])
+def translate_cacheable():
+    """
+    Cacheable variant of POST /api/translate, taking the same fields as query
+    parameters.
+
+    Requests are redirected to their canonical query string (see
+    translation_api.canonical_query) so that caches see a single URL per
+    lookup. Responses carry an ETag derived from the pair's dictionary
+    version and the normalized request; If-None-Match requests that match
+    it are answered with 304 without running the lookup.
+    """
+    try:
+        params, error = parse_translate_query(request.args.to_dict())
+        if error is not None:
+            return jsonify(error[0]), error[1]
+        
+        if list(request.args.items(multi=True)) != canonical_query(params):
+            return cacheable(redirect(canonical_url(request.path, params), 301))
+        
+        etag = translation_etag(params)
+        if request.if_none_match.contains_weak(etag):
+            return cacheable(Response(status=304), etag)
+        
+        body = exact_response_body(params)
+        if body is not None:
+            return cacheable(Response(body, mimetype='application/json'), etag)
+        
+        payload, status = translate_fast_path(params) or translate_slow_path(params)
+        response = jsonify(payload)
+        response.status_code = status
+        return cacheable(response, etag)
+    
+    except Exception as e:
+        logger.error("Error processing translation request: %s", e)
+        return jsonify({'error': 'Internal server error', 'message': str(e)}), 500
+
+
+def translate_items(items, fuzzy_backend=DEFAULT_FUZZY_BACKEND):
+    """
+    Translate {text, sourceLang, targetLang} items, resolving identical texts
+    once per language pair.
+
+    Args:
+        items (list): Items as sent by the client
+        fuzzy_backend (str): One of FUZZY_BACKENDS
+
+    Returns:
+        list: Response fields of every item, in input order; invalid items
+        get an 'error' field
+    """
+    # Normalize every item once, grouping the texts by language pair
+    normalized = []
+    texts_by_pair = {}
+    languages = {}
+    for item in items:
+        if not isinstance(item, dict) or not all(
+            isinstance(value, str)
+            for value in (item.get('text'), item.get('sourceLang', ''), item.get('targetLang', ''))
+        ):
+            normalized.append(None)
+            continue
+        
+        for language in (item.get('sourceLang', ''), item.get('targetLang', '')):
+            if language not in languages:
+                languages[language] = normalize_language(language)
+        source_lang = languages[item.get('sourceLang', '')]
+        target_lang = languages[item.get('targetLang', '')]
+        dict_key = f"{source_lang}-{target_lang}"
+        text = fold_key(item['text'])
+        
+        normalized.append((source_lang, target_lang, dict_key, text))
+        texts_by_pair.setdefault(dict_key, []).append(text)
+    
+    matches = {}
+    for dict_key, texts in texts_by_pair.items():
+        if needs_pivot(dict_key):
+            matches[dict_key] = {
+                text: pivot_translate(dict_key, text, 'fuzzy', fuzzy_backend)
+                for text in dict.fromkeys(texts) if text
+            }
+        elif is_supported_pair(dict_key):
+            matches[dict_key] = translate_batch(dict_key, [text for text in texts if text], fuzzy_backend)
+    
+    results = []
+    for item in normalized:
+        if item is None:
+            results.append({'error': 'Each item needs a text, a sourceLang and a targetLang'})
+            continue
+        
+        source_lang, target_lang, dict_key, text = item
         if not text:
-            return jsonify({'error': 'No text provided for translation'}), 400
+            results.append({'error': 'No text provided for translation'})
+        elif dict_key not in matches:
+            results.append({'error': 'Unsupported language pair', 'sourceLang': source_lang, 'targetLang': target_lang})
+        elif matches[dict_key][text] is None:
+            results.append({
+                'originalText': text,
+                'translation': f"Sorry, no translation found for '{text}'",
+                'matchType': 'none',
+                'sourceLang': source_lang,
+                'targetLang': target_lang
+            })
+        else:
+            results.append({
+                'originalText': text,
+                **matches[dict_key][text],
+                'sourceLang': source_lang,
+                'targetLang': target_lang
+            })
+    
+    return results
+
+
+@app.route('/api/translate/batch', methods=['POST'])
+def translate_many():
+    """
+    Translate an array of {text, sourceLang, targetLang} items in one request.
+
+    Identical texts are translated once per language pair and the results
+    come back in input order; an invalid item gets an 'error' result without
+    failing the rest of the batch.
+    """
+    try:
+        items = g.log_payload = request.json
+        fuzzy_backend = request.args.get('fuzzyBackend', DEFAULT_FUZZY_BACKEND)
+        
+        # Validate input
+        if not isinstance(items, list) or not items:
+            return jsonify({'error': 'Expected a non-empty array of {text, sourceLang, targetLang} items'}), 400
+        
+        if len(items) > MAX_BATCH_ITEMS:
+            return jsonify({'error': f'A batch holds at most {MAX_BATCH_ITEMS} items'}), 400
+        
+        if fuzzy_backend not in FUZZY_BACKENDS:
+            return jsonify({'error': f"Unsupported fuzzy backend. Must be one of: {', '.join(FUZZY_BACKENDS)}"}), 400
+        
+        logger.info("Batch translation request of %d items", len(items))
+        results = translate_items(items, fuzzy_backend)
+        
+        # The whole response is encoded once
+        return jsonify({'results': results, 'count': len(results)}), 200
+    
+    except Exception as e:
+        logger.error("Error processing batch translation request: %s", e)
+        return jsonify({'error': 'Internal server error', 'message': str(e)}), 500
+
+
+@app.route('/api/translate/stream', methods=['POST'])
+def translate_stream():
+    """
+    Translate a newline-delimited JSON stream of {text, sourceLang, targetLang}
+    items, streaming one NDJSON result line back per input line.
+
+    Lines are read and translated one at a time as the body arrives, so memory
+    does not depend on the size of the upload, and the server only reads the
+    next line once the client has consumed enough of the previous results.
+    """
+    fuzzy_backend = request.args.get('fuzzyBackend', DEFAULT_FUZZY_BACKEND)
+    
+    if fuzzy_backend not in FUZZY_BACKENDS:
+        return jsonify({'error': f"Unsupported fuzzy backend. Must be one of: {', '.join(FUZZY_BACKENDS)}"}), 400
+    
+    stream = request.stream
+    
+    def generate():
+        line_count = 0
+        while True:
+            line = stream.readline(MAX_STREAM_LINE_BYTES)
+            if not line:
+                break
+            
+            if len(line) == MAX_STREAM_LINE_BYTES and not line.endswith(b'\n'):
+                # Skip the rest of an overlong line, still in bounded reads, and
+                # report it once
+                while True:
+                    rest = stream.readline(MAX_STREAM_LINE_BYTES)
+                    if not rest or rest.endswith(b'\n'):
+                        break
+                line_count += 1
+                yield app.json.dumps({'error': f'Lines are limited to {MAX_STREAM_LINE_BYTES} bytes'}) + '\n'
+                continue
+            
+            if not line.strip():
+                continue
+            
+            line_count += 1
+            try:
+                result = translate_items([app.json.loads(line)], fuzzy_backend)[0]
+            except ValueError:
+                result = {'error': 'Invalid JSON line'}
+            except Exception as e:
+                # Headers are already sent, so errors are reported in the stream
+                logger.error("Error processing streamed translation line %d: %s", line_count, e)
+                result = {'error': 'Internal server error', 'message': str(e)}
             
+            yield app.json.dumps(result) + '\n'
+        
+        logger.info("Streamed translation of %d lines", line_count)
+    
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+
+@app.route('/api/annotate', methods=['POST'])
+def annotate_text():
+    """Return every dictionary term found in a document, with offsets and translations"""
+    try:
+        data = g.log_payload = request.json
+        source_lang = normalize_language(data.get('sourceLang', ''))
+        target_lang = normalize_language(data.get('targetLang', ''))
+        text = data.get('text', '')
+        overlapping = data.get('overlapping', True)
+        
+        # Validate input
+        if not text.strip():
+            return jsonify({'error': 'No text provided for annotation'}), 400
+        
+        if type(overlapping) is not bool:
+            return jsonify({'error': 'overlapping must be true or false'}), 400
+        
         if not source_lang or not target_lang:
             return jsonify({'error': 'Source or target language not specified'}), 400
         
-        # Determine which dictionary to use
         dict_key = f"{source_lang}-{target_lang}"
         
-        if dict_key not in TEMPORARY_DICTIONARIES:
+        if not is_supported_pair(dict_key):
             return jsonify({'error': 'Unsupported language pair'}), 400
         
-        dictionary = TEMPORARY_DICTIONARIES[dict_key]
+        normalized_text, spans = annotate(dict_key, text, overlapping)
         
-        # Exact match lookup
-        if text in dictionary:
-            return jsonify({
-                'originalText': text,
-                'translation': dictionary[text],
-                'matchType': 'exact',
-                'sourceLang': source_lang,
-                'targetLang': target_lang
-            }), 200
+        return jsonify({
+            'text': normalized_text,
+            'spans': spans,
+            'count': len(spans),
+            'sourceLang': source_lang,
+            'targetLang': target_lang
+        }), 200
+    
+    except Exception as e:
+        logger.error("Error processing annotation request: %s", e)
+        return jsonify({'error': 'Internal server error', 'message': str(e)}), 500
+
+
+@app.route('/api/search', methods=['GET'])
+def search():
+    """Search the dictionary keys of a language pair by wildcard, prefix or edit distance"""
+    try:
+        source_lang = normalize_language(request.args.get('sourceLang', ''))
+        target_lang = normalize_language(request.args.get('targetLang', ''))
+        query = request.args.get('query', '').strip()
+        mode = request.args.get('mode', 'wildcard')
+        max_distance = request.args.get('maxDistance', AUTOMATON_MAX_DISTANCE, type=int)
+        limit = request.args.get('limit', 50, type=int)
+        
+        # Validate input
+        if not query:
+            return jsonify({'error': 'No query provided'}), 400
+        
+        if mode not in SEARCH_MODES:
+            return jsonify({'error': f"Unsupported search mode. Must be one of: {', '.join(SEARCH_MODES)}"}), 400
+        
+        if not 0 <= max_distance <= 3:
+            return jsonify({'error': 'maxDistance must be between 0 and 3'}), 400
+        
+        dict_key = f"{source_lang}-{target_lang}"
+        
+        if not is_supported_pair(dict_key):
+            return jsonify({'error': 'Unsupported language pair'}), 400
+        
+        matches = search_keys(dict_key, query, mode, max_distance, max(limit, 1))
+        
+        results = []
+        for key, distance in matches:
+            result = {'word': key, **translation_fields(dict_key, key)}
+            if distance is not None:
+                result['editDistance'] = distance
+            results.append(result)
         
-        # If no exact match, try fuzzy matching
-        if dictionary:
-            best_match, score = process.extractOne(text, dictionary.keys())
-            
-            # If score is above threshold (70%)
-            if score >= 30:
-                return jsonify({
-                    'originalText': text,
-                    'translation': dictionary[best_match],
-                    'matchType': 'fuzzy',
-                    'fuzzyMatchScore': score,
-                    'matchedWord': best_match,
-                    'sourceLang': source_lang,
-                    'targetLang': target_lang
-                }),200
-        
-        # No match found
         return jsonify({
-            'originalText': text,
-            'translation': f"Sorry, no translation found for '{text}'",
-            'matchType': 'none',
+            'query': query,
+            'mode': mode,
+            'results': results,
+            'count': len(results),
             'sourceLang': source_lang,
             'targetLang': target_lang
-        }),404
+        }), 200
     
     except Exception as e:
-        logger.error(f"Error processing translation request: {str(e)}")
+        logger.error("Error processing search request: %s", e)
         return jsonify({'error': 'Internal server error', 'message': str(e)}), 500
 
 
-@app.route('/api/languages', methods=['GET'])
-def get_languages():
-    """Return available source and target languages"""
+@app.route('/api/suggest', methods=['GET'])
+def suggest_keys():
+    """Complete a prefix with the most popular dictionary keys, for search-as-you-type"""
+    try:
+        pair = request.args.get('pair', '')
+        prefix = request.args.get('prefix', '')
+        limit = request.args.get('limit', 10, type=int)
+        
+        # Validate input
+        if not prefix.strip():
+            return jsonify({'error': 'No prefix provided'}), 400
+        
+        if not 1 <= limit <= MAX_SUGGESTIONS:
+            return jsonify({'error': f'limit must be between 1 and {MAX_SUGGESTIONS}'}), 400
+        
+        # Normalize both languages of the pair, e.g. "English-Ghomála'" -> "english-ghomala"
+        dict_key = '-'.join(normalize_language(language) for language in pair.split('-', 1))
+        
+        if not is_supported_pair(dict_key):
+            return jsonify({'error': 'Unsupported language pair'}), 400
+        
+        suggestions = [
+            {'word': key, **translation_fields(dict_key, key)}
+            for key in suggest(dict_key, prefix, limit)
+        ]
+        
+        return jsonify({
+            'pair': dict_key,
+            'prefix': prefix,
+            'suggestions': suggestions,
+            'count': len(suggestions)
+        }), 200
+    
+    except Exception as e:
+        logger.error("Error processing suggest request: %s", e)
+        return jsonify({'error': 'Internal server error', 'message': str(e)}), 500
+
+
+@app.route('/api/stats', methods=['GET'])
+def get_stats():
+    """Return the sizes of the loaded dictionaries, pair loading and lookup cache counters"""
+    generation = current_generation()
     return jsonify({
-        'sourceLanguages': ['english', 'french'],
-        'targetLanguages': ['ghomala', 'fulfulde']
+        'generation': generation.summary(),
+        'dictionaries': {
+            dict_key: len(pair_index.dictionary) for dict_key, pair_index in generation.pair_indexes.loaded_items()
+        },
+        'pairRegistry': generation.pair_indexes.stats(),
+        'lookupCache': LOOKUP_CACHE.stats(),
+        'negativeCache': NEGATIVE_CACHE.stats()
     })
 
 
+@app.route('/api/languages', methods=['GET'])
+def get_languages():
+    """Return available source and target languages, generated from the language pair graph"""
+    response = jsonify(languages_payload())
+    # The listing only changes with the language pair graph, i.e. with its body
+    cacheable(response, hashlib.sha256(response.get_data()).hexdigest()[:32])
+    return response.make_conditional(request)
+
+
+@app.route('/api/admin/reload', methods=['POST'])
+def reload():
+    """
+    Reload the dictionaries from their source file and publish them once
+    built; requests in flight finish on the previous ones. Only reloads the
+    process serving the request (see DICTIONARY_WATCH_SECONDS for every
+    worker).
+    """
+    try:
+        if not ADMIN_TOKEN:
+            return jsonify({'error': 'Admin routes are disabled without ADMIN_TOKEN'}), 403
+        if not hmac.compare_digest(request.headers.get('X-Admin-Token', ''), ADMIN_TOKEN):
+            return jsonify({'error': 'Invalid admin token'}), 403
+
+        return jsonify(reload_dictionaries())
+
+    except Exception as e:
+        logger.error("Error reloading dictionaries: %s", e)
+        return jsonify({'error': 'Internal server error', 'message': str(e)}), 500
+
+
 
 
 
 if __name__ == '__main__':
+    start_dictionary_watcher()
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
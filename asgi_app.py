@@ -0,0 +1,268 @@
+from concurrent.futures import ThreadPoolExecutor
+from json_encoding import decode_json, encode_json
+from request_logging import configure_logging, log_request, should_sample
+from translation_api import (
+    HTTP_CACHE_MAX_AGE, canonical_query, canonical_url, exact_response_body, languages_payload,
+    parse_translate_query, parse_translate_request, translate_fast_path, translate_slow_path, translation_etag
+)
+from translation_service import is_pair_loaded, preload_dictionaries, start_dictionary_watcher
+from urllib.parse import parse_qsl
+import asyncio
+import hashlib
+import logging
+import os
+import time
+
+# Configure logging: records are written by a background thread
+configure_logging(logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Fuzzy, typo, segment and pivot lookups run on a bounded thread pool so that
+# they never block the event loop serving exact hits. The threads share the
+# published dictionaries, so they see reloads and contributions (a process
+# pool would keep the generation its workers were forked with)
+SLOW_PATH_WORKERS = int(os.environ.get('ASGI_SLOW_PATH_WORKERS', 4))
+
+# Slow-path requests waiting for or running on the pool; past this, requests
+# are turned away with 503 instead of queueing without bound
+MAX_PENDING_SLOW_PATH = int(os.environ.get('ASGI_MAX_PENDING', 64))
+
+# Largest request body accepted
+MAX_BODY_BYTES = 1024 * 1024
+
+_CORS_HEADERS = [
+    (b'access-control-allow-origin', b'*'),
+    (b'access-control-allow-methods', b'GET, POST, OPTIONS'),
+    (b'access-control-allow-headers', b'Content-Type'),
+]
+
+_CACHE_CONTROL = f'public, max-age={HTTP_CACHE_MAX_AGE}'.encode('latin-1')
+
+_executor = ThreadPoolExecutor(max_workers=SLOW_PATH_WORKERS, thread_name_prefix='slow-path')
+
+# Only touched from the event loop, so a plain counter is enough
+_pending_slow_path = 0
+
+
+async def _send_json(send, payload, status, extra_headers=()):
+    await _send_body(send, encode_json(payload), status, extra_headers)
+
+
+async def _send_body(send, body, status, extra_headers=()):
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [
+            (b'content-type', b'application/json'),
+            (b'content-length', str(len(body)).encode('latin-1')),
+            *_CORS_HEADERS,
+            *extra_headers
+        ]
+    })
+    await send({'type': 'http.response.body', 'body': body})
+
+
+async def _send_empty(send, status, extra_headers=()):
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [(b'content-length', b'0'), *_CORS_HEADERS, *extra_headers]
+    })
+    await send({'type': 'http.response.body', 'body': b''})
+
+
+def _cache_headers(etag=None):
+    """Headers letting shared caches keep a response for HTTP_CACHE_MAX_AGE, with a weak ETag if given"""
+    headers = [(b'cache-control', _CACHE_CONTROL)]
+    if etag is not None:
+        headers.append((b'etag', f'W/"{etag}"'.encode('latin-1')))
+    return headers
+
+
+def _if_none_match(scope, etag):
+    """Return True if the request's If-None-Match header matches the ETag (weak comparison)"""
+    for name, value in scope['headers']:
+        if name == b'if-none-match':
+            tags = [tag.strip() for tag in value.decode('latin-1').split(',')]
+            return any(tag == '*' or tag.removeprefix('W/') == f'"{etag}"' for tag in tags)
+    return False
+
+
+async def _read_body(receive):
+    """Read the request body, or return None if it is larger than MAX_BODY_BYTES"""
+    chunks = []
+    size = 0
+    while True:
+        message = await receive()
+        if message['type'] == 'http.disconnect':
+            return None
+        chunks.append(message.get('body', b''))
+        size += len(chunks[-1])
+        if size > MAX_BODY_BYTES:
+            return None
+        if not message.get('more_body', False):
+            return b''.join(chunks)
+
+
+async def translate(scope, receive, send, request_log):
+    """Same contract as the Flask POST /api/translate route"""
+    try:
+        body = await _read_body(receive)
+        if body is None:
+            return await _send_json(send, {'error': 'Request body too large'}, 413)
+
+        data = request_log['payload'] = decode_json(body)
+
+        params, error = parse_translate_request(data)
+        if error is not None:
+            return await _send_json(send, *error)
+
+        await _answer_translation(send, params)
+
+    except Exception as e:
+        logger.error("Error processing translation request: %s", e)
+        await _send_json(send, {'error': 'Internal server error', 'message': str(e)}, 500)
+
+
+async def translate_cacheable(scope, receive, send, request_log):
+    """Same contract as the Flask GET /api/translate route"""
+    try:
+        query = parse_qsl(scope['query_string'].decode('latin-1'), keep_blank_values=True)
+        args = {}
+        for name, value in query:
+            args.setdefault(name, value)
+        request_log['payload'] = args or None
+
+        params, error = parse_translate_query(args)
+        if error is not None:
+            return await _send_json(send, *error)
+
+        if query != canonical_query(params):
+            location = canonical_url(scope['path'], params).encode('latin-1')
+            return await _send_empty(send, 301, [(b'location', location), *_cache_headers()])
+
+        etag = translation_etag(params)
+        if _if_none_match(scope, etag):
+            return await _send_empty(send, 304, _cache_headers(etag))
+
+        await _answer_translation(send, params, _cache_headers(etag))
+
+    except Exception as e:
+        logger.error("Error processing translation request: %s", e)
+        await _send_json(send, {'error': 'Internal server error', 'message': str(e)}, 500)
+
+
+async def _answer_translation(send, params, extra_headers=()):
+    """Send the response of a valid translation request: fast path inline, slow path on the pool"""
+    global _pending_slow_path
+
+    # Exact hits are served inline, from their pre-encoded body if enabled.
+    # A pair that is not loaded (unloaded when idle, or changed by a
+    # contribution) would be built on the event loop, so its requests all
+    # go to the pool
+    loaded = is_pair_loaded(params['dictKey'])
+    if loaded:
+        body = exact_response_body(params)
+        if body is not None:
+            return await _send_body(send, body, 200, extra_headers)
+
+        response = translate_fast_path(params)
+        if response is not None:
+            return await _send_json(send, *response, extra_headers)
+
+    if _pending_slow_path >= MAX_PENDING_SLOW_PATH:
+        return await _send_json(send, {'error': 'Server busy, retry later'}, 503, [(b'retry-after', b'1')])
+
+    _pending_slow_path += 1
+    try:
+        payload, status = await asyncio.get_running_loop().run_in_executor(
+            _executor, translate_slow_path if loaded else translate_cold_pair, params
+        )
+    finally:
+        _pending_slow_path -= 1
+
+    await _send_json(send, payload, status, extra_headers)
+
+
+def translate_cold_pair(params):
+    """Answer a request whose language pair is not loaded, building it off the event loop"""
+    return translate_fast_path(params) or translate_slow_path(params)
+
+
+async def get_languages(scope, receive, send, request_log):
+    """Return available source and target languages, generated from the language pair graph"""
+    body = encode_json(languages_payload())
+    # The listing only changes with the language pair graph, i.e. with its body
+    etag = hashlib.sha256(body).hexdigest()[:32]
+    if _if_none_match(scope, etag):
+        return await _send_empty(send, 304, _cache_headers(etag))
+    await _send_body(send, body, 200, _cache_headers(etag))
+
+
+# Path -> {method: handler}
+ROUTES = {
+    '/api/translate': {'POST': translate, 'GET': translate_cacheable},
+    '/api/languages': {'GET': get_languages},
+}
+
+
+async def _lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            # Pairs are built before the first request rather than on the event loop
+            pair_count = await asyncio.get_running_loop().run_in_executor(None, preload_dictionaries)
+            logger.info("Preloaded %d language pairs", pair_count)
+            start_dictionary_watcher()
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            _executor.shutdown(wait=False, cancel_futures=True)
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+
+async def app(scope, receive, send):
+    """
+    ASGI entry point exposing /api/translate and /api/languages, e.g.
+    `uvicorn asgi_app:app --host 0.0.0.0 --port 5000`.
+    """
+    if scope['type'] == 'lifespan':
+        return await _lifespan(receive, send)
+
+    if scope['type'] != 'http':
+        return
+
+    route = ROUTES.get(scope['path'])
+    if route is None:
+        return await _send_json(send, {'error': 'Not found'}, 404)
+
+    method = scope['method']
+    if method == 'OPTIONS':
+        return await _send_json(send, {}, 200)
+
+    handler = route.get(method)
+    if handler is None:
+        allowed = ', '.join(route).encode('latin-1')
+        return await _send_json(send, {'error': 'Method not allowed'}, 405, [(b'allow', allowed)])
+
+    # Only sampled and failed requests are logged, with their payload
+    start = time.perf_counter()
+    request_log = {'status': 500, 'payload': None}
+
+    async def send_and_record(message):
+        if message['type'] == 'http.response.start':
+            request_log['status'] = message['status']
+        await send(message)
+
+    sampled = should_sample(scope['path'])
+    try:
+        await handler(scope, receive, send_and_record, request_log)
+    finally:
+        log_request(scope['path'], method, request_log['status'], time.perf_counter() - start, request_log['payload'],
+                    sampled)
+
+
+if __name__ == '__main__':
+    import uvicorn
+
+    uvicorn.run(app, host='0.0.0.0', port=5000)
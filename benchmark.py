@@ -0,0 +1,799 @@
+import argparse
+import asyncio
+import gc
+import importlib.util
+import json
+import os
+import py_compile
+import random
+import subprocess
+import sys
+import threading
+import string
+import time
+import tracemalloc
+
+from fuzzywuzzy import process
+from Levenshtein import distance as edit_distance
+from compiled_dictionary import CompiledDictionaryFile, content_hash, write_compiled_dictionaries
+from prefix_index import PrefixIndex
+from scoring_engines import FuzzywuzzyEngine, RapidfuzzEngine
+from translation_dictionaries import TEMPORARY_DICTIONARIES
+from trigram_index import TrigramIndex
+import translation_service
+
+
+# Fuzzy lookups with their expected (matched key, score) under each scoring
+# engine; "wattrrr" is a query where fuzzywuzzy's partial_ratio heuristic
+# underestimates the score
+FUZZY_PARITY_CASES = [
+    ('english-ghomala', 'wattrrr', {'fuzzywuzzy': ('want', 68), 'rapidfuzz': ('want', 77)}),
+    ('english-ghomala', 'fathr', {'fuzzywuzzy': ('father', 91), 'rapidfuzz': ('father', 91)}),
+    ('english-ghomala', 'goat herd', {'fuzzywuzzy': ('at', 90), 'rapidfuzz': ('at', 90)}),
+    ('french-ghomala', 'maisn', {'fuzzywuzzy': ('maison', 91), 'rapidfuzz': ('maison', 91)}),
+    ('french-ghomala', 'chvre', {'fuzzywuzzy': ('charge', 73), 'rapidfuzz': ('charge', 73)}),
+    ('english-french', 'gutterr', {'fuzzywuzzy': ('gutter', 92), 'rapidfuzz': ('gutter', 92)}),
+    ('french-english', 'mauvai', {'fuzzywuzzy': ('mauvais', 92), 'rapidfuzz': ('mauvais', 92)}),
+]
+
+
+def make_typo(word, rng):
+    """Return the word with one random character deleted, replaced or inserted"""
+    if len(word) < 2:
+        return word + rng.choice(string.ascii_lowercase)
+
+    position = rng.randrange(len(word))
+    operation = rng.choice(('delete', 'replace', 'insert'))
+    if operation == 'delete':
+        return word[:position] + word[position + 1:]
+    if operation == 'replace':
+        return word[:position] + rng.choice(string.ascii_lowercase) + word[position + 1:]
+    return word[:position] + rng.choice(string.ascii_lowercase) + word[position:]
+
+
+def grow_keys(keys, size, rng):
+    """Extend a list of real keys with synthetic variants until it reaches `size`"""
+    grown = list(dict.fromkeys(keys))
+    seen = set(grown)
+    while len(grown) < size:
+        variant = make_typo(rng.choice(keys), rng) + rng.choice(string.ascii_lowercase)
+        if variant not in seen:
+            seen.add(variant)
+            grown.append(variant)
+    return grown
+
+
+def sample_queries(keys, count, rng):
+    """Pick `count` misspelled versions of existing keys"""
+    return [make_typo(rng.choice(keys).lower(), rng) for _ in range(count)]
+
+
+def time_per_query(lookup, queries):
+    """Return the mean latency of `lookup` in milliseconds"""
+    start = time.perf_counter()
+    for query in queries:
+        lookup(query)
+    return (time.perf_counter() - start) * 1000 / len(queries)
+
+
+def benchmark_fuzzy_scaling(sizes, queries_per_size, full_scan_limit):
+    """
+    Compare the linear extractOne scan with the trigram shortlist as the
+    dictionary grows.
+    """
+    rng = random.Random(42)
+    base_keys = list(TEMPORARY_DICTIONARIES['english-ghomala'].keys())
+
+    print("Fuzzy lookup latency (ms/query)")
+    print(f"{'keys':>10} {'full scan':>12} {'trigram':>12}")
+
+    for size in sizes:
+        keys = grow_keys(base_keys, size, rng)
+        queries = sample_queries(base_keys, queries_per_size, rng)
+        index = TrigramIndex(keys)
+
+        trigram_ms = time_per_query(lambda q: process.extractOne(q, index.candidates(q)), queries)
+
+        # The full scan becomes too slow to measure on very large dictionaries
+        if size <= full_scan_limit:
+            full_scan_ms = f"{time_per_query(lambda q: process.extractOne(q, keys), queries):12.2f}"
+        else:
+            full_scan_ms = f"{'skipped':>12}"
+
+        print(f"{size:>10} {full_scan_ms} {trigram_ms:12.2f}")
+
+
+def check_typo_parity(queries_per_pair):
+    """
+    Check that typo mode returns the same key as a full extractOne scan.
+
+    The parity set is made of one-edit typos of real keys for which the full
+    scan's best match is within two edits of the query, i.e. the queries typo
+    mode is meant to answer.
+    """
+    rng = random.Random(7)
+    print("Typo mode parity with the full extractOne scan")
+
+    all_match = True
+    for dict_key, dictionary in TEMPORARY_DICTIONARIES.items():
+        keys = list(dictionary.keys())
+        parity_set = []
+        for query in sample_queries(keys, queries_per_pair, rng):
+            best_match, _ = process.extractOne(query, keys)
+            if edit_distance(query, best_match.lower()) <= 2:
+                parity_set.append((query, best_match))
+
+        start = time.perf_counter()
+        results = [translation_service.typo_match(dict_key, query) for query, _ in parity_set]
+        typo_ms = (time.perf_counter() - start) * 1000 / max(len(parity_set), 1)
+
+        mismatches = [
+            (query, expected, result)
+            for (query, expected), result in zip(parity_set, results)
+            if result is None or result[0] != expected
+        ]
+        all_match = all_match and not mismatches
+
+        print(f"{dict_key}: {len(parity_set) - len(mismatches)}/{len(parity_set)} identical, "
+              f"{typo_ms:.3f} ms/query")
+        for query, expected, result in mismatches:
+            print(f"    '{query}': expected '{expected}', got {result}")
+
+    return all_match
+
+
+def check_engine_parity(queries_per_pair):
+    """
+    Compare the scores of the rapidfuzz engine with fuzzywuzzy's extractOne
+    over full dictionaries.
+
+    Both engines use WRatio with the same preprocessing, but rapidfuzz
+    computes partial_ratio exactly where fuzzywuzzy uses a heuristic that can
+    only underestimate it. So on every query, the best score of rapidfuzz must
+    be at least fuzzywuzzy's, and both must give the same score when they pick
+    the same key; a different key is only accepted with a score at least as
+    high.
+    """
+    rng = random.Random(11)
+    fuzzywuzzy_engine = FuzzywuzzyEngine()
+    rapidfuzz_engine = RapidfuzzEngine()
+    print("rapidfuzz engine parity with fuzzywuzzy")
+
+    all_match = True
+    for dict_key, dictionary in TEMPORARY_DICTIONARIES.items():
+        keys = list(dictionary.keys())
+        queries = sample_queries(keys, queries_per_pair, rng)
+
+        expected = fuzzywuzzy_engine.extract_batch(queries, keys)
+        actual = rapidfuzz_engine.extract_batch(queries, keys)
+
+        mismatches = [
+            (query, e, a) for query, e, a in zip(queries, expected, actual)
+            if a[1] < e[1] or (a[0] == e[0] and a[1] != e[1])
+        ]
+        all_match = all_match and not mismatches
+
+        same_match = sum(e[0] == a[0] for e, a in zip(expected, actual))
+        print(f"{dict_key}: best match identical {same_match}/{len(queries)}, "
+              f"scores consistent {len(queries) - len(mismatches)}/{len(queries)}")
+        for query, e, a in mismatches:
+            print(f"    '{query}': fuzzywuzzy {e}, rapidfuzz {a}")
+
+    return all_match
+
+
+def check_fuzzy_cases():
+    """
+    Check the served fuzzy lookups of FUZZY_PARITY_CASES, with every fuzzy
+    backend, against their expected key and score under the configured
+    scoring engine.
+    """
+    engine = translation_service.SCORING_ENGINE.name
+    print(f"Fuzzy lookups with the {engine} engine")
+
+    mismatches = []
+    for dict_key, query, expected_by_engine in FUZZY_PARITY_CASES:
+        expected = expected_by_engine[engine]
+        for backend in translation_service.FUZZY_BACKENDS:
+            match = translation_service.find_match(dict_key, query, 'fuzzy', backend)
+            result = (match['matchedWord'], match['fuzzyMatchScore']) if match is not None else None
+            if result != expected:
+                mismatches.append((dict_key, query, backend, expected, result))
+
+    print(f"{len(FUZZY_PARITY_CASES) - len({case[:2] for case in mismatches})}/{len(FUZZY_PARITY_CASES)} identical")
+    for dict_key, query, backend, expected, result in mismatches:
+        print(f"    {dict_key} '{query}' ({backend}): expected {expected}, got {result}")
+
+    return not mismatches
+
+
+def check_reload_contribution():
+    """
+    Check that a contribution made after a reload that reused its pair is
+    found exactly in both directions, also once the pairs were unloaded and
+    rebuilt by their loaders (as after PAIR_IDLE_SECONDS without use).
+
+    Adds an entry to the served english-ghomala dictionary.
+    """
+    source_text, target_text = 'qqreloadcheck', 'zzreloadcheck'
+    print("Contribution after a reload")
+
+    pair_indexes = translation_service.current_generation().pair_indexes
+    pair_indexes['english-ghomala']
+    pair_indexes['ghomala-english']
+    translation_service.reload_dictionaries()
+    translation_service.add_translation('english-ghomala', source_text, target_text)
+
+    failures = []
+    for stage in ('reused', 'reloaded'):
+        if stage == 'reloaded':
+            pair_indexes = translation_service.current_generation().pair_indexes
+            pair_indexes.unload('english-ghomala')
+            pair_indexes.unload('ghomala-english')
+        for dict_key, text, expected in (('english-ghomala', source_text, source_text),
+                                         ('ghomala-english', target_text, target_text)):
+            matched_word = translation_service.exact_match(dict_key, text)
+            if matched_word != expected:
+                failures.append((stage, dict_key, text, matched_word))
+
+    print(f"{4 - len(failures)}/4 exact")
+    for stage, dict_key, text, matched_word in failures:
+        print(f"    {dict_key} '{text}' ({stage} pairs): expected an exact match, got {matched_word}")
+
+    return not failures
+
+
+def check_parity(queries_per_pair):
+    """
+    Run the deterministic parity checks (fuzzy lookups, typo mode, scoring
+    engines, contributions across a reload) on the bundled dictionaries,
+    without any benchmark.
+
+    Returns:
+        bool: True if every check passed
+    """
+    passed = check_fuzzy_cases()
+    print()
+    passed = check_typo_parity(queries_per_pair) and passed
+    print()
+    passed = check_engine_parity(queries_per_pair) and passed
+    print()
+    # Last, since it adds an entry to the dictionaries
+    passed = check_reload_contribution() and passed
+    return passed
+
+
+def benchmark_batch_scoring(query_count):
+    """Score N queries against every key of a pair with each engine"""
+    rng = random.Random(5)
+    keys = list(TEMPORARY_DICTIONARIES['english-ghomala'].keys())
+    queries = sample_queries(keys, query_count, rng)
+
+    print(f"Batch scoring of {len(queries)} queries x {len(keys)} keys")
+    timings = {}
+    for engine in (FuzzywuzzyEngine(), RapidfuzzEngine()):
+        start = time.perf_counter()
+        engine.extract_batch(queries, keys)
+        timings[engine.name] = time.perf_counter() - start
+        print(f"{engine.name:>12}: {timings[engine.name] * 1000:10.1f} ms")
+
+    print(f"{'speedup':>12}: {timings['fuzzywuzzy'] / timings['rapidfuzz']:10.1f}x")
+
+
+def benchmark_batch_endpoint(item_count):
+    """Compare one /api/translate call per word with a single /api/translate/batch call"""
+    import logging
+    from app import app
+
+    rng = random.Random(15)
+    keys = list(TEMPORARY_DICTIONARIES['english-ghomala'].keys())
+    # Half exact hits, half typos, with some repeated words
+    texts = [rng.choice(keys) if rng.random() < 0.5 else make_typo(rng.choice(keys), rng) for _ in range(item_count)]
+    texts += texts[:item_count // 4]
+    items = [{'text': text, 'sourceLang': 'english', 'targetLang': 'ghomala'} for text in texts]
+
+    logging.disable(logging.INFO)
+    client = app.test_client()
+    print(f"Translation of {len(items)} items ({translation_service.SCORING_ENGINE.name} engine)")
+
+    translation_service.LOOKUP_CACHE.clear()
+    translation_service.NEGATIVE_CACHE.reset_pair('english-ghomala')
+    start = time.perf_counter()
+    for item in items:
+        client.post('/api/translate', json=item)
+    print(f"{'per item':>12}: {(time.perf_counter() - start) * 1000:10.1f} ms")
+
+    translation_service.LOOKUP_CACHE.clear()
+    translation_service.NEGATIVE_CACHE.reset_pair('english-ghomala')
+    start = time.perf_counter()
+    client.post('/api/translate/batch', json=items)
+    print(f"{'batch':>12}: {(time.perf_counter() - start) * 1000:10.1f} ms")
+    logging.disable(logging.NOTSET)
+
+
+def benchmark_exact_hits(request_count):
+    """
+    Measure single-thread /api/translate throughput on exact hits, i.e. what
+    one worker serves, with Flask's JSON provider and no pre-encoded bodies
+    (before) and with the faster encoder and pre-encoded bodies (after).
+    """
+    import logging
+    from flask.json.provider import DefaultJSONProvider
+    import json_encoding
+    import translation_api
+    from app import FastJSONProvider, app
+
+    rng = random.Random(23)
+    keys = list(TEMPORARY_DICTIONARIES['english-ghomala'].keys())
+    bodies = [
+        json.dumps({'text': rng.choice(keys), 'sourceLang': 'english', 'targetLang': 'ghomala'})
+        for _ in range(request_count)
+    ]
+
+    logging.disable(logging.INFO)
+    client = app.test_client()
+    default_encoder = json_encoding.JSON_ENCODER
+    print(f"Exact hits per second, one worker ({json_encoding.JSON_ENCODER} encoder)")
+
+    configurations = (
+        ('jsonify', DefaultJSONProvider, 'json', False),
+        ('encoder', FastJSONProvider, default_encoder, False),
+        ('pre-encoded', FastJSONProvider, default_encoder, True),
+    )
+    for label, provider_class, encoder, pre_encoded in configurations:
+        app.json = provider_class(app)
+        json_encoding.JSON_ENCODER = encoder
+        translation_api.PRE_ENCODED_RESPONSES = pre_encoded
+
+        # Warm up, filling the pre-encoded bodies
+        for body in bodies:
+            client.post('/api/translate', data=body, content_type='application/json')
+
+        start = time.perf_counter()
+        for body in bodies:
+            client.post('/api/translate', data=body, content_type='application/json')
+        print(f"{label:>12}: {request_count / (time.perf_counter() - start):10.0f}")
+
+    app.json = FastJSONProvider(app)
+    logging.disable(logging.NOTSET)
+
+
+def benchmark_logging(request_count):
+    """
+    Measure the logging cost paid by request threads: the former synchronous,
+    eagerly formatted per-request logs against the queued, sampled request
+    log, per call and on /api/translate exact-hit throughput.
+    """
+    import logging
+    import request_logging
+    from app import app
+
+    rng = random.Random(29)
+    keys = list(TEMPORARY_DICTIONARIES['english-ghomala'].keys())
+    payloads = [{'text': rng.choice(keys), 'sourceLang': 'english', 'targetLang': 'ghomala'} for _ in range(request_count)]
+    devnull = open(os.devnull, 'w')
+    root = logging.getLogger()
+    handlers = list(root.handlers)
+    logger = logging.getLogger('benchmark')
+
+    # Former logging: two f-strings per request written synchronously
+    for handler in handlers:
+        root.removeHandler(handler)
+    sync_handler = logging.StreamHandler(devnull)
+    sync_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    root.addHandler(sync_handler)
+
+    def synchronous_logs(data):
+        logger.info(f"Raw received data: {data}")
+        logger.info(f"Normalized translation request: {data['sourceLang']} -> {data['targetLang']}: '{data['text']}'")
+
+    def sampled_logs(data):
+        sampled = request_logging.should_sample('/api/translate')
+        logger.debug("Normalized translation request: %s -> %s: '%s'", data['sourceLang'], data['targetLang'],
+                     data['text'])
+        request_logging.log_request('/api/translate', 'POST', 200, 0.001, data, sampled)
+
+    print("Logging cost per request in the request thread (us)")
+    print(f"{'synchronous':>12}: {time_per_query(synchronous_logs, payloads) * 1000:10.2f}")
+    root.removeHandler(sync_handler)
+
+    request_logging.configure_logging(logging.INFO, devnull)
+    for rate in (0.01, 1):
+        request_logging.LOG_SAMPLE_RATES['/api/translate'] = rate
+        print(f"{f'queued {rate:g}':>12}: {time_per_query(sampled_logs, payloads) * 1000:10.2f}")
+
+    client = app.test_client()
+    # Warm up, filling the pre-encoded bodies
+    for payload in payloads:
+        client.post('/api/translate', json=payload)
+
+    print("Exact hits per second, one worker")
+    for label, rate in (('no logging', None), ('sampled 0', 0), ('sampled 0.01', 0.01), ('sampled 1', 1)):
+        logging.disable(logging.CRITICAL if rate is None else logging.NOTSET)
+        request_logging.LOG_SAMPLE_RATES['/api/translate'] = rate or 0
+        # Best of three runs, as the background writer competes for the GIL
+        seconds = []
+        for _ in range(3):
+            start = time.perf_counter()
+            for payload in payloads:
+                client.post('/api/translate', json=payload)
+            seconds.append(time.perf_counter() - start)
+        print(f"{label:>12}: {request_count / min(seconds):10.0f}")
+
+    logging.disable(logging.NOTSET)
+    del request_logging.LOG_SAMPLE_RATES['/api/translate']
+    request_logging.configure_logging(logging.INFO)
+
+
+def benchmark_stream(line_counts):
+    """
+    Stream words of the Bandjoun corpus through /api/translate/stream and
+    report the time to the first result and the peak memory allocated while
+    consuming the response, which should not grow with the number of lines.
+    """
+    import logging
+    from app import app
+
+    with open('dataset_collection/french-ghomala-bandjoun.json', encoding='utf-8') as corpus_file:
+        corpus = json.load(corpus_file)
+    words = [word for pair in corpus for word in pair['francais'].split()[:3]]
+
+    logging.disable(logging.INFO)
+    client = app.test_client()
+    print("Streamed translation (french -> ghomala)")
+    print(f"{'lines':>10} {'first (ms)':>12} {'total (s)':>12} {'peak (KiB)':>12}")
+
+    for line_count in line_counts:
+        lines = (
+            json.dumps({'text': words[index % len(words)], 'sourceLang': 'french', 'targetLang': 'ghomala'}) + '\n'
+            for index in range(line_count)
+        )
+        body = ''.join(lines).encode('utf-8')
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        response = client.post('/api/translate/stream', data=body, content_type='application/x-ndjson', buffered=False)
+        first_ms = None
+        for _ in response.response:
+            if first_ms is None:
+                first_ms = (time.perf_counter() - start) * 1000
+        total = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(f"{line_count:>10} {first_ms:12.2f} {total:12.2f} {peak / 1024:12.0f}")
+    logging.disable(logging.NOTSET)
+
+
+def benchmark_asgi(fuzzy_count, exact_count):
+    """
+    Send exact lookups to the ASGI app while fuzzy lookups keep its pool
+    busy, and report the exact lookups' latency.
+    """
+    import logging
+    import asgi_app
+
+    rng = random.Random(17)
+    keys = list(TEMPORARY_DICTIONARIES['english-ghomala'].keys())
+    scope = {'type': 'http', 'method': 'POST', 'path': '/api/translate'}
+
+    async def call(text):
+        body = json.dumps({'text': text, 'sourceLang': 'english', 'targetLang': 'ghomala'}).encode('utf-8')
+        messages = []
+
+        async def receive():
+            return {'type': 'http.request', 'body': body, 'more_body': False}
+
+        async def send(message):
+            messages.append(message)
+
+        start = time.perf_counter()
+        await asgi_app.app(scope, receive, send)
+        return (time.perf_counter() - start) * 1000
+
+    async def run():
+        fuzzy = [asyncio.create_task(call(make_typo(rng.choice(keys), rng) + 'x')) for _ in range(fuzzy_count)]
+        exact = []
+        for _ in range(exact_count):
+            exact.append(await call(rng.choice(keys)))
+            await asyncio.sleep(0.001)
+        fuzzy_ms = await asyncio.gather(*fuzzy)
+        return sorted(exact), max(fuzzy_ms)
+
+    logging.disable(logging.INFO)
+    translation_service.LOOKUP_CACHE.clear()
+    exact_ms, fuzzy_total_ms = asyncio.run(run())
+    logging.disable(logging.NOTSET)
+
+    print(f"ASGI exact lookups during {fuzzy_count} fuzzy lookups ({fuzzy_total_ms:.0f} ms in total)")
+    for percentile in (50, 99):
+        print(f"{'p' + str(percentile):>12}: {exact_ms[len(exact_ms) * percentile // 100]:8.3f} ms")
+
+
+def read_memory_kib():
+    """Return the RSS, PSS and private (unshared) memory of this process in KiB"""
+    fields = {}
+    with open('/proc/self/smaps_rollup') as smaps:
+        for line in smaps:
+            name, value = line.split()[:2]
+            fields[name.rstrip(':')] = int(value) if value.isdigit() else value
+    return fields['Rss'], fields['Pss'], fields['Private_Clean'] + fields['Private_Dirty']
+
+
+def benchmark_worker_memory(worker_count, lookup_count):
+    """
+    Fork workers from a process that already built every index, as gunicorn
+    does with preload_app, and report how much memory each worker has to
+    copy after serving lookups and running a full collection, with and
+    without gc.freeze() in the parent.
+    """
+    import logging
+
+    logging.disable(logging.INFO)
+    translation_service.current_generation().pair_indexes.load_all()
+    rng = random.Random(18)
+    keys = list(TEMPORARY_DICTIONARIES['english-ghomala'].keys())
+    queries = [rng.choice(keys) for _ in range(lookup_count // 2)] + sample_queries(keys, lookup_count // 2, rng)
+
+    print(f"Per-worker memory after {lookup_count} lookups (KiB, Linux only)")
+    print(f"{'parent':>10} {'rss':>10} {'pss':>10} {'private':>10}")
+
+    for freeze in (False, True):
+        gc.collect()
+        if freeze:
+            gc.freeze()
+
+        pipes = []
+        for _ in range(worker_count):
+            read_end, write_end = os.pipe()
+            if os.fork() == 0:
+                os.close(read_end)
+                for query in queries:
+                    if translation_service.exact_match('english-ghomala', query) is None:
+                        translation_service.find_match('english-ghomala', query)
+                gc.collect()
+                os.write(write_end, json.dumps(read_memory_kib()).encode('utf-8'))
+                # Stay alive until every worker has measured, so that shared pages count as shared
+                time.sleep(1)
+                os._exit(0)
+            os.close(write_end)
+            pipes.append(read_end)
+
+        reports = []
+        for read_end in pipes:
+            with os.fdopen(read_end) as pipe:
+                reports.append(json.loads(pipe.read()))
+        for _ in pipes:
+            os.wait()
+
+        rss, pss, private = (sum(values) // worker_count for values in zip(*reports))
+        label = 'frozen' if freeze else 'default'
+        print(f"{label:>10} {rss:10} {pss:10} {private:10}")
+
+        if freeze:
+            gc.unfreeze()
+    logging.disable(logging.NOTSET)
+
+
+def benchmark_compiled_dictionaries(lookup_count, compiled_path='/tmp/benchmark_dictionaries.gdict'):
+    """
+    Compare service startup with the Python dictionaries and with the
+    memory-mapped compiled file, and time exact lookups read from the file.
+    """
+    write_compiled_dictionaries(TEMPORARY_DICTIONARIES, compiled_path)
+
+    startup_code = (
+        "import logging, time; logging.disable(logging.INFO); start = time.perf_counter(); "
+        "import translation_service; print(time.perf_counter() - start)"
+    )
+    print("Service startup (s)")
+    for label, compiled in (('python', ''), ('compiled', compiled_path)):
+        env = {**os.environ, 'COMPILED_DICTIONARIES': compiled}
+        output = subprocess.run([sys.executable, '-c', startup_code], env=env, capture_output=True, text=True, check=True)
+        print(f"{label:>12}: {float(output.stdout.strip().splitlines()[-1]):10.3f}")
+
+    rng = random.Random(19)
+    dictionary = TEMPORARY_DICTIONARIES['english-ghomala']
+    compiled = CompiledDictionaryFile(compiled_path).open_pair('english-ghomala')
+    keys = [rng.choice(list(dictionary)) for _ in range(lookup_count)]
+    folded = [key.lower() for key in keys]
+
+    print("Exact lookup (us)")
+    print(f"{'dict':>12}: {time_per_query(dictionary.__getitem__, keys) * 1000:10.2f}")
+    print(f"{'compiled':>12}: {time_per_query(compiled.__getitem__, keys) * 1000:10.2f}")
+    print(f"{'folded':>12}: {time_per_query(compiled.folded_keys.get, folded) * 1000:10.2f}")
+
+
+def benchmark_snapshot(compiled_path='/tmp/benchmark_dictionaries.gdict'):
+    """
+    Compare the dictionary snapshot with the generated Python module: artifact
+    size, import time and latency of the first request of a new process.
+    """
+    write_compiled_dictionaries(TEMPORARY_DICTIONARIES, compiled_path)
+    snapshot = CompiledDictionaryFile(compiled_path)
+    for dict_key, dictionary in TEMPORARY_DICTIONARIES.items():
+        if snapshot.pair_hash(dict_key) != content_hash(dictionary):
+            raise SystemExit(f"Snapshot content hash mismatch for {dict_key}")
+
+    module_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'translation_dictionaries.py')
+    bytecode_path = importlib.util.cache_from_source(module_path)
+    py_compile.compile(module_path, cfile=bytecode_path)
+
+    print("Artifact size (KiB)")
+    for label, path in (('module', module_path), ('bytecode', bytecode_path), ('snapshot', compiled_path)):
+        print(f"{label:>12}: {os.path.getsize(path) / 1024:10.1f}")
+
+    def run(code, compiled, extra_args=()):
+        env = {**os.environ, 'COMPILED_DICTIONARIES': compiled}
+        output = subprocess.run([sys.executable, *extra_args, '-c', code], env=env, capture_output=True, text=True,
+                                check=True)
+        return float(output.stdout.strip().splitlines()[-1])
+
+    def run_cold(code):
+        # Without its bytecode (and -B so that none is written) the module is
+        # parsed and compiled, as on a fresh deployment
+        os.remove(bytecode_path)
+        try:
+            return run(code, '', ('-B',))
+        finally:
+            py_compile.compile(module_path, cfile=bytecode_path)
+
+    module_code = (
+        "import time; start = time.perf_counter(); "
+        "import translation_dictionaries; print(time.perf_counter() - start)"
+    )
+    snapshot_code = (
+        "import time; start = time.perf_counter(); from compiled_dictionary import CompiledDictionaryFile; "
+        f"snapshot = CompiledDictionaryFile({compiled_path!r}); "
+        "[snapshot.open_pair(dict_key) for dict_key in snapshot.pairs]; print(time.perf_counter() - start)"
+    )
+    print("Import (ms)")
+    print(f"{'module cold':>12}: {run_cold(module_code) * 1000:10.1f}")
+    print(f"{'module pyc':>12}: {run(module_code, '') * 1000:10.1f}")
+    print(f"{'snapshot':>12}: {run(snapshot_code, compiled_path) * 1000:10.1f}")
+
+    first_request_code = (
+        "import logging, time; logging.disable(logging.INFO); start = time.perf_counter(); "
+        "from app import app; "
+        "app.test_client().post('/api/translate', json={'sourceLang': 'english', 'targetLang': 'ghomala', "
+        "'text': 'water'}); print(time.perf_counter() - start)"
+    )
+    print("Process start to first response (ms)")
+    print(f"{'module cold':>12}: {run_cold(first_request_code) * 1000:10.1f}")
+    print(f"{'module pyc':>12}: {run(first_request_code, '') * 1000:10.1f}")
+    print(f"{'snapshot':>12}: {run(first_request_code, compiled_path) * 1000:10.1f}")
+
+
+def benchmark_reload(lookup_count):
+    """
+    Measure exact lookup latency while reload_dictionaries rebuilds every
+    loaded pair in the background, against the same lookups without a reload.
+    """
+    generation = translation_service.current_generation()
+    generation.pair_indexes.load_all()
+    texts = [key.lower() for key in list(TEMPORARY_DICTIONARIES['english-ghomala'])[:lookup_count]]
+
+    def lookup_latencies():
+        latencies = []
+        for text in texts:
+            start = time.perf_counter()
+            with translation_service.pinned_generation():
+                matched_word = translation_service.exact_match('english-ghomala', text)
+                translation_service.translation_fields('english-ghomala', matched_word)
+            latencies.append((time.perf_counter() - start) * 1000)
+        latencies.sort()
+        return latencies
+
+    print("Exact lookup during reload (ms)")
+    idle = lookup_latencies()
+
+    # Pairs changed by contributions are rebuilt rather than taken over
+    generation.changed_pairs.update(generation.pair_indexes)
+    summary = {}
+    reload_thread = threading.Thread(target=lambda: summary.update(translation_service.reload_dictionaries()))
+    reload_thread.start()
+    during = []
+    while reload_thread.is_alive():
+        during.extend(lookup_latencies())
+    reload_thread.join()
+    during.sort()
+
+    for label, latencies in (('idle', idle), ('reloading', during)):
+        print(f"{label:>12}: p50 {latencies[len(latencies) // 2]:8.4f}  p99 {latencies[len(latencies) * 99 // 100]:8.4f}"
+              f"  max {latencies[-1]:8.3f}")
+    print(f"Reload rebuilt {len(summary['rebuiltPairs'])} pairs in {summary['seconds']:.2f} s")
+
+
+def benchmark_suggest(size, query_count):
+    """Measure autocompletion latency percentiles on a grown dictionary"""
+    rng = random.Random(13)
+    base_keys = list(TEMPORARY_DICTIONARIES['english-ghomala'].keys())
+    keys = grow_keys(base_keys, size, rng)
+
+    start = time.perf_counter()
+    index = PrefixIndex(keys, top_k=translation_service.MAX_SUGGESTIONS)
+    print(f"Prefix index of {len(index)} keys built in {time.perf_counter() - start:.1f} s")
+
+    # Prefixes of every length users type, from the first character on
+    prefixes = []
+    for _ in range(query_count):
+        key = rng.choice(keys)
+        prefixes.append(key[:rng.randint(1, len(key))])
+
+    for limit in (10, translation_service.MAX_SUGGESTIONS):
+        latencies = []
+        for prefix in prefixes:
+            start = time.perf_counter()
+            index.complete(prefix, limit)
+            latencies.append((time.perf_counter() - start) * 1000)
+        latencies.sort()
+
+        print(f"{'limit ' + str(limit):>12}: p50 {latencies[len(latencies) // 2]:8.3f} ms"
+              f"  p99 {latencies[len(latencies) * 99 // 100]:8.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks for the translation API")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1700, 20000, 200000])
+    parser.add_argument('--queries', type=int, default=50)
+    parser.add_argument('--full-scan-limit', type=int, default=20000)
+    parser.add_argument('--parity-queries', type=int, default=300)
+    parser.add_argument('--batch-queries', type=int, default=200)
+    parser.add_argument('--batch-items', type=int, default=500)
+    parser.add_argument('--exact-requests', type=int, default=5000)
+    parser.add_argument('--logged-requests', type=int, default=5000)
+    parser.add_argument('--stream-lines', type=int, nargs='+', default=[500, 2000])
+    parser.add_argument('--asgi-fuzzy', type=int, default=60)
+    parser.add_argument('--asgi-exact', type=int, default=500)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--worker-lookups', type=int, default=200)
+    parser.add_argument('--compiled-lookups', type=int, default=100000)
+    parser.add_argument('--reload-lookups', type=int, default=1000)
+    parser.add_argument('--suggest-size', type=int, default=1000000)
+    parser.add_argument('--suggest-queries', type=int, default=10000)
+    parser.add_argument('--check', action='store_true',
+                        help="only run the parity checks, on --check-queries queries per pair")
+    parser.add_argument('--check-queries', type=int, default=40)
+    args = parser.parse_args()
+
+    if args.check:
+        if not check_parity(args.check_queries):
+            raise SystemExit("Parity checks failed")
+        return
+
+    benchmark_fuzzy_scaling(args.sizes, args.queries, args.full_scan_limit)
+    print()
+    if not check_typo_parity(args.parity_queries):
+        raise SystemExit("Typo mode parity check failed")
+    print()
+    if not check_engine_parity(args.parity_queries):
+        raise SystemExit("rapidfuzz engine parity check failed")
+    print()
+    if not check_fuzzy_cases():
+        raise SystemExit("Fuzzy lookup check failed")
+    print()
+    benchmark_batch_scoring(args.batch_queries)
+    print()
+    benchmark_batch_endpoint(args.batch_items)
+    print()
+    benchmark_exact_hits(args.exact_requests)
+    print()
+    benchmark_logging(args.logged_requests)
+    print()
+    benchmark_stream(args.stream_lines)
+    print()
+    benchmark_asgi(args.asgi_fuzzy, args.asgi_exact)
+    print()
+    benchmark_worker_memory(args.workers, args.worker_lookups)
+    print()
+    benchmark_compiled_dictionaries(args.compiled_lookups)
+    print()
+    benchmark_snapshot()
+    print()
+    benchmark_reload(args.reload_lookups)
+    print()
+    benchmark_suggest(args.suggest_size, args.suggest_queries)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,341 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import zlib
+from collections.abc import Mapping, MutableMapping
+from text_normalization import fold_key
+
+# File layout (integers are unsigned 32-bit):
+#
+#   header     MAGIC, FORMAT_VERSION, length of the directory
+#   directory  UTF-8 JSON: byte order, content hash of the whole snapshot
+#              and, per language pair, its content hash and the offset and
+#              sizes of its section
+#   sections   one per pair, 4-byte aligned:
+#                entries       count x (folded key, key, value) as (offset, length)
+#                              pairs into the blob, in dictionary order
+#                folded slots  open-addressing hash table of folded keys
+#                key slots     open-addressing hash table of original keys
+#                blob          UTF-8 strings, each distinct string stored once
+#
+# Hash slots hold an entry index + 1 (0 is an empty slot) and are probed
+# linearly from crc32(UTF-8 string), so a lookup reads a handful of integers
+# and one string straight from the mapped file.
+#
+# Content hashes only depend on the entries, so two snapshots built from the
+# same data have the same hashes whatever the format details.
+MAGIC = b'GDICT\x00\x00\x00'
+FORMAT_VERSION = 2
+
+_HEADER = struct.Struct('<8sII')
+_ENTRY_FIELDS = 6
+_FOLDED, _KEY, _VALUE = 0, 2, 4
+
+
+def _slot_count(entry_count):
+    """Smallest power of two at least twice the number of entries"""
+    slots = 8
+    while slots < 2 * entry_count:
+        slots *= 2
+    return slots
+
+
+def _align(size):
+    return (size + 3) & ~3
+
+
+def content_hash(dictionary):
+    """
+    Hash the entries of a dictionary, in order.
+
+    Args:
+        dictionary (dict): {source text: translation}
+
+    Returns:
+        str: Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    for key, value in dictionary.items():
+        digest.update(json.dumps([key, value], ensure_ascii=False).encode('utf-8'))
+        digest.update(b'\n')
+    return digest.hexdigest()
+
+
+def snapshot_hash(pair_hashes):
+    """
+    Hash a whole set of dictionaries from the content hashes of its pairs.
+
+    Args:
+        pair_hashes (dict): Language pair -> content hash
+
+    Returns:
+        str: Hex SHA-256 digest
+    """
+    return hashlib.sha256(json.dumps(pair_hashes, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def _build_section(dictionary):
+    blob = bytearray()
+    string_offsets = {}
+
+    def store(text):
+        location = string_offsets.get(text)
+        if location is None:
+            encoded = text.encode('utf-8')
+            location = string_offsets[text] = (len(blob), len(encoded))
+            blob.extend(encoded)
+        return location
+
+    entries = []
+    for key, value in dictionary.items():
+        entries.extend(store(fold_key(key)))
+        entries.extend(store(key))
+        entries.extend(store(value))
+
+    entry_count = len(dictionary)
+    slot_count = _slot_count(entry_count)
+    folded_slots = [0] * slot_count
+    key_slots = [0] * slot_count
+    folded_seen = set()
+
+    for index, key in enumerate(dictionary):
+        folded = fold_key(key)
+        tables = [(key_slots, key)]
+        # The first key with a given folded form wins, like PairIndex.folded_keys
+        if folded not in folded_seen:
+            folded_seen.add(folded)
+            tables.append((folded_slots, folded))
+
+        for slots, text in tables:
+            slot = zlib.crc32(text.encode('utf-8')) & (slot_count - 1)
+            while slots[slot]:
+                slot = (slot + 1) & (slot_count - 1)
+            slots[slot] = index + 1
+
+    tables = struct.pack(f'={len(entries)}I', *entries) + struct.pack(f'={2 * slot_count}I', *folded_slots, *key_slots)
+    return tables, bytes(blob), entry_count, slot_count
+
+
+def write_compiled_dictionaries(dictionaries, output_file_path):
+    """
+    Compile dictionaries into a versioned snapshot file that
+    CompiledDictionaryFile maps into memory.
+
+    Args:
+        dictionaries (dict): Language pair -> {source text: translation}
+        output_file_path (str): Path of the compiled file
+    """
+    sections = {dict_key: _build_section(dictionary) for dict_key, dictionary in dictionaries.items()}
+    pair_hashes = {dict_key: content_hash(dictionary) for dict_key, dictionary in dictionaries.items()}
+
+    # The directory holds the section offsets, which depend on its own size;
+    # sizing it with placeholder offsets of the final width settles it
+    def directory_bytes(offsets):
+        pairs = {}
+        for dict_key, (tables, blob, entry_count, slot_count) in sections.items():
+            pairs[dict_key] = {
+                'contentHash': pair_hashes[dict_key],
+                'offset': offsets[dict_key],
+                'count': entry_count,
+                'slots': slot_count,
+                'blobLength': len(blob)
+            }
+        directory = {'byteOrder': sys.byteorder, 'contentHash': snapshot_hash(pair_hashes), 'pairs': pairs}
+        return json.dumps(directory, ensure_ascii=False).encode('utf-8')
+
+    placeholder = directory_bytes({dict_key: 0xFFFFFFFF for dict_key in sections})
+    position = _align(_HEADER.size + len(placeholder))
+    offsets = {}
+    for dict_key, (tables, blob, _, _) in sections.items():
+        offsets[dict_key] = position
+        position = _align(position + len(tables) + len(blob))
+
+    directory = directory_bytes(offsets).ljust(len(placeholder))
+
+    # Written next to the target and renamed over it, so that processes
+    # mapping the previous file keep reading it intact and a reload never
+    # sees a partial file
+    temporary_path = f"{output_file_path}.{os.getpid()}.tmp"
+    with open(temporary_path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(directory)))
+        f.write(directory)
+        for dict_key, (tables, blob, _, _) in sections.items():
+            f.write(b'\x00' * (offsets[dict_key] - f.tell()))
+            f.write(tables)
+            f.write(blob)
+    os.replace(temporary_path, output_file_path)
+
+
+class CompiledDictionaryFile:
+    """
+    Read-only memory map of a file written by write_compiled_dictionaries.
+
+    Opening the file only reads its header and directory; the pages of a
+    pair are loaded by the OS when they are first read, and are shared by
+    every process mapping the same file.
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, directory_length = _HEADER.unpack_from(self._buffer)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a compiled dictionary file")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"{path} has format version {version}, expected {FORMAT_VERSION}; recompile it")
+
+        directory = json.loads(self._buffer[_HEADER.size:_HEADER.size + directory_length])
+        if directory['byteOrder'] != sys.byteorder:
+            raise ValueError(f"{path} was compiled on a {directory['byteOrder']}-endian machine")
+        self.pairs = directory['pairs']
+        self.content_hash = directory['contentHash']
+
+    def pair_hash(self, dict_key):
+        """Return the content hash of a language pair"""
+        return self.pairs[dict_key]['contentHash']
+
+    def open_pair(self, dict_key):
+        """Return the CompiledDictionary of a language pair"""
+        pair = self.pairs[dict_key]
+        return CompiledDictionary(memoryview(self._buffer), pair['offset'], pair['count'], pair['slots'],
+                                  pair['blobLength'])
+
+
+class CompiledDictionary(MutableMapping):
+    """
+    Dictionary of one language pair read straight from a mapped file.
+
+    Lookups by original or folded key are O(1) hash probes that decode a
+    single string; nothing is copied into Python objects up front. Entries
+    added at runtime (contributions) go to an in-memory overlay, as the
+    mapped file is read-only.
+    """
+
+    def __init__(self, buffer, offset, count, slots, blob_length):
+        entries_end = offset + 4 * _ENTRY_FIELDS * count
+        slots_end = entries_end + 4 * slots
+        blob_start = slots_end + 4 * slots
+
+        self._count = count
+        self._mask = slots - 1
+        self._entries = buffer[offset:entries_end].cast('I')
+        self._folded_slots = buffer[entries_end:slots_end].cast('I')
+        self._key_slots = buffer[slots_end:blob_start].cast('I')
+        self._blob = buffer[blob_start:blob_start + blob_length]
+
+        self._overlay = {}
+        # Keys of the overlay that are not in the file, in insertion order
+        self._added = []
+        self.folded_keys = CompiledFoldedKeys(self)
+
+    def _string(self, index, field):
+        start = self._entries[index * _ENTRY_FIELDS + field]
+        length = self._entries[index * _ENTRY_FIELDS + field + 1]
+        return str(self._blob[start:start + length], 'utf-8')
+
+    def _find(self, slots, field, text):
+        """Return the index of the entry whose `field` equals the text, or None"""
+        encoded = text.encode('utf-8')
+        slot = zlib.crc32(encoded) & self._mask
+        while slots[slot]:
+            index = slots[slot] - 1
+            start = self._entries[index * _ENTRY_FIELDS + field]
+            length = self._entries[index * _ENTRY_FIELDS + field + 1]
+            if length == len(encoded) and self._blob[start:start + length] == encoded:
+                return index
+            slot = (slot + 1) & self._mask
+        return None
+
+    def find_folded(self, folded):
+        """Return the original key of a folded key stored in the file, or None"""
+        index = self._find(self._folded_slots, _FOLDED, folded)
+        return None if index is None else self._string(index, _KEY)
+
+    def compiled_items(self):
+        """Yield the (folded key, key) of every entry stored in the file"""
+        for index in range(self._count):
+            yield self._string(index, _FOLDED), self._string(index, _KEY)
+
+    def __getitem__(self, key):
+        if key in self._overlay:
+            return self._overlay[key]
+        index = self._find(self._key_slots, _KEY, key)
+        if index is None:
+            raise KeyError(key)
+        return self._string(index, _VALUE)
+
+    def __setitem__(self, key, value):
+        if key not in self._overlay and self._find(self._key_slots, _KEY, key) is None:
+            self._added.append(key)
+        self._overlay[key] = value
+
+    def __delitem__(self, key):
+        raise TypeError("Compiled dictionaries do not support deleting entries")
+
+    def __contains__(self, key):
+        return key in self._overlay or self._find(self._key_slots, _KEY, key) is not None
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield self._string(index, _KEY)
+        yield from self._added
+
+    def __len__(self):
+        return self._count + len(self._added)
+
+
+class CompiledFoldedKeys(Mapping):
+    """
+    Folded key -> original key view of a CompiledDictionary, usable in place
+    of PairIndex.folded_keys.
+    """
+
+    def __init__(self, dictionary):
+        self._dictionary = dictionary
+        self._overlay = {}
+
+    def __getitem__(self, folded):
+        if folded in self._overlay:
+            return self._overlay[folded]
+        key = self._dictionary.find_folded(folded)
+        if key is None:
+            raise KeyError(folded)
+        return key
+
+    def __setitem__(self, folded, key):
+        self._overlay[folded] = key
+
+    def setdefault(self, folded, key):
+        if folded not in self:
+            self._overlay[folded] = key
+        return self[folded]
+
+    def _as_dict(self):
+        folded_keys = {}
+        for folded, key in self._dictionary.compiled_items():
+            folded_keys.setdefault(folded, key)
+        folded_keys.update(self._overlay)
+        return folded_keys
+
+    def __iter__(self):
+        return iter(self._as_dict())
+
+    def __len__(self):
+        return len(self._as_dict())
+
+    def items(self):
+        return self._as_dict().items()
+
+
+if __name__ == '__main__':
+    # Compile the generated Python dictionaries, e.g.
+    # `python compiled_dictionary.py translation_dictionaries.gdict`
+    from translation_dictionaries import TEMPORARY_DICTIONARIES
+
+    output_file_path = sys.argv[1] if len(sys.argv) > 1 else 'translation_dictionaries.gdict'
+    write_compiled_dictionaries(TEMPORARY_DICTIONARIES, output_file_path)
+    print(f"Dictionaries successfully compiled to {output_file_path}")
@@ -1,5 +1,7 @@
 import pandas as pd
 import json
+from compiled_dictionary import write_compiled_dictionaries
+from text_normalization import clean_text
 
 def extract_translation_dictionaries(excel_file_path):
     """
@@ -38,8 +40,8 @@ def extract_translation_dictionaries(excel_file_path):
             if pd.isna(eng_term) or pd.isna(ghomala_term):
                 continue
                 
-            eng_term = str(eng_term).strip()
-            ghomala_term = str(ghomala_term).strip()
+            eng_term = clean_text(str(eng_term))
+            ghomala_term = clean_text(str(ghomala_term))
             
             if eng_term and ghomala_term:
                 eng_ghomala[eng_term] = ghomala_term
@@ -56,14 +58,34 @@ def extract_translation_dictionaries(excel_file_path):
             if pd.isna(fr_term) or pd.isna(ghomala_term):
                 continue
                 
-            fr_term = str(fr_term).strip()
-            ghomala_term = str(ghomala_term).strip()
+            fr_term = clean_text(str(fr_term))
+            ghomala_term = clean_text(str(ghomala_term))
             
             if fr_term and ghomala_term:
                 fr_ghomala[fr_term] = ghomala_term
                 
         dictionaries['french-ghomala'] = fr_ghomala
-        
+
+        # Create English-French dictionary from the terms on the same row, so
+        # that these two languages do not need Ghomala as a pivot (one Ghomala
+        # word often translates many English and French ones)
+        eng_fr = {}
+        for _, row in df.iloc[1:].iterrows():
+            eng_term = row.iloc[0]
+            fr_term = row.iloc[1]
+
+            # Skip rows with missing data
+            if pd.isna(eng_term) or pd.isna(fr_term):
+                continue
+
+            eng_term = clean_text(str(eng_term))
+            fr_term = clean_text(str(fr_term))
+
+            if eng_term and fr_term:
+                eng_fr[eng_term] = fr_term
+
+        dictionaries['english-french'] = eng_fr
+
         return dictionaries
         
     except Exception as e:
@@ -87,7 +109,10 @@ def save_dictionaries_to_py(dictionaries, output_file_path):
                 
                 for j, (source, target) in enumerate(translations.items()):
                     comma = "," if j < len(translations) - 1 else ""
-                    f.write(f'        "{source}": "{target}"{comma}\n')
+                    # JSON string literals are valid Python literals, with quotes and backslashes escaped
+                    source_literal = json.dumps(source, ensure_ascii=False)
+                    target_literal = json.dumps(target, ensure_ascii=False)
+                    f.write(f'        {source_literal}: {target_literal}{comma}\n')
                 
                 comma = "," if i < len(dictionaries) - 1 else ""
                 f.write(f"    }}{comma}\n")
@@ -103,6 +128,7 @@ def main():
     # File paths
     excel_file_path = "./Ghomala-datasets/EN_FR_Ghomala_DICTIONARY.xlsx"  # Replace with your Excel file path
     output_file_path = "translation_dictionaries.py"
+    compiled_file_path = "translation_dictionaries.gdict"
     
     # Extract dictionaries from Excel
     dictionaries = extract_translation_dictionaries(excel_file_path)
@@ -111,6 +137,10 @@ def main():
         # Save dictionaries to Python file
         save_dictionaries_to_py(dictionaries, output_file_path)
         
+        # Versioned snapshot loaded by the server instead of the Python module
+        write_compiled_dictionaries(dictionaries, compiled_file_path)
+        print(f"Dictionaries snapshot successfully saved to {compiled_file_path}")
+        
         # Display dictionaries in console
         print("\nExtracted Dictionaries:")
         print(json.dumps(dictionaries, indent=4, ensure_ascii=False))
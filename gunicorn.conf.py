@@ -0,0 +1,36 @@
+import gc
+import multiprocessing
+import os
+
+# Run with `gunicorn app:app` from the repository root; this file is picked up
+# automatically
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:5000')
+workers = int(os.environ.get('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+
+# Import the app, hence build every dictionary and index, once in the master:
+# workers are forked afterwards and share those pages copy-on-write instead of
+# each building their own copy
+preload_app = True
+
+
+def when_ready(server):
+    """Load every language pair and freeze the objects built so far before the first worker is forked"""
+    from translation_service import preload_dictionaries
+
+    # Pairs and indexes are otherwise built lazily, i.e. separately in every worker
+    pair_count = preload_dictionaries()
+    server.log.info("Preloaded %d language pairs", pair_count)
+
+    # Objects in the permanent generation are never visited by the collector,
+    # which would otherwise write to their headers in every worker and turn
+    # the shared pages into private copies
+    gc.collect()
+    gc.freeze()
+    server.log.info("Froze %d objects before forking workers", gc.get_freeze_count())
+
+
+def post_fork(server, worker):
+    """Watch the dictionary source file from every worker (threads do not survive the fork)"""
+    from translation_service import start_dictionary_watcher
+
+    start_dictionary_watcher()
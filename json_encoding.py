@@ -0,0 +1,41 @@
+import json
+import os
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# JSON encoder of the responses: 'orjson' (default when installed) or 'json'.
+# Both sort keys and write compact JSON; orjson writes non-ASCII characters
+# as UTF-8 rather than \u escapes
+JSON_ENCODERS = ('orjson', 'json')
+JSON_ENCODER = os.environ.get('JSON_ENCODER', 'orjson' if orjson is not None else 'json')
+
+if JSON_ENCODER not in JSON_ENCODERS:
+    raise ValueError(f"Unknown JSON encoder '{JSON_ENCODER}'. Must be one of: {', '.join(JSON_ENCODERS)}")
+if JSON_ENCODER == 'orjson' and orjson is None:
+    raise ValueError("JSON_ENCODER is 'orjson' but orjson is not installed")
+
+
+def encode_json(payload, default=None):
+    """
+    Serialize a response payload with JSON_ENCODER.
+
+    Args:
+        payload: JSON-serializable object
+        default (callable): Converts objects the encoder does not support
+
+    Returns:
+        bytes: UTF-8 JSON
+    """
+    if JSON_ENCODER == 'orjson':
+        return orjson.dumps(payload, default=default, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, ensure_ascii=True, sort_keys=True, separators=(',', ':'), default=default).encode('utf-8')
+
+
+def decode_json(data):
+    """Parse a JSON document (str or UTF-8 bytes) with JSON_ENCODER's library"""
+    if JSON_ENCODER == 'orjson':
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,161 @@
+from text_normalization import fold_key
+
+
+class _TrieNode:
+    __slots__ = ('children', 'keys')
+
+    def __init__(self):
+        self.children = {}
+        # Original keys ending at this node (several keys can share a folded form)
+        self.keys = []
+
+
+class KeyTrie:
+    """
+    Character trie over the folded keys of a dictionary.
+
+    It serves the queries that would otherwise need a scan of every key:
+    edit-distance search (a Levenshtein automaton simulated one trie level at
+    a time), `?`/`*` wildcard patterns and prefix enumeration. Branches that
+    cannot match are never visited.
+    """
+
+    def __init__(self, keys=()):
+        self._root = _TrieNode()
+        self._size = 0
+
+        for key in keys:
+            self.add(key)
+
+    def __len__(self):
+        return self._size
+
+    def add(self, key):
+        """Insert a key (no-op if it is already present)"""
+        node = self._root
+        for char in fold_key(key):
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = _TrieNode()
+            node = child
+
+        if key not in node.keys:
+            node.keys.append(key)
+            self._size += 1
+
+    def search_within(self, query, max_distance):
+        """
+        Return every key within `max_distance` edits of the query.
+
+        Each trie edge extends the previous row of the Levenshtein matrix by
+        one character; a branch is abandoned as soon as every cell of its row
+        exceeds `max_distance`, since no key below it can come back in range.
+
+        Args:
+            query (str): Text to look up
+            max_distance (int): Maximum Levenshtein distance
+
+        Returns:
+            list: (key, distance) tuples sorted by increasing distance
+        """
+        query = fold_key(query)
+        first_row = list(range(len(query) + 1))
+        matches = []
+
+        if first_row[-1] <= max_distance:
+            matches.extend((key, first_row[-1]) for key in self._root.keys)
+
+        stack = [(child, char, first_row) for char, child in self._root.children.items()]
+        while stack:
+            node, char, previous_row = stack.pop()
+
+            row = [previous_row[0] + 1]
+            for column in range(1, len(query) + 1):
+                row.append(min(
+                    row[column - 1] + 1,
+                    previous_row[column] + 1,
+                    previous_row[column - 1] + (query[column - 1] != char)
+                ))
+
+            if row[-1] <= max_distance:
+                matches.extend((key, row[-1]) for key in node.keys)
+
+            if min(row) <= max_distance:
+                stack.extend((child, child_char, row) for child_char, child in node.children.items())
+
+        matches.sort(key=lambda match: match[1])
+        return matches
+
+    def match_wildcard(self, pattern, limit=None):
+        """
+        Return the keys matching a wildcard pattern.
+
+        `?` matches exactly one character and `*` any run of characters,
+        e.g. "s*k" matches "sôk" and "sàk".
+
+        Args:
+            pattern (str): Wildcard pattern
+            limit (int): Maximum number of keys to return (all if None)
+
+        Returns:
+            list: Matching keys
+        """
+        pattern = fold_key(pattern)
+        matches = []
+        # (node, position in pattern) states already explored; without them
+        # patterns with several stars would revisit the same subtrees
+        visited = set()
+        stack = [(self._root, 0)]
+
+        while stack:
+            node, position = stack.pop()
+            if (id(node), position) in visited:
+                continue
+            visited.add((id(node), position))
+
+            if position == len(pattern):
+                matches.extend(node.keys)
+                if limit is not None and len(matches) >= limit:
+                    return matches[:limit]
+                continue
+
+            symbol = pattern[position]
+            if symbol == '*':
+                stack.append((node, position + 1))
+                stack.extend((child, position) for child in node.children.values())
+            elif symbol == '?':
+                stack.extend((child, position + 1) for child in node.children.values())
+            else:
+                child = node.children.get(symbol)
+                if child is not None:
+                    stack.append((child, position + 1))
+
+        return matches
+
+    def with_prefix(self, prefix, limit=None):
+        """
+        Return the keys starting with a prefix.
+
+        Args:
+            prefix (str): Prefix to complete
+            limit (int): Maximum number of keys to return (all if None)
+
+        Returns:
+            list: Matching keys
+        """
+        node = self._root
+        for char in fold_key(prefix):
+            node = node.children.get(char)
+            if node is None:
+                return []
+
+        matches = []
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            matches.extend(node.keys)
+            if limit is not None and len(matches) >= limit:
+                return matches[:limit]
+            stack.extend(node.children.values())
+
+        return matches
@@ -0,0 +1,211 @@
+import hashlib
+import math
+import threading
+import time
+from collections import OrderedDict, defaultdict
+
+
+class LookupCache:
+    """
+    Bounded LRU cache of lookup results with a time-to-live.
+
+    Keys are tuples whose first element is the language pair, so that every
+    entry of a pair can be dropped at once when its dictionary changes.
+    Hit, miss, eviction, expiration and invalidation counters are kept to
+    help size the cache.
+    """
+
+    def __init__(self, max_size=10000, ttl=3600, clock=time.monotonic):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._keys_by_pair = defaultdict(set)
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Return the cached value for the key, or None if absent or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """Store a value, evicting the least recently used entries beyond max_size"""
+        if self.max_size <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            self._keys_by_pair[key[0]].add(key)
+
+            while len(self._entries) > self.max_size:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.evictions += 1
+
+    def invalidate_pair(self, dict_key):
+        """Drop every entry of a language pair"""
+        with self._lock:
+            for key in self._keys_by_pair.pop(dict_key, set()):
+                del self._entries[key]
+                self.invalidations += 1
+
+    def clear(self):
+        """Drop every entry"""
+        with self._lock:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+            self._keys_by_pair.clear()
+
+    def stats(self):
+        """Return the cache counters"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'maxSize': self.max_size,
+                'ttlSeconds': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hitRate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'invalidations': self.invalidations
+            }
+
+    def _remove(self, key):
+        del self._entries[key]
+        pair_keys = self._keys_by_pair.get(key[0])
+        if pair_keys is not None:
+            pair_keys.discard(key)
+            if not pair_keys:
+                del self._keys_by_pair[key[0]]
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings.
+
+    Membership tests can return false positives (at roughly
+    `false_positive_rate` once `capacity` items were added) but never false
+    negatives.
+    """
+
+    def __init__(self, size_bytes, false_positive_rate=0.01):
+        self.size_bytes = max(int(size_bytes), 1)
+        self.num_bits = self.size_bytes * 8
+        self.false_positive_rate = false_positive_rate
+        # Number of items the filter holds before exceeding false_positive_rate
+        self.capacity = max(int(-self.num_bits * math.log(2) ** 2 / math.log(false_positive_rate)), 1)
+        self.num_hashes = max(int(round(self.num_bits / self.capacity * math.log(2))), 1)
+        self._bits = bytearray(self.size_bytes)
+        self.count = 0
+
+    def _positions(self, item):
+        # Double hashing: derive every bit position from two 64-bit hashes
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        return [(first + i * second) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, item):
+        """Add an item to the filter"""
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item):
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def clear(self):
+        """Remove every item"""
+        self._bits = bytearray(self.size_bytes)
+        self.count = 0
+
+
+class NegativeLookupCache:
+    """
+    Remembers lookups that found no match, in a Bloom filter of bounded size.
+
+    Every entry is tagged with a per-pair generation: resetting a pair bumps
+    its generation, so the pair's earlier misses are no longer found. The
+    whole filter is cleared once it holds more items than its capacity, which
+    keeps the false positive rate bounded.
+    """
+
+    def __init__(self, max_bytes=1024 * 1024, false_positive_rate=0.01):
+        self.max_bytes = max_bytes
+        self._filter = BloomFilter(max_bytes, false_positive_rate) if max_bytes > 0 else None
+        self._generations = defaultdict(int)
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.resets = 0
+
+    def _item(self, key):
+        return '\x1f'.join((str(self._generations[key[0]]),) + tuple(str(part) for part in key))
+
+    def contains(self, key):
+        """Return True if the key (a tuple starting with the language pair) is a known miss"""
+        if self._filter is None:
+            return False
+
+        with self._lock:
+            found = self._item(key) in self._filter
+            if found:
+                self.hits += 1
+            else:
+                self.misses += 1
+            return found
+
+    def add(self, key):
+        """Record a lookup that found no match"""
+        if self._filter is None:
+            return
+
+        with self._lock:
+            if self._filter.count >= self._filter.capacity:
+                self._filter.clear()
+                self.resets += 1
+            self._filter.add(self._item(key))
+
+    def reset_pair(self, dict_key):
+        """Forget the misses of a language pair (its dictionary changed)"""
+        with self._lock:
+            self._generations[dict_key] += 1
+
+    def stats(self):
+        """Return the filter counters"""
+        with self._lock:
+            return {
+                'maxBytes': self.max_bytes,
+                'items': self._filter.count if self._filter else 0,
+                'capacity': self._filter.capacity if self._filter else 0,
+                'hits': self.hits,
+                'misses': self.misses,
+                'resets': self.resets
+            }
@@ -0,0 +1,166 @@
+import threading
+import time
+from collections.abc import Mapping
+
+
+class PairRegistry(Mapping):
+    """
+    Language pair -> PairIndex mapping that builds each pair on first use.
+
+    Every pair is registered with a loader; the first lookup of a pair runs
+    it while concurrent lookups of the same pair wait for that single build
+    instead of starting their own (single-flight). Pairs unused for
+    `idle_seconds` are unloaded and rebuilt by their loader when needed
+    again. Membership and iteration only look at registered pairs and never
+    trigger a load.
+    """
+
+    def __init__(self, idle_seconds=0, clock=time.monotonic):
+        """
+        Args:
+            idle_seconds (float): Idle time after which a pair is unloaded
+                (0 never unloads)
+            clock (callable): Returns the current time in seconds
+        """
+        self.idle_seconds = idle_seconds
+        self._clock = clock
+        self._loaders = {}
+        # Language pair -> [PairIndex, last use time]
+        self._loaded = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+        self._last_sweep = clock()
+
+        self._loads = {}
+        self._load_seconds = {}
+        self._total_load_seconds = 0.0
+        self._unloads = 0
+        self._load_failures = 0
+
+    def register(self, dict_key, loader):
+        """
+        Register a language pair.
+
+        Args:
+            dict_key (str): Language pair, e.g. 'english-ghomala'
+            loader (callable): Builds and returns the pair's PairIndex
+        """
+        with self._lock:
+            self._loaders[dict_key] = loader
+            self._locks.setdefault(dict_key, threading.Lock())
+            self._loads.setdefault(dict_key, 0)
+
+    def adopt(self, dict_key, pair_index):
+        """
+        Mark a registered pair as loaded with an already built PairIndex,
+        e.g. one taken over from a previous generation of dictionaries.
+        """
+        with self._locks[dict_key]:
+            self._loaded[dict_key] = [pair_index, self._clock()]
+
+    def __getitem__(self, dict_key):
+        now = self._clock()
+        if self.idle_seconds and now - self._last_sweep >= self.idle_seconds / 2:
+            self._last_sweep = now
+            self.unload_idle()
+
+        entry = self._loaded.get(dict_key)
+        if entry is not None:
+            entry[1] = now
+            return entry[0]
+
+        if dict_key not in self._loaders:
+            raise KeyError(dict_key)
+
+        with self._locks[dict_key]:
+            # Another request may have finished loading while this one waited
+            entry = self._loaded.get(dict_key)
+            if entry is not None:
+                entry[1] = now
+                return entry[0]
+
+            start = time.perf_counter()
+            try:
+                pair_index = self._loaders[dict_key]()
+            except Exception:
+                self._load_failures += 1
+                raise
+            self._load_seconds[dict_key] = time.perf_counter() - start
+            self._total_load_seconds += self._load_seconds[dict_key]
+            self._loads[dict_key] += 1
+            self._loaded[dict_key] = [pair_index, self._clock()]
+            return pair_index
+
+    def __contains__(self, dict_key):
+        return dict_key in self._loaders
+
+    def __iter__(self):
+        return iter(list(self._loaders))
+
+    def __len__(self):
+        return len(self._loaders)
+
+    def is_loaded(self, dict_key):
+        """Return True if the pair is currently loaded"""
+        return dict_key in self._loaded
+
+    def loaded_items(self):
+        """Return the (language pair, PairIndex) of every loaded pair, without loading the others"""
+        return [(dict_key, entry[0]) for dict_key, entry in list(self._loaded.items())]
+
+    def load_all(self):
+        """Load every registered pair, e.g. before a preloading server forks its workers"""
+        for dict_key in self:
+            self[dict_key]
+
+    def unload(self, dict_key):
+        """
+        Drop a loaded pair; its loader rebuilds it on next use. Requests
+        already holding the PairIndex keep using it.
+
+        Returns:
+            bool: True if the pair was loaded
+        """
+        with self._locks[dict_key]:
+            if self._loaded.pop(dict_key, None) is None:
+                return False
+            self._unloads += 1
+            return True
+
+    def unload_idle(self):
+        """
+        Unload the pairs unused for more than idle_seconds.
+
+        Returns:
+            list: Language pairs unloaded
+        """
+        now = self._clock()
+        idle = [
+            dict_key for dict_key, (_, last_used) in list(self._loaded.items())
+            if now - last_used > self.idle_seconds
+        ]
+        return [dict_key for dict_key in idle if self.unload(dict_key)]
+
+    def stats(self):
+        """Return load and unload counters, overall and per pair"""
+        now = self._clock()
+        pairs = {}
+        for dict_key in self:
+            entry = self._loaded.get(dict_key)
+            pairs[dict_key] = {
+                'loaded': entry is not None,
+                'loads': self._loads[dict_key],
+                'lastLoadSeconds': round(self._load_seconds.get(dict_key, 0.0), 4),
+                'idleSeconds': round(now - entry[1], 1) if entry is not None else None
+            }
+
+        return {
+            'registered': len(self._loaders),
+            'loaded': len(self._loaded),
+            'loads': sum(self._loads.values()),
+            'unloads': self._unloads,
+            'loadFailures': self._load_failures,
+            'loadSeconds': round(self._total_load_seconds, 4),
+            'idleSeconds': self.idle_seconds,
+            'pairs': pairs
+        }
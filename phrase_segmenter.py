@@ -0,0 +1,103 @@
+import re
+from text_normalization import fold_key
+
+# Tokens are separated by whitespace and punctuation; apostrophes and hyphens
+# stay inside tokens ("pua'", "porte-monnaie")
+_TOKEN = re.compile(r"[^\s.,;:!?()\[\]{}\"«»…]+")
+
+
+def tokenize(text):
+    """
+    Split folded text into tokens.
+
+    Args:
+        text (str): Text to split
+
+    Returns:
+        list: Folded tokens
+    """
+    return _TOKEN.findall(fold_key(text))
+
+
+class _PhraseNode:
+    __slots__ = ('children', 'key')
+
+    def __init__(self):
+        self.children = {}
+        # Original dictionary key ending at this node, if any
+        self.key = None
+
+
+class PhraseTrie:
+    """
+    Token-level trie over dictionary keys.
+
+    It finds the longest key starting at a given token of a sentence, e.g.
+    "tell a lot of stories" or "here and there", in time bounded by the
+    length of the longest key rather than by the size of the dictionary.
+    """
+
+    def __init__(self, keys=()):
+        self._root = _PhraseNode()
+
+        for key in keys:
+            self.add(key)
+
+    def add(self, key):
+        """Insert a key (the first key with a given token sequence wins)"""
+        node = self._root
+        for token in tokenize(key):
+            child = node.children.get(token)
+            if child is None:
+                child = node.children[token] = _PhraseNode()
+            node = child
+
+        if node is not self._root and node.key is None:
+            node.key = key
+
+    def longest_match(self, tokens, start):
+        """
+        Find the longest key made of the tokens starting at `start`.
+
+        Args:
+            tokens (list): Folded tokens of the sentence
+            start (int): Index of the first token
+
+        Returns:
+            tuple: (end, key) where tokens[start:end] spell the key, or None
+        """
+        node = self._root
+        best = None
+        for end in range(start, len(tokens)):
+            node = node.children.get(tokens[end])
+            if node is None:
+                break
+            if node.key is not None:
+                best = (end + 1, node.key)
+        return best
+
+
+def segment(tokens, phrase_trie):
+    """
+    Greedily split tokens into the longest dictionary phrases.
+
+    Args:
+        tokens (list): Folded tokens of the sentence
+        phrase_trie (PhraseTrie): Phrases of the language pair
+
+    Returns:
+        list: (start, end, key) tuples covering every token in order, key
+        being None for single tokens that start no dictionary phrase
+    """
+    segments = []
+    start = 0
+    while start < len(tokens):
+        match = phrase_trie.longest_match(tokens, start)
+        if match is None:
+            segments.append((start, start + 1, None))
+            start += 1
+        else:
+            end, key = match
+            segments.append((start, end, key))
+            start = end
+    return segments
@@ -0,0 +1,129 @@
+from collections import defaultdict, deque
+from text_normalization import fold_key
+
+# Longest chain of dictionaries a pivot translation may go through
+MAX_PIVOT_HOPS = 3
+
+
+class LanguageGraph:
+    """
+    Directed graph of languages, with an edge for every language pair that
+    has a dictionary.
+
+    It finds pivot routes for pairs without a dictionary of their own, e.g.
+    english -> ghomala -> french.
+    """
+
+    def __init__(self, pair_keys):
+        self._edges = defaultdict(set)
+        for dict_key in pair_keys:
+            source_lang, target_lang = dict_key.split('-', 1)
+            self._edges[source_lang].add(target_lang)
+
+    def find_route(self, source_lang, target_lang, max_hops=MAX_PIVOT_HOPS):
+        """
+        Find the shortest chain of dictionaries between two languages.
+
+        Args:
+            source_lang (str): Language to translate from
+            target_lang (str): Language to translate to
+            max_hops (int): Maximum number of dictionaries in the chain
+
+        Returns:
+            list: Languages of the route, from source_lang to target_lang
+            included, or None if there is no route
+        """
+        if source_lang == target_lang:
+            return None
+
+        previous = {source_lang: None}
+        queue = deque([(source_lang, 0)])
+        while queue:
+            language, hops = queue.popleft()
+            if language == target_lang:
+                route = []
+                while language is not None:
+                    route.append(language)
+                    language = previous[language]
+                return route[::-1]
+
+            if hops == max_hops:
+                continue
+
+            for next_language in sorted(self._edges[language]):
+                if next_language not in previous:
+                    previous[next_language] = language
+                    queue.append((next_language, hops + 1))
+
+        return None
+
+    def routes(self):
+        """
+        Return every translatable pair with its route.
+
+        Returns:
+            dict: 'source-target' -> list of languages of the route
+        """
+        languages = sorted(set(self._edges) | {target for targets in self._edges.values() for target in targets})
+        routes = {}
+        for source_lang in languages:
+            for target_lang in languages:
+                route = self.find_route(source_lang, target_lang)
+                if route is not None:
+                    routes[f"{source_lang}-{target_lang}"] = route
+        return routes
+
+
+def route_pair_keys(route):
+    """Return the dictionary keys along a route, e.g. ['english-ghomala', 'ghomala-french']"""
+    return [f"{source_lang}-{target_lang}" for source_lang, target_lang in zip(route, route[1:])]
+
+
+def translate_senses(pair_index, senses):
+    """
+    Translate intermediate senses exactly through one dictionary of a route.
+
+    Args:
+        pair_index (PairIndex): Dictionary of the hop
+        senses (list): Texts in the hop's source language
+
+    Returns:
+        list: Distinct translations, in order
+    """
+    translations = []
+    for sense in senses:
+        key = pair_index.folded_keys.get(fold_key(sense))
+        if key is None:
+            continue
+        for translation in pair_index.senses(key):
+            if translation not in translations:
+                translations.append(translation)
+    return translations
+
+
+def compose_route(pair_indexes):
+    """
+    Materialize the mapping of a pivot route.
+
+    Every key of the first dictionary is translated through the following
+    ones once, so that looking up the composed pair afterwards costs a single
+    hash probe instead of one lookup per hop.
+
+    Args:
+        pair_indexes (list): PairIndex of every hop of the route, in order
+
+    Returns:
+        dict: Source text -> list of its translations
+    """
+    first = pair_indexes[0]
+    composed = {key: first.senses(key) for key in first.dictionary}
+
+    for pair_index in pair_indexes[1:]:
+        next_composed = {}
+        for key, senses in composed.items():
+            translations = translate_senses(pair_index, senses)
+            if translations:
+                next_composed[key] = translations
+        composed = next_composed
+
+    return composed
@@ -0,0 +1,117 @@
+import heapq
+from bisect import bisect_left, insort
+from collections import Counter
+from phrase_segmenter import tokenize
+from text_normalization import fold_key
+
+# Prefixes matching more keys than this get their best completions
+# precomputed; any other prefix is ranked over at most this many keys
+MAX_SCANNED_KEYS = 256
+TOP_K = 10
+
+# Sorts after every character, so that prefix + _MAX_CHAR bounds the prefix range
+_MAX_CHAR = '\U0010ffff'
+
+
+class PrefixIndex:
+    """
+    Sorted array of folded keys for autocompletion.
+
+    Completions of a prefix are a contiguous range of the array, found with
+    two binary searches. They are ranked by popularity: the number of
+    dictionary phrases that use the key's words, so "go" comes before
+    "goat" because of "go out", "go up"... Prefixes whose range is too large
+    to be ranked per request read their completions from a precomputed
+    top-k table instead, which bounds the work of every lookup.
+    """
+
+    def __init__(self, keys=(), max_scanned_keys=MAX_SCANNED_KEYS, top_k=TOP_K):
+        self.top_k = top_k
+        # Folded key -> original key (the first key with a given folded form wins)
+        self._originals = {}
+        for key in keys:
+            self._originals.setdefault(fold_key(key), key)
+
+        self._token_counts = Counter(
+            token for folded in self._originals for token in set(tokenize(folded))
+        )
+        self._scores = {folded: self._popularity(folded) for folded in self._originals}
+        self._sorted_keys = sorted(self._originals)
+
+        # Prefix -> best folded keys, for prefixes matching more than max_scanned_keys keys
+        self._top = {}
+        positions = {folded: position for position, folded in enumerate(sorted(self._originals, key=self._rank))}
+        sorted_keys = self._sorted_keys
+        # Ranges of the sorted array sharing a prefix of the current length
+        large_ranges = [(0, len(sorted_keys))]
+        length = 1
+        while large_ranges:
+            next_ranges = []
+            for start, end in large_ranges:
+                while start < end:
+                    if len(sorted_keys[start]) < length:
+                        start += 1
+                        continue
+                    prefix = sorted_keys[start][:length]
+                    prefix_end = bisect_left(sorted_keys, prefix + _MAX_CHAR, start, end)
+                    if prefix_end - start > max_scanned_keys:
+                        self._top[prefix] = heapq.nsmallest(
+                            top_k, sorted_keys[start:prefix_end], key=positions.__getitem__
+                        )
+                        next_ranges.append((start, prefix_end))
+                    start = prefix_end
+            large_ranges = next_ranges
+            length += 1
+
+    def __len__(self):
+        return len(self._sorted_keys)
+
+    def _popularity(self, folded):
+        tokens = tokenize(folded)
+        return min((self._token_counts[token] for token in tokens), default=0)
+
+    def _rank(self, folded):
+        return (-self._scores[folded], len(folded), folded)
+
+    def add(self, key):
+        """Insert a key, keeping the array sorted and the top-k table up to date"""
+        folded = fold_key(key)
+        if folded in self._originals:
+            # As when building, the first key with a given folded form wins
+            return
+
+        self._originals[folded] = key
+        self._token_counts.update(set(tokenize(folded)))
+        self._scores[folded] = self._popularity(folded)
+        insort(self._sorted_keys, folded)
+
+        for length in range(1, len(folded) + 1):
+            completions = self._top.get(folded[:length])
+            if completions is not None:
+                completions = sorted(completions + [folded], key=self._rank)
+                self._top[folded[:length]] = completions[:self.top_k]
+
+    def complete(self, prefix, limit=TOP_K):
+        """
+        Find the most popular keys starting with a prefix.
+
+        Args:
+            prefix (str): Beginning of the key, folded before the search
+            limit (int): Maximum number of completions
+
+        Returns:
+            list: Original keys, most popular first
+        """
+        folded = fold_key(prefix)
+        if not folded:
+            return []
+
+        completions = self._top.get(folded)
+        if completions is not None and limit <= self.top_k:
+            completions = completions[:limit]
+        else:
+            start = bisect_left(self._sorted_keys, folded)
+            end = bisect_left(self._sorted_keys, folded + _MAX_CHAR, start)
+            completions = heapq.nsmallest(limit, self._sorted_keys[start:end], key=self._rank)
+
+        return [self._originals[completion] for completion in completions]
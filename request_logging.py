@@ -0,0 +1,186 @@
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+
+# Log output: 'text' (the usual one-line format, with structured fields
+# appended as key=value) or 'json' (one JSON object per line)
+LOG_FORMAT = os.environ.get('LOG_FORMAT', 'text')
+
+# Share of requests logged with their payload, overall (LOG_SAMPLE_RATE) and
+# per route (LOG_SAMPLE_RATES, e.g. '/api/translate=0.01,/api/stats=0');
+# failed requests are always logged
+LOG_SAMPLE_RATE = float(os.environ.get('LOG_SAMPLE_RATE', 0.01))
+LOG_SAMPLE_RATES = {
+    route.strip(): float(rate)
+    for route, _, rate in (
+        item.partition('=') for item in os.environ.get('LOG_SAMPLE_RATES', '').split(',') if item.strip()
+    )
+}
+
+# Requests with a status from CLIENT_ERROR_STATUS on are logged with their
+# payload, client errors as warnings and server errors (from ERROR_STATUS on)
+# as errors. 404 is the answer to a text without translation, i.e. ordinary
+# traffic, and is only logged when sampled
+CLIENT_ERROR_STATUS = 400
+ERROR_STATUS = 500
+SAMPLED_ONLY_STATUSES = frozenset({404})
+
+request_logger = logging.getLogger('requests')
+
+_listener = None
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that leaves formatting to the listener thread.
+
+    The stock handler formats every record in the logging thread so that it
+    can be pickled; records only cross threads here, so their message and
+    arguments are merged by the writer instead of on the request path.
+    """
+
+    def prepare(self, record):
+        return record
+
+
+class StructuredFormatter(logging.Formatter):
+    """
+    Formats records with their structured fields, passed to logging calls as
+    extra={'fields': {...}}, either as JSON or appended to the text line.
+    """
+
+    def __init__(self, output='text'):
+        super().__init__('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        self.output = output
+
+    def format(self, record):
+        fields = getattr(record, 'fields', None) or {}
+        if self.output == 'json':
+            entry = {
+                'time': self.formatTime(record),
+                'level': record.levelname,
+                'logger': record.name,
+                'message': record.getMessage(),
+                **fields
+            }
+            if record.exc_info:
+                entry['exception'] = self.formatException(record.exc_info)
+            return json.dumps(entry, ensure_ascii=False, default=str)
+
+        line = super().format(record)
+        if fields:
+            line += ' ' + ' '.join(f"{name}={json.dumps(value, ensure_ascii=False, default=str)}"
+                                   for name, value in fields.items())
+        return line
+
+
+def configure_logging(level=logging.INFO, stream=None):
+    """
+    Send every log record through a queue to a background thread that
+    formats and writes it, so request threads only enqueue records.
+
+    Calling it again replaces the previous configuration.
+
+    Args:
+        level (int): Level of the root logger
+        stream: Stream written by the background thread (stderr by default)
+
+    Returns:
+        logging.handlers.QueueListener: Running listener
+    """
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+
+    output_handler = logging.StreamHandler(stream)
+    output_handler.setFormatter(StructuredFormatter(LOG_FORMAT))
+
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(DeferredQueueHandler(log_queue))
+    root.setLevel(level)
+
+    _listener = logging.handlers.QueueListener(log_queue, output_handler)
+    _listener.start()
+    return _listener
+
+
+def _restart_listener_in_child():
+    # The listener thread does not survive a fork (gunicorn workers, process
+    # pools): the child starts its own, leaving records queued before the
+    # fork to the parent
+    if _listener is not None:
+        while True:
+            try:
+                _listener.queue.get_nowait()
+            except queue.Empty:
+                break
+        _listener.start()
+
+
+os.register_at_fork(after_in_child=_restart_listener_in_child)
+
+
+@atexit.register
+def _flush_logs():
+    # Write what is still queued before the interpreter exits
+    if _listener is not None:
+        _listener.stop()
+
+
+def sample_rate(route):
+    """Return the share of requests to a route logged with their payload"""
+    return LOG_SAMPLE_RATES.get(route, LOG_SAMPLE_RATE)
+
+
+def should_sample(route):
+    """Decide whether a request to the route is logged with its payload"""
+    rate = sample_rate(route)
+    return rate >= 1 or (rate > 0 and random.random() < rate)
+
+
+def is_failure(status):
+    """Return True if a request answered with the status is logged whether sampled or not"""
+    return status >= CLIENT_ERROR_STATUS and status not in SAMPLED_ONLY_STATUSES
+
+
+def log_request(route, method, status, duration, payload=None, sampled=False):
+    """
+    Log a finished request if it was sampled or failed, with its payload.
+
+    Args:
+        route (str): Route rule, e.g. '/api/translate'
+        method (str): HTTP method
+        status (int): Response status
+        duration (float): Handling time in seconds
+        payload: Parsed request body or parameters
+        sampled (bool): Result of should_sample for the request
+    """
+    failed = is_failure(status)
+    if not (sampled or failed):
+        return
+
+    if status >= ERROR_STATUS:
+        level = logging.ERROR
+    elif failed:
+        level = logging.WARNING
+    else:
+        level = logging.INFO
+
+    request_logger.log(level, "%s %s %d", method, route, status, extra={
+        'fields': {
+            'route': route,
+            'method': method,
+            'status': status,
+            'durationMs': round(duration * 1000, 3),
+            'sampled': sampled,
+            'payload': payload
+        }
+    })
@@ -0,0 +1,80 @@
+from array import array
+from collections.abc import Mapping
+
+
+class ReverseIndex(Mapping):
+    """
+    Read-only one-to-many view of a dictionary, from translations back to
+    their source keys.
+
+    Several source keys often share a translation ("cú" is the Ghomala for
+    gutter, bad and remove), so every translation maps to a sorted array of
+    key ids rather than to a copied dictionary. Lookups are O(1) and return
+    every sense; the strings themselves are shared with the forward
+    dictionary.
+
+    As a Mapping, a translation maps to all of its senses joined with ", ",
+    which lets the usual lookup indexes be built on top of it.
+    """
+
+    def __init__(self, dictionary):
+        self._forward = dictionary
+        # Key id -> source key, in the forward dictionary's order
+        self._source_keys = []
+        self._key_ids = {}
+        # Translation -> array of key ids, sorted since ids only grow
+        self._ids_by_value = {}
+
+        for source_key, value in dictionary.items():
+            self._insert(source_key, value)
+
+    def _insert(self, source_key, value):
+        key_id = len(self._source_keys)
+        self._source_keys.append(source_key)
+        self._key_ids[source_key] = key_id
+
+        key_ids = self._ids_by_value.get(value)
+        if key_ids is None:
+            key_ids = self._ids_by_value[value] = array('I')
+        key_ids.append(key_id)
+
+    def add(self, source_key, value, previous_value=None):
+        """
+        Record a new or changed entry of the forward dictionary.
+
+        Args:
+            source_key (str): Source-side key
+            value (str): Its new translation
+            previous_value (str): Its translation before the change, if it existed
+        """
+        if previous_value is not None:
+            key_ids = self._ids_by_value.get(previous_value)
+            key_id = self._key_ids.get(source_key)
+            if key_ids is not None and key_id is not None and key_id in key_ids:
+                key_ids.remove(key_id)
+                if not key_ids:
+                    del self._ids_by_value[previous_value]
+
+        self._insert(source_key, value)
+
+    def senses(self, value):
+        """Return every source key translated by the value, in dictionary order"""
+        key_ids = self._ids_by_value.get(value)
+        if key_ids is None:
+            return []
+        return [self._source_keys[key_id] for key_id in key_ids]
+
+    def __getitem__(self, value):
+        senses = self.senses(value)
+        if not senses:
+            raise KeyError(value)
+        return ', '.join(senses)
+
+    def __contains__(self, value):
+        return value in self._ids_by_value
+
+    def __iter__(self):
+        return iter(self._ids_by_value)
+
+    def __len__(self):
+        return len(self._ids_by_value)
@@ -0,0 +1,188 @@
+import heapq
+import os
+
+from fuzzywuzzy import process as fuzzywuzzy_process
+from fuzzywuzzy import utils as fuzzywuzzy_utils
+
+try:
+    from rapidfuzz import fuzz as rapidfuzz_fuzz
+    from rapidfuzz import process as rapidfuzz_process
+except ImportError:
+    rapidfuzz_fuzz = None
+    rapidfuzz_process = None
+
+
+def fuzzywuzzy_full_process(text):
+    """Preprocess text exactly like fuzzywuzzy's WRatio does (lowercase, ASCII only)"""
+    return fuzzywuzzy_utils.full_process(text, force_ascii=True)
+
+
+class FuzzywuzzyEngine:
+    """Scores candidates with fuzzywuzzy's default WRatio scorer, one query at a time"""
+
+    name = 'fuzzywuzzy'
+    # extract_batch scores one query at a time, so it gains nothing from
+    # sharing candidates between queries
+    vectorized = False
+
+    def extract_one(self, query, choices, score_cutoff=0):
+        """
+        Return the best scoring choice.
+
+        Args:
+            query (str): Text to look up
+            choices (iterable): Candidate keys
+            score_cutoff (int): Minimum score of the returned choice
+
+        Returns:
+            tuple: (choice, score), or None if no choice reaches score_cutoff
+        """
+        return fuzzywuzzy_process.extractOne(query, choices, score_cutoff=score_cutoff)
+
+    def extract(self, query, choices, limit, score_cutoff=0):
+        """
+        Return the `limit` best scoring choices in a single pass.
+
+        Only a heap of `limit` entries is kept while scoring, so asking for a
+        few alternatives costs about as much as asking for the best match.
+
+        Args:
+            query (str): Text to look up
+            choices (iterable): Candidate keys
+            limit (int): Maximum number of choices to return
+            score_cutoff (int): Minimum score of the returned choices
+
+        Returns:
+            list: (choice, score) tuples, best first; equal scores keep the
+            order of the choices
+        """
+        if limit == 1:
+            best = self.extract_one(query, choices, score_cutoff)
+            return [best] if best is not None else []
+
+        heap = []
+        scored = fuzzywuzzy_process.extractWithoutOrder(query, choices, score_cutoff=score_cutoff)
+        for index, (choice, score) in enumerate(scored):
+            entry = (score, -index, choice)
+            if len(heap) < limit:
+                heapq.heappush(heap, entry)
+            elif entry > heap[0]:
+                heapq.heapreplace(heap, entry)
+
+        return [(choice, score) for score, _, choice in sorted(heap, reverse=True)]
+
+    def extract_batch(self, queries, choices, score_cutoff=0):
+        """
+        Return the best scoring choice of every query.
+
+        Args:
+            queries (list): Texts to look up
+            choices (iterable): Candidate keys shared by all queries
+            score_cutoff (int): Minimum score of the returned choices
+
+        Returns:
+            list: (choice, score) or None for each query, in input order
+        """
+        choices = list(choices)
+        return [self.extract_one(query, choices, score_cutoff) for query in queries]
+
+
+class RapidfuzzEngine:
+    """
+    Scores candidates with rapidfuzz's native WRatio.
+
+    Strings are preprocessed like fuzzywuzzy does so that scores stay
+    comparable with FuzzywuzzyEngine, and batches of queries are scored
+    against all choices in a single `cdist` call spread over every core.
+    """
+
+    name = 'rapidfuzz'
+    vectorized = True
+
+    def __init__(self, workers=-1):
+        if rapidfuzz_process is None:
+            raise ImportError("The rapidfuzz scoring engine requires the rapidfuzz package")
+        self.workers = workers
+
+    def extract_one(self, query, choices, score_cutoff=0):
+        """Same contract as FuzzywuzzyEngine.extract_one"""
+        result = rapidfuzz_process.extractOne(
+            query,
+            choices,
+            scorer=rapidfuzz_fuzz.WRatio,
+            processor=fuzzywuzzy_full_process,
+            score_cutoff=score_cutoff
+        )
+        if result is None:
+            return None
+
+        choice, score, _ = result
+        return choice, int(round(score))
+
+    def extract(self, query, choices, limit, score_cutoff=0):
+        """
+        Same contract as FuzzywuzzyEngine.extract.
+
+        rapidfuzz keeps the `limit` best results in a heap and raises the
+        score cutoff to the worst of them, so most choices are rejected early.
+        """
+        results = rapidfuzz_process.extract(
+            query,
+            choices,
+            scorer=rapidfuzz_fuzz.WRatio,
+            processor=fuzzywuzzy_full_process,
+            limit=limit,
+            score_cutoff=score_cutoff
+        )
+        return [(choice, int(round(score))) for choice, score, _ in results]
+
+    def extract_batch(self, queries, choices, score_cutoff=0):
+        """Same contract as FuzzywuzzyEngine.extract_batch"""
+        choices = list(choices)
+        if not queries or not choices:
+            return [None] * len(queries)
+
+        scores = rapidfuzz_process.cdist(
+            queries,
+            choices,
+            scorer=rapidfuzz_fuzz.WRatio,
+            processor=fuzzywuzzy_full_process,
+            score_cutoff=score_cutoff,
+            workers=self.workers
+        )
+
+        results = []
+        for row in scores:
+            best = int(row.argmax())
+            score = row[best]
+            # cdist reports 0 for every pair below score_cutoff
+            if score < score_cutoff:
+                results.append(None)
+            else:
+                results.append((choices[best], int(round(score))))
+        return results
+
+
+SCORING_ENGINES = {
+    FuzzywuzzyEngine.name: FuzzywuzzyEngine,
+    RapidfuzzEngine.name: RapidfuzzEngine,
+}
+
+
+def get_scoring_engine(name=None):
+    """
+    Instantiate a scoring engine by name.
+
+    Args:
+        name (str): 'fuzzywuzzy' or 'rapidfuzz' (defaults to the FUZZY_ENGINE
+            environment variable, then 'fuzzywuzzy')
+
+    Returns:
+        FuzzywuzzyEngine or RapidfuzzEngine
+    """
+    name = name or os.environ.get('FUZZY_ENGINE', FuzzywuzzyEngine.name)
+
+    if name not in SCORING_ENGINES:
+        raise ValueError(f"Unknown scoring engine '{name}'. Must be one of: {', '.join(SCORING_ENGINES)}")
+
+    return SCORING_ENGINES[name]()
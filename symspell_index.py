@@ -0,0 +1,106 @@
+from array import array
+from Levenshtein import distance as edit_distance
+from text_normalization import fold_key
+
+# Largest edit distance corrected by the index
+DEFAULT_MAX_DISTANCE = 2
+
+# Delete variants are only generated for the first characters of each key,
+# which keeps the index small for long multi-word keys
+DEFAULT_PREFIX_LENGTH = 7
+
+
+def generate_deletes(word, max_distance):
+    """
+    Return every string obtained by deleting up to `max_distance` characters.
+
+    Args:
+        word (str): Word to generate variants for
+        max_distance (int): Maximum number of deleted characters
+
+    Returns:
+        set: Delete variants, including the word itself
+    """
+    variants = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        next_frontier = set()
+        for variant in frontier:
+            for i in range(len(variant)):
+                next_frontier.add(variant[:i] + variant[i + 1:])
+        next_frontier -= variants
+        variants |= next_frontier
+        frontier = next_frontier
+    return variants
+
+
+class SymSpellIndex:
+    """
+    Symmetric delete index for typo correction.
+
+    Delete variants of every key are precomputed, so a misspelled query is
+    corrected with a handful of hash lookups on its own delete variants
+    instead of scoring every key of the dictionary.
+    """
+
+    def __init__(self, keys, max_distance=DEFAULT_MAX_DISTANCE,
+                 prefix_length=DEFAULT_PREFIX_LENGTH):
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        # Delete variant -> array of key ids (see TrigramIndex._postings)
+        self._deletes = {}
+        self._keys = []
+        self._key_ids = {}
+
+        for key in keys:
+            self.add(key)
+
+    def __len__(self):
+        return len(self._key_ids)
+
+    def add(self, key):
+        """Index the delete variants of a new key"""
+        if key in self._key_ids:
+            return
+
+        key_id = len(self._keys)
+        self._keys.append(key)
+        self._key_ids[key] = key_id
+        prefix = fold_key(key)[:self.prefix_length]
+        for variant in generate_deletes(prefix, self.max_distance):
+            key_ids = self._deletes.get(variant)
+            if key_ids is None:
+                key_ids = self._deletes[variant] = array('I')
+            key_ids.append(key_id)
+
+    def lookup(self, query, max_distance=None):
+        """
+        Find the keys within `max_distance` edits of the query.
+
+        Args:
+            query (str): Text to correct
+            max_distance (int): Maximum edit distance (defaults to the index maximum)
+
+        Returns:
+            list: (key, distance) tuples in the order the keys were added
+        """
+        if max_distance is None or max_distance > self.max_distance:
+            max_distance = self.max_distance
+
+        query = fold_key(query)
+        prefix = query[:self.prefix_length]
+
+        matches = {}
+        checked = set()
+        for variant in generate_deletes(prefix, max_distance):
+            for key_id in self._deletes.get(variant, ()):
+                if key_id in checked:
+                    continue
+                checked.add(key_id)
+                # Candidates sharing a delete variant can still be further away
+                # on the full string, so the true distance is always checked
+                key_distance = edit_distance(query, fold_key(self._keys[key_id]), score_cutoff=max_distance)
+                if key_distance <= max_distance:
+                    matches[key_id] = key_distance
+
+        return [(self._keys[key_id], matches[key_id]) for key_id in sorted(matches)]
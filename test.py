@@ -2,6 +2,8 @@ import firebase_admin
 from firebase_admin import credentials, firestore
 from flask import jsonify, request
 from fuzzywuzzy import process
+from translation_service import add_translation
+from text_normalization import normalize_language
 import logging
 import uuid
 from datetime import datetime
@@ -39,8 +41,8 @@ def translate():
         data = request.json
         logger.info(f"Raw received data: {data}")
         # Normalize language names (remove apostrophes and accents)
-        source_lang = data.get('sourceLang', '').lower().replace("'", "").replace("á", "a")
-        target_lang = data.get('targetLang', '').lower().replace("'", "").replace("á", "a")
+        source_lang = normalize_language(data.get('sourceLang', ''))
+        target_lang = normalize_language(data.get('targetLang', ''))
         text = data.get('text', '').lower().strip()
         
         logger.info(f"Normalized translation request: {source_lang} -> {target_lang}: '{text}'")
@@ -112,8 +114,8 @@ def contribute():
         # Extract required fields
         source_text = data.get('source_text', '').strip()
         target_text = data.get('target_text', '').strip()
-        source_language = data.get('source_language', '').lower().replace("'", "").replace("á", "a")
-        target_language = data.get('target_language', '').lower().replace("'", "").replace("á", "a")
+        source_language = normalize_language(data.get('source_language', ''))
+        target_language = normalize_language(data.get('target_language', ''))
         
         # Extract optional fields
         source_example = data.get('source_example', '').strip()
@@ -217,8 +219,8 @@ def list_contributions():
     try:
         # Get query parameters
         status = request.args.get('status', 'pending')
-        source_language = request.args.get('source_language', '').lower().replace("'", "").replace("á", "a")
-        target_language = request.args.get('target_language', '').lower().replace("'", "").replace("á", "a")
+        source_language = normalize_language(request.args.get('source_language', ''))
+        target_language = normalize_language(request.args.get('target_language', ''))
         
         # Initialize Firebase
         db = initialize_firebase()
@@ -302,9 +304,8 @@ def update_contribution_status(contribution_id):
             source_text = contribution_data.get('source_text')
             target_text = contribution_data.get('target_text')
             
-            # Add to dictionary
-            if dict_key in TEMPORARY_DICTIONARIES:
-                TEMPORARY_DICTIONARIES[dict_key][source_text] = target_text
+            # Add to dictionary (also updates the lookup indexes and drops the pair's cached results)
+            add_translation(dict_key, source_text, target_text)
         
         return jsonify({
             'success': True,
@@ -0,0 +1,117 @@
+import re
+import unicodedata
+
+# Apostrophe look-alikes produced by phone keyboards and word processors
+APOSTROPHE_VARIANTS = "’‘ʼʹ`´′"
+
+# Letters folded to what ordinary keyboards type, per language whose
+# orthography uses tones and special letters (tones are stripped separately)
+ORTHOGRAPHY_FOLDING = {
+    'ghomala': str.maketrans({
+        'ɑ': 'a',
+        'ʉ': 'u',
+        'ɛ': 'e',
+        'ə': 'e',
+        'ɔ': 'o',
+        'ŋ': 'ng',
+        'ı': 'i',
+    })
+}
+
+_APOSTROPHE_TABLE = str.maketrans({variant: "'" for variant in APOSTROPHE_VARIANTS})
+_WHITESPACE = re.compile(r"\s+")
+
+
+def clean_text(text):
+    """
+    Canonicalize a dictionary entry or a query without changing its case.
+
+    The text is converted to NFC, apostrophe variants become a plain "'" and
+    runs of whitespace collapse to a single space.
+
+    Args:
+        text (str): Text to clean
+
+    Returns:
+        str: Cleaned text
+    """
+    text = unicodedata.normalize('NFC', text).translate(_APOSTROPHE_TABLE)
+    return _WHITESPACE.sub(' ', text).strip()
+
+
+def fold_key(text):
+    """
+    Fold text for case-insensitive lookups.
+
+    Dictionary keys and queries folded with this function compare equal
+    whenever they only differ by case, Unicode normalization form, apostrophe
+    style or whitespace (e.g. "Easter" and "easter").
+
+    Args:
+        text (str): Text to fold
+
+    Returns:
+        str: Folded text
+    """
+    # casefold() can produce decomposed characters, hence the second NFC pass
+    return unicodedata.normalize('NFC', clean_text(text).casefold())
+
+
+def fold_with_offsets(text):
+    """
+    Fold text character by character, keeping track of where each folded
+    character comes from.
+
+    Unlike fold_key, whitespace is not collapsed, so that offsets found in
+    the folded text can be mapped back to the input. The input should
+    already be in NFC.
+
+    Args:
+        text (str): Text to fold
+
+    Returns:
+        tuple: (folded text, list giving the input index of every folded character)
+    """
+    folded = []
+    offsets = []
+    for index, char in enumerate(text):
+        piece = ' ' if char.isspace() else char.casefold().translate(_APOSTROPHE_TABLE)
+        folded.append(piece)
+        offsets.extend([index] * len(piece))
+    return ''.join(folded), offsets
+
+
+def strip_accents(text):
+    """Remove combining marks, e.g. "ghomála" -> "ghomala" """
+    decomposed = unicodedata.normalize('NFD', text)
+    return unicodedata.normalize('NFC', ''.join(char for char in decomposed if not unicodedata.combining(char)))
+
+
+def fold_orthography(text, letters):
+    """
+    Fold text for tone- and orthography-insensitive lookups, e.g.
+    "dẙ̀" -> "dy", "ŋkɑ́" -> "ngka".
+
+    Args:
+        text (str): Text to fold
+        letters (dict): Translation table of the special letters, e.g. ORTHOGRAPHY_FOLDING['ghomala']
+
+    Returns:
+        str: Folded text without combining marks
+    """
+    decomposed = unicodedata.normalize('NFD', fold_key(text))
+    toneless = ''.join(char for char in decomposed if not unicodedata.combining(char))
+    return unicodedata.normalize('NFC', toneless.translate(letters))
+
+
+def normalize_language(name):
+    """
+    Normalize a language name from a request, e.g. "Ghomála'" -> "ghomala".
+
+    Args:
+        name (str): Language name as sent by the client
+
+    Returns:
+        str: Lowercase language name without apostrophes or accents
+    """
+    return strip_accents(fold_key(name).replace("'", ""))
@@ -0,0 +1,282 @@
+from json_encoding import encode_json
+from text_normalization import fold_key, normalize_language
+from translation_service import (
+    DEFAULT_FUZZY_BACKEND, FUZZY_BACKENDS, MATCH_MODES, MAX_ALTERNATIVES, exact_match, exact_match_type,
+    exact_responses, find_match, get_dictionary, is_supported_pair, language_routes, needs_pivot, pair_version,
+    pinned_generation, pivot_translate, toneless_match, translate_segments, translation_fields
+)
+from urllib.parse import quote, urlencode
+import hashlib
+import json
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+# Exact hits are answered with response bodies encoded once per pair and key
+# unless PRE_ENCODED_RESPONSES is '0'
+PRE_ENCODED_RESPONSES = os.environ.get('PRE_ENCODED_RESPONSES', '1') != '0'
+
+# Seconds shared caches may serve GET /api/translate and /api/languages
+# responses before revalidating them with their ETag
+HTTP_CACHE_MAX_AGE = int(os.environ.get('HTTP_CACHE_MAX_AGE', 300))
+
+
+def parse_translate_request(data):
+    """
+    Normalize and validate the body of a translation request.
+
+    Args:
+        data (dict): Request body as sent by the client
+
+    Returns:
+        tuple: (params, None) with the normalized request, or
+        (None, (error payload, status)) if the request is invalid
+    """
+    # Normalize language names (remove apostrophes and accents) and fold the text
+    source_lang = normalize_language(data.get('sourceLang', ''))
+    target_lang = normalize_language(data.get('targetLang', ''))
+    text = fold_key(data.get('text', ''))
+    match_mode = data.get('matchMode', 'fuzzy')
+    fuzzy_backend = data.get('fuzzyBackend', DEFAULT_FUZZY_BACKEND)
+    alternatives = data.get('alternatives', 0)
+
+    # Formatted only if debug logging is on
+    logger.debug("Normalized translation request: %s -> %s: '%s'", source_lang, target_lang, text)
+
+    # Validate input
+    if not text:
+        return None, ({'error': 'No text provided for translation'}, 400)
+
+    if not source_lang or not target_lang:
+        return None, ({'error': 'Source or target language not specified'}, 400)
+
+    if match_mode not in MATCH_MODES:
+        return None, ({'error': f"Unsupported match mode. Must be one of: {', '.join(MATCH_MODES)}"}, 400)
+
+    if fuzzy_backend not in FUZZY_BACKENDS:
+        return None, ({'error': f"Unsupported fuzzy backend. Must be one of: {', '.join(FUZZY_BACKENDS)}"}, 400)
+
+    if type(alternatives) is not int or not 0 <= alternatives <= MAX_ALTERNATIVES:
+        return None, ({'error': f'alternatives must be an integer between 0 and {MAX_ALTERNATIVES}'}, 400)
+
+    # Determine which dictionary to use
+    dict_key = f"{source_lang}-{target_lang}"
+
+    if not needs_pivot(dict_key) and not is_supported_pair(dict_key):
+        return None, ({'error': 'Unsupported language pair'}, 400)
+
+    return {
+        'sourceLang': source_lang,
+        'targetLang': target_lang,
+        'dictKey': dict_key,
+        'text': text,
+        'matchMode': match_mode,
+        'fuzzyBackend': fuzzy_backend,
+        'alternatives': alternatives
+    }, None
+
+
+def parse_translate_query(args):
+    """
+    Normalize and validate the query parameters of a GET translation request.
+
+    Args:
+        args (dict): Query parameter -> first value, as strings
+
+    Returns:
+        tuple: Same as parse_translate_request
+    """
+    data = dict(args)
+    alternatives = data.get('alternatives', '0')
+    # int() parses decimal digits only; other digits ("²") are left to fail validation
+    data['alternatives'] = int(alternatives) if alternatives.isdecimal() else alternatives
+    return parse_translate_request(data)
+
+
+def canonical_query(params):
+    """
+    Return the canonical query parameters of a GET translation request:
+    normalized languages and text in a fixed order, options left out when
+    they have their default value.
+
+    Args:
+        params (dict): Request returned by parse_translate_request
+
+    Returns:
+        list: (name, value) pairs
+    """
+    query = [('sourceLang', params['sourceLang']), ('targetLang', params['targetLang']), ('text', params['text'])]
+    if params['matchMode'] != 'fuzzy':
+        query.append(('matchMode', params['matchMode']))
+    if params['fuzzyBackend'] != DEFAULT_FUZZY_BACKEND:
+        query.append(('fuzzyBackend', params['fuzzyBackend']))
+    if params['alternatives']:
+        query.append(('alternatives', str(params['alternatives'])))
+    return query
+
+
+def canonical_url(path, params):
+    """Return the URL of a GET translation request with its canonical query string"""
+    return f"{path}?{urlencode(canonical_query(params), quote_via=quote)}"
+
+
+def translation_etag(params):
+    """
+    Return the entity tag of a translation response, derived from the pair's
+    data version and the normalized request, so that it is known without
+    running the lookup.
+
+    Args:
+        params (dict): Request returned by parse_translate_request
+
+    Returns:
+        str: Opaque tag (without quotes)
+    """
+    request_key = json.dumps([pair_version(params['dictKey']), canonical_query(params)], ensure_ascii=False)
+    return hashlib.sha256(request_key.encode('utf-8')).hexdigest()[:32]
+
+
+def _response(params, fields, status=200):
+    return {
+        'originalText': params['text'],
+        **fields,
+        'sourceLang': params['sourceLang'],
+        'targetLang': params['targetLang']
+    }, status
+
+
+def exact_response_body(params):
+    """
+    Return the encoded body of an exact-hit response.
+
+    The response only depends on the language pair and the folded text, so
+    its body is encoded with encode_json on the first hit of a key and reused
+    until the pair changes.
+
+    Args:
+        params (dict): Request returned by parse_translate_request
+
+    Returns:
+        bytes: JSON body of the 200 response, or None if the text has no exact
+        match (or PRE_ENCODED_RESPONSES is off)
+    """
+    if not PRE_ENCODED_RESPONSES:
+        return None
+
+    with pinned_generation():
+        dict_key = params['dictKey']
+        if not is_supported_pair(dict_key):
+            return None
+
+        responses = exact_responses(dict_key)
+        body = responses.get(params['text'])
+        if body is None:
+            response = translate_fast_path(params)
+            if response is None or response[0]['matchType'] != 'exact':
+                return None
+            body = responses[params['text']] = encode_json(response[0])
+        return body
+
+
+def translate_fast_path(params):
+    """
+    Answer a translation request from the exact and tone-less indexes.
+
+    These are a few hash lookups, cheap enough to run on an event loop.
+
+    Args:
+        params (dict): Request returned by parse_translate_request
+
+    Returns:
+        tuple: (payload, status), or None if the request needs the slow path
+    """
+    # Lookups of the request all see the same generation of dictionaries
+    with pinned_generation():
+        dict_key = params['dictKey']
+        if not is_supported_pair(dict_key) or not get_dictionary(dict_key):
+            return None
+
+        # Exact match lookup on the folded keys
+        matched_word = exact_match(dict_key, params['text'])
+        if matched_word is not None:
+            return _response(params, {
+                **translation_fields(dict_key, matched_word),
+                'matchType': exact_match_type(dict_key, matched_word),
+                'matchedWord': matched_word
+            })
+
+        # Queries typed without tones or special letters ("ca" for "cá") resolve
+        # to every toned form, closest first
+        match = toneless_match(dict_key, params['text'])
+        if match is not None:
+            return _response(params, match)
+
+        return None
+
+
+def translate_slow_path(params):
+    """
+    Answer a translation request that has no exact or tone-less match: pivot
+    routes, sentence segmentation, typo and fuzzy matching.
+
+    Args:
+        params (dict): Request returned by parse_translate_request
+
+    Returns:
+        tuple: (payload, status)
+    """
+    # Lookups of the request all see the same generation of dictionaries
+    with pinned_generation():
+        dict_key = params['dictKey']
+        text = params['text']
+        match_mode = params['matchMode']
+        fuzzy_backend = params['fuzzyBackend']
+
+        # Pairs without a dictionary of their own are translated through pivot languages
+        if needs_pivot(dict_key):
+            match = pivot_translate(dict_key, text, match_mode, fuzzy_backend)
+            if match is not None:
+                return _response(params, match)
+
+        dictionary = get_dictionary(dict_key) if is_supported_pair(dict_key) else {}
+
+        # Sentences are translated phrase by phrase
+        if dictionary and match_mode == 'segment':
+            segments = translate_segments(dict_key, text, fuzzy_backend)
+
+            return _response(params, {
+                'translation': ' '.join(
+                    segment['translation'] if segment['translation'] is not None else segment['text']
+                    for segment in segments
+                ),
+                'matchType': 'segmented',
+                'segments': segments
+            }, 200 if any(segment['matchType'] != 'none' for segment in segments) else 404)
+
+        # If no exact match, try the typo and fuzzy paths
+        if dictionary:
+            match = find_match(dict_key, text, match_mode, fuzzy_backend, params['alternatives'])
+
+            # Only matches above FUZZY_SCORE_THRESHOLD are returned
+            if match is not None:
+                return _response(params, match)
+
+        # No match found
+        return _response(params, {
+            'translation': f"Sorry, no translation found for '{text}'",
+            'matchType': 'none'
+        }, 404)
+
+
+def languages_payload():
+    """Return available source and target languages, generated from the language pair graph"""
+    routes = language_routes()
+    return {
+        'sourceLanguages': sorted({route[0] for route in routes.values()}),
+        'targetLanguages': sorted({route[-1] for route in routes.values()}),
+        'pairs': [
+            {'sourceLang': route[0], 'targetLang': route[-1], 'pivotLanguages': route[1:-1]}
+            for route in routes.values()
+        ]
+    }
@@ -4,7 +4,7 @@ TEMPORARY_DICTIONARIES = {
         "door wing": "cềdyá",
         "begin to soften": "pwátà",
         "krîsamê": "kàlisìmề",
-        "home": "dẙ̀",
+        "home": "dẙ̀",
         "generate": "ghàpgwyà",
         "lift quickly": "sôk",
         "gutter": "cú",
@@ -671,7 +671,7 @@ TEMPORARY_DICTIONARIES = {
         "be poor": "páŋ",
         "unhappiness": "gố'",
         "take several things out of a whole": "sùŋtà",
-        "the President of the Republic.": "Dôgùŋ/Fògùŋ",
+        "the President of the Republic.": "Dôgùŋ/Fògùŋ",
         "send each other": "cú",
         "shoulder": "ŋkabò'",
         "hurt when it comes to the stomach": "lăm",
@@ -1117,7 +1117,7 @@ TEMPORARY_DICTIONARIES = {
         "layer": "byå",
         "carrier": "bî̀",
         "sheet": "drâ",
-        "white": "dəḱ",
+        "white": "dəḱ",
         "district name": "Ha'",
         "shadow": "ciŋnyà",
         "remove something from a set or a whole": "sùŋ",
@@ -1344,7 +1344,7 @@ TEMPORARY_DICTIONARIES = {
         "massage with care": "sîntà",
         "happy": "kuŏ",
         "believe": "pîŋ",
-        "Ladies and Gentlemen.": "pəŋthə́lǎʼlâʼ",
+        "Ladies and Gentlemen.": "pəŋthə́lǎ'lâ'",
         "throwing projectiles at each other": "ló'",
         "compete": "làptà",
         "long calabash": "leŋg3p",
@@ -1660,7 +1660,7 @@ TEMPORARY_DICTIONARIES = {
         "white ant": "sŏkgwa'à",
         "always": "pá",
         "lend": "cú",
-        "white man": "dəḱ",
+        "white man": "dəḱ",
         "give": "há",
         "fully": "bim",
         "preferably": "dza",
@@ -1751,14 +1751,14 @@ TEMPORARY_DICTIONARIES = {
         "be yellow": "bênyà",
         "weave lightly": "pà'tà",
         "being a beggar": "lślá",
-        "bishop": "bîshờp"
+        "bishop": "bîshờp"
     },
     'french-ghomala': {
         "en haut": "ŋkà'",
         "battant de porte": "cềdyá",
         "commencer à s'adoucir": "pwátà",
         "krîsamê": "kàlisìmề",
-        "maison": "dẙ̀",
+        "maison": "dẙ̀",
         "générer": "ghàpgwyà",
         "soulever rapidement": "sôk",
         "gouttière": "cú",
@@ -2456,7 +2456,7 @@ TEMPORARY_DICTIONARIES = {
         "malheur": "gố'",
         "retirer plusieurs choses d'un ensemble ou d'un tout": "sùŋtà",
         "être reluisant": "páŋnyá",
-        "le Président de la République.": "Dôgùŋ/Fògùŋ",
+        "le Président de la République.": "Dôgùŋ/Fògùŋ",
         "s'envoyer mutuellement": "cú",
         "épaule": "ŋkabò'",
         "faire mal s'agissant du ventre": "lăm",
@@ -2938,7 +2938,7 @@ TEMPORARY_DICTIONARIES = {
         "couche": "byå",
         "carrier": "káréyà",
         "feuille": "hwa",
-        "blanc": "dəḱ",
+        "blanc": "dəḱ",
         "nom d'un quartier": "Ha'",
         "ombre": "ciŋnyà",
         "retirer quelque chose d'un ensemble ou d'un tout": "sùŋ",
@@ -3180,7 +3180,7 @@ TEMPORARY_DICTIONARIES = {
         "masser avec soin": "sîntà",
         "joyeux": "sényá",
         "croire": "pîŋ",
-        "Mesdames et Messieurs les Députés.": "pəŋthə́lǎʼlâʼ",
+        "Mesdames et Messieurs les Députés.": "pəŋthə́lǎ'lâ'",
         "se lancer des projectiles": "ló'",
         "rivaliser": "làptà",
         "colibri": "cîcî",
@@ -3550,7 +3550,7 @@ TEMPORARY_DICTIONARIES = {
         "fer à repasser": "hányà",
         "toujours": "pá",
         "prêter": "cú",
-        "homme blanc": "dəḱ",
+        "homme blanc": "dəḱ",
         "donner": "há",
         "pleinement": "bim",
         "de préférence": "dza",
@@ -3649,6 +3649,1760 @@ TEMPORARY_DICTIONARIES = {
         "être mendiant": "lślá",
         "eau": "shya",
         "injure": "cáptà",
-        "évêque": "bîshờp"
+        "évêque": "bîshờp"
+    },
+    'english-french': {
+        "up": "en haut",
+        "door wing": "battant de porte",
+        "begin to soften": "commencer à s'adoucir",
+        "krîsamê": "krîsamê",
+        "home": "maison",
+        "generate": "générer",
+        "lift quickly": "soulever rapidement",
+        "gutter": "gouttière",
+        "contribute to the membership fee": "participer à la cotisation",
+        "poop": "caca",
+        "to wear down": "s'user à petits coups",
+        "on": "sur",
+        "interlace": "entrelacer",
+        "move": "bouger",
+        "tree species": "espèce d'arbre",
+        "tell a lot of stories": "raconter beaucoup de choses",
+        "hang": "suspendre",
+        "crush": "écraser",
+        "quiet": "calme",
+        "support": "soutien",
+        "fly off in a jumble": "s'envoler pêle-mêle",
+        "nest": "nid",
+        "sleeping together": "dormir à plusieurs",
+        "wear": "porter",
+        "bad": "mauvais",
+        "law": "loi",
+        "defecation": "défécation",
+        "dance for adults": "danse pour adulte",
+        "look good": "être beau",
+        "small string drum": "petit tambour à corde",
+        "hen": "poule",
+        "boast": "se vanter",
+        "eight": "huit",
+        "long": "long",
+        "Catholic": "catholique",
+        "handle spade": "pique à manche",
+        "glue while striking": "coller en frappant",
+        "beads": "perles",
+        "hamlet": "hameau",
+        "be slightly warm": "être légèrement chaud",
+        "Easter": "pâques",
+        "couscous crust": "croûte de couscous",
+        "here and there": "ça et là",
+        "mare": "jument",
+        "add": "ajouter",
+        "worker": "travailleur",
+        "lie": "mensonge",
+        "visit each other": "se rendre visite",
+        "sandals": "sandalettes",
+        "old man": "vieil homme",
+        "antelope": "antilope",
+        "divide into several": "se diviser en plusieurs",
+        "melt": "fondre",
+        "shave": "raser",
+        "vaccinate": "vacciner",
+        "blush": "rougir",
+        "remove": "enlever",
+        "k3́lisimê": "k3́lisimê",
+        "be twisted": "être tordu",
+        "separate": "séparer",
+        "task": "tâche",
+        "stroll": "flâner",
+        "bird": "oiseau",
+        "infertility": "stérilité",
+        "astonish": "étonner",
+        "matches": "allumettes",
+        "assistant": "adjoint",
+        "make rooster noises": "faire des bruits du coq",
+        "be resistant": "être résistant",
+        "chicken basket": "corbeille à poules",
+        "be many to bloom": "être nombreux à fleurir",
+        "have": "avoir",
+        "press with force": "appuyer avec force",
+        "shine": "éclat",
+        "own": "posséder",
+        "gum": "gomme",
+        "green": "vert",
+        "nail polish": "vernis à ongle",
+        "malice": "méchanceté",
+        "revenge": "vengeance",
+        "slate": "ardoise",
+        "west": "ouest",
+        "chalk": "craie",
+        "red": "rouge",
+        "maggots": "asticots",
+        "fuss": "s'agiter",
+        "sneak in": "se faufiler",
+        "cushion": "coussin",
+        "spend the night": "passer la nuit",
+        "language": "langue",
+        "canteen": "cantine",
+        "oil": "huile",
+        "struggle": "se débattre",
+        "filth": "crasse",
+        "cross": "croiser",
+        "abort": "avorter",
+        "swallow wildly": "avaler sauvagement",
+        "veil the truth": "voiler la vérité",
+        "sardine": "sardine",
+        "connect": "embrancher",
+        "piece of bamboo used to turn couscous": "morceau de bambou servant à tourner le couscous",
+        "name": "nom",
+        "not be straight": "ne pas être droit",
+        "dirt": "saleté",
+        "beating copiously": "battre copieusement",
+        "make fun of someone with a disapproving glance": "se moquer de quelqu'un en utilisant un coup d'oeil désapprobateur",
+        "skip": "sautiller",
+        "allowed to grow": "laissé pousser",
+        "fragrance": "parfum",
+        "cooperative": "coopérative",
+        "think": "penser",
+        "cow": "vache",
+        "bat": "chauve-souris",
+        "inappropriate language": "paroles déplacés",
+        "table": "tableau",
+        "fever": "fièvre",
+        "sunset": "coucher du soleil",
+        "bow your head": "baisser la tête",
+        "feed": "nourrir",
+        "coqueter": "coqueter",
+        "festivities": "festivités",
+        "peel off": "desquamer",
+        "clean with finger to lick": "nettoyer avec le doigt pour lécher",
+        "comfort": "consoler",
+        "appear on someone or something": "apparaître sur quelqu'un ou quelque chose",
+        "what": "quoi",
+        "grow": "grandir",
+        "cradle in your arms": "bercer dans les bras",
+        "dry season": "saison sèche",
+        "shred": "déchiqueter",
+        "poisoning food": "empoisonner la nourriture",
+        "yogurt": "yaourt",
+        "lift with difficulty": "soulever avec peine",
+        "fill up": "se rassasier",
+        "send": "envoyer",
+        "cause acute pain": "faire mal de façon aigue",
+        "direct": "orienter",
+        "request a service or assistance": "demander un service ou une aide",
+        "on land": "à terre",
+        "demand a diamond-shaped finger sign": "exiger par un signe de doigts arqués en losange",
+        "guinea fowl": "pintade",
+        "water bird": "oiseau aquatique",
+        "be severe": "être sévère",
+        "hasten": "s'empresser",
+        "notebook": "cahier",
+        "bring sb to justice": "amener qn en justice",
+        "bad luck": "malchance",
+        "fade": "s'affadir",
+        "tree of peace": "arbre de paix",
+        "feel good": "être bien",
+        "part": "pièce",
+        "people": "gens",
+        "tree": "arbre",
+        "several portions": "plusieurs portions",
+        "fish": "poisson",
+        "pear": "poire",
+        "hide for a moment": "se cacher pour un instant",
+        "fabric mask": "masque d'étoffe",
+        "bury": "enterrer",
+        "visit": "venir",
+        "speak vehemently": "parler avec véhémence",
+        "friend": "ami",
+        "go to": "sortir",
+        "severity": "sévérité",
+        "rinse": "rincer",
+        "chameleon": "caméléon",
+        "search": "chercher",
+        "earrings": "boucle d'oreilles",
+        "cut down": "abattre",
+        "spread": "répandre",
+        "natural features of the human body": "traits naturels apparaissant sur le corps humain",
+        "be reddish": "être rougeâtre",
+        "fatigue": "fatigue",
+        "be worn": "être usé",
+        "vulture": "vautour",
+        "request": "demander",
+        "palaver": "palabre",
+        "visiting someone in distress": "rendre visite à quelqu'un éprouvé par un malheur",
+        "super": "super",
+        "wine gourd": "calebasse à vin",
+        "raise": "soulever",
+        "honorary title": "titre honorifique",
+        "roast": "rôtir",
+        "silver": "argent",
+        "sing": "chanter",
+        "mass": "messe",
+        "grease": "graisse",
+        "mom": "maman",
+        "deer": "cerf",
+        "oindre": "oindre",
+        "gramophone": "gramophone",
+        "plate with lid": "assiette à couvercle",
+        "comb": "peigner",
+        "peanut": "arachide",
+        "giving or giving importance": "accorder ou donner de l'importance",
+        "manufacturer": "constructeur",
+        "shoe": "chaussure",
+        "breast": "sein",
+        "picking one after the other": "cueillir l'un après l'autre",
+        "service": "entretenir",
+        "water": "eau",
+        "penis": "pénis",
+        "quite": "assez",
+        "mattress": "matelas",
+        "Bandjoun district": "quartier de Bandjoun",
+        "thing": "chose",
+        "bracelets": "bracelets",
+        "nine (9)": "neuf (9)",
+        "button": "bouton",
+        "forty": "quarante",
+        "address a theme": "aborder un thème",
+        "pineapple": "ananas",
+        "damage": "abîmer",
+        "honey": "miel",
+        "uproot by shaking": "déraciner en secouant",
+        "snus": "snus",
+        "tourbillon": "tourbillon",
+        "bladder": "vessie",
+        "thank": "remercier",
+        "reverse": "renverser",
+        "subtract": "soustraire",
+        "title for servants who do not enter the fv:faâm": "titre pour des serviteurs qui n'entrent pas au fv:faâm",
+        "iron": "fer à repasser",
+        "level": "niveau",
+        "manage": "se débrouiller",
+        "remove something pasty from sight": "enlever de vue quelque chose de pateux",
+        "force": "force",
+        "continue to take": "continuer de prendre",
+        "chewing gum": "chewing-gum",
+        "mother": "mère",
+        "start talking about...": "commencer à parler de...",
+        "a kind of prime minister or fivñwala' 'from on high'.": "sorte de premier ministre ou fivñwala' 'd'un haut'",
+        "think about": "penser à",
+        "big": "gros",
+        "crumb": "miette",
+        "bagger": "saccageur",
+        "cake": "gâteau",
+        "unlucky": "malchanceux",
+        "current": "courant",
+        "some kind of curse": "espèce de malédiction",
+        "remains": "reste",
+        "day": "jour",
+        "treasure keeper": "gardien du trésor",
+        "German": "allemand",
+        "circle": "entourer",
+        "vernonia": "vernonia",
+        "coarse": "grossier",
+        "play": "jouer",
+        "canoe": "canoe",
+        "spread out": "se répandre",
+        "purge": "se purger",
+        "close": "fermer",
+        "love": "aimer",
+        "face": "affronter",
+        "cohabitation": "concubinage",
+        "channel": "canaliser",
+        "attach": "attacher",
+        "powder room": "cabinet de toilette",
+        "to be deducted": "égrainer",
+        "vagrancy": "vagabondage",
+        "many": "beaucoup",
+        "king": "roi",
+        "delay": "retarder",
+        "parabola": "parabole",
+        "nier": "nier",
+        "teacher": "instituteur",
+        "have detours": "avoir des détours",
+        "ugly to look at": "laid à voir",
+        "dispute": "dispute",
+        "informer": "délateur",
+        "ball": "boule",
+        "miscarry": "faire une fausse couche",
+        "be erect": "être en érection",
+        "honor": "honorer",
+        "mat": "natte",
+        "chef": "chef",
+        "unique": "unique",
+        "armchair": "fauteuil",
+        "begging": "mendicité",
+        "dance elegantly": "danser élégamment",
+        "prime": "apprêter",
+        "be in opposition": "être en opposition",
+        "room": "chambre",
+        "dawn": "poindre jour",
+        "be gentle or tender": "être doux ou tendre",
+        "pistachio": "pistache",
+        "be brave": "être courageux",
+        "say": "dire",
+        "pile up": "s'entasser",
+        "cross out": "barrer",
+        "prepare": "préparer",
+        "straighten with care": "redresser avec soin",
+        "elegance": "élégance",
+        "three": "trois",
+        "resist": "résister",
+        "tool handle": "manche d'un outil",
+        "chicouangues": "chicouangues",
+        "be full": "être plein",
+        "priest": "prêtre",
+        "bring": "amener",
+        "rope": "corde",
+        "an": "an",
+        "subordinate": "subalterne",
+        "shake": "agiter",
+        "site": "site",
+        "head": "tête",
+        "wish": "souhaiter",
+        "rotail": "rotail",
+        "call": "invoquer",
+        "turn": "tourner",
+        "stammer": "balbutier",
+        "truth": "vérité",
+        "beard": "barbe",
+        "perspiration": "transpiration",
+        "retail": "vendre en détail",
+        "scatter": "éparpiller",
+        "at": "façon",
+        "touch": "toucher",
+        "beat": "battre",
+        "interjection to request silence": "interjection pour réclamer le silence",
+        "holy water": "eau bénite",
+        "doctrine": "doctrine",
+        "mislead": "tromper",
+        "accept": "accepter",
+        "give an outline": "donner les grandes lignes",
+        "crumble": "émietter",
+        "healer": "guérisseur",
+        "dirty": "crasseux",
+        "bricklayer": "maçon",
+        "socialize": "se fréquenter",
+        "separate from the trunk": "séparer du tronc",
+        "halfway": "mi-chemin",
+        "lack of flavor": "manquer de saveur",
+        "be old": "être vieux",
+        "how much": "combien",
+        "French": "français",
+        "distance": "distance",
+        "mold": "moisissure",
+        "petrol": "essence",
+        "Noël": "Noël",
+        "provoke": "provoquer",
+        "accuse": "accuser",
+        "above": "au-dessus",
+        "tighten": "serrer",
+        "darkness": "obscurité",
+        "cooled (completely)": "refroidi (totalement)",
+        "Bafoussam": "Bafoussam",
+        "a kind of traditional dance": "sorte de danse traditionnelle",
+        "meeting": "assemblée",
+        "liberator of the land of the world": "libérateur du pays du monde",
+        "all dirty": "tout sale",
+        "wild fruit": "fruit sauvage",
+        "value": "valeur",
+        "scrub": "broussaille",
+        "lance": "lance",
+        "machine": "machine",
+        "status": "état",
+        "waste": "déchet",
+        "be a little sticky": "être un peu collant",
+        "market": "marché",
+        "boil": "bouillir",
+        "campaign": "campagne",
+        "has": "à",
+        "tinker": "bricoler",
+        "stop": "arrêter",
+        "return": "retourner",
+        "fry": "frire",
+        "planter": "planteur",
+        "yam": "igname",
+        "stroller": "poussette",
+        "be many to blacken": "être nombreux à noircir",
+        "delete": "effacer",
+        "reactivate the fire": "réactiver le feu",
+        "be calm": "être calme",
+        "belch": "éructer",
+        "nude": "nu",
+        "skinning": "écorcher",
+        "mission": "mission",
+        "year": "année",
+        "wind": "vent",
+        "bracelet": "bracelet",
+        "deviate": "dévier",
+        "well": "puits",
+        "stinginess": "chicheté",
+        "ceiling": "plafond",
+        "sounds": "sons",
+        "bending clay": "plier l'argile",
+        "put a spell on something so that it can't be touched": "mettre un sort sur quelque chose pour qu'on n'y touche pas",
+        "(to cling)": "(s')accrocher",
+        "when you answer respectfully": "lorsqu'on répond respectueusement",
+        "satisfy someone": "satisfaire quelqu'un",
+        "rags": "haillons",
+        "chest cavity": "cage thoraxique",
+        "program": "programmer",
+        "weevil": "charançon",
+        "envy": "envier",
+        "don't rush": "ne pas se presser",
+        "the one who stops the rain": "celui qui arrête la pluie",
+        "clear": "clair",
+        "activate a quarrel": "activer une querelle",
+        "wall": "mur",
+        "lazy": "paresseux",
+        "proper noun": "nom propre",
+        "sparkle": "scintiller",
+        "be loose-fitting around the waist": "être ample au niveau de la taille",
+        "to pile up": "s'empiler",
+        "widow": "veuve",
+        "testicle": "testicule",
+        "get better": "aller mieux",
+        "wasp": "guêpe",
+        "plate": "assiette",
+        "have value": "avoir de la valeur",
+        "peace": "paix",
+        "sneeze": "éternuer",
+        "lose": "perdre",
+        "hide": "cacher",
+        "new": "nouveau",
+        "be consistent": "être consistant",
+        "evening": "soir",
+        "spoon": "cuillère",
+        "be good": "être bon",
+        "also": "également",
+        "meat": "viande",
+        "carefully remove leaves": "arracher soigneusement les feuilles",
+        "dream": "rêve",
+        "be stingy": "être chiche",
+        "sleep": "dormir",
+        "disturb": "déranger",
+        "dig": "creuser",
+        "writer": "écrivain",
+        "and": "et",
+        "minister's servant": "serviteur du ministre",
+        "feeding for the first time": "se nourrir pour la première fois",
+        "brave": "valeureux",
+        "damage by rotting in the ground": "s'abimer en pourissant dans le sol",
+        "tyranny": "tyrannie",
+        "flattering": "flatteur",
+        "chin": "menton",
+        "overload": "surcharger",
+        "foreign country": "pays étranger",
+        "caring for newborn babies and their mothers": "prendre soin du nouveau-né et sa mère",
+        "police officer": "policier",
+        "interchange": "interchanger",
+        "bolt": "targette",
+        "goaler": "buter",
+        "keep": "garder",
+        "spend": "dépenser",
+        "river": "rivière",
+        "donkey": "âne",
+        "educate": "éduquer",
+        "palm tree": "palmier",
+        "spend the day": "passer la journée",
+        "seed": "pépin",
+        "grow wings": "faire pousser des ailes",
+        "armpit": "aisselle",
+        "ring": "bague",
+        "hang on": "s'accrocher",
+        "aquatic insect": "insecte aquatique",
+        "eat": "manger",
+        "animate": "animer",
+        "cause or outline a tear": "provoquer ou esquisser une déchirure",
+        "devancer": "dévancer",
+        "brother or sister": "frère ou soeur",
+        "tetanus": "tétanos",
+        "type": "type",
+        "chafer": "hanneton",
+        "farm": "ferme",
+        "package": "paquet",
+        "cup": "tasse",
+        "plot": "tracer",
+        "taquette": "taquette",
+        "remoudre": "remoudre",
+        "to be potted": "être potélé",
+        "week": "semaine",
+        "charity": "charité",
+        "succeed": "aboutir",
+        "stand in several places": "dresser à plusieurs endroits",
+        "catch": "attraper",
+        "someone": "quelqu'un",
+        "veranda": "véranda",
+        "the loved one": "l'être aimé",
+        "treat with care": "traiter avec délicatesse",
+        "wipe": "essuyer",
+        "armadillo": "à tatons",
+        "replacement": "remplaçant",
+        "darken": "s'assombrir",
+        "open wider": "ouvrir plus grandement",
+        "stand guard here and there": "monter la garde par-ci par-là",
+        "replace": "remplacer",
+        "ask for what you're owed": "demander son dû",
+        "cement": "ciment",
+        "rationing": "procéder au rationnement",
+        "cultivate": "cultiver",
+        "thirty": "trente",
+        "coat": "manteau",
+        "proposal": "proposition",
+        "meager": "maigre",
+        "black fruit": "fruit noir",
+        "a misunderstanding": "un malentendu",
+        "not to have": "ne pas avoir",
+        "gluer": "colleur",
+        "English": "anglais",
+        "suit": "costume",
+        "get lost one by one": "se perdre un à un",
+        "route": "voie",
+        "boasting": "vantardise",
+        "abdomen": "abdomen",
+        "fatten": "engraisser",
+        "syphilis": "syphilis",
+        "hippopotamus": "hippopotame",
+        "sentinel": "sentinelle",
+        "scoundrel": "vaurien",
+        "then": "alors",
+        "fantasy": "fantaisie",
+        "eat hard food of a firm consistency": "manger des mets durs de consistance",
+        "operate": "opérer",
+        "fire": "feu",
+        "key": "key",
+        "passing the time": "passer le temps",
+        "Monday": "lundi",
+        "retreats": "des replis",
+        "cut into strips": "couper en lamelles",
+        "terrible": "terrible",
+        "tell": "raconter",
+        "whip": "fouetter",
+        "extract": "extraire",
+        "swing": "balancer",
+        "pus": "pus",
+        "school": "école",
+        "make balls": "faire des boules",
+        "scrub before rinsing": "frotter avant de rincer",
+        "gild": "dorer",
+        "turn in oil": "tourner dans l'huile",
+        "flower": "fleur",
+        "god of Baham": "dieu de Baham",
+        "singlé": "singlé",
+        "large": "grand",
+        "never": "jamais",
+        "speak": "parler",
+        "disorder": "trouble",
+        "glow": "luire",
+        "supervisor": "surveillant",
+        "scratch": "griffer",
+        "finish sinking": "finir d'enfoncer",
+        "placenta": "placenta",
+        "roam": "gambader",
+        "case": "affaire",
+        "toilet": "toilette",
+        "be red": "être rouge",
+        "scare": "effrayer",
+        "conclude": "conclure",
+        "whiteness": "blancheur",
+        "woven fiber": "fibre tissé",
+        "grasshopper": "sauterelle",
+        "association de travail aux champs": "association de travail aux champs",
+        "yellow or limestone-colored object": "objet ayant la couleur jaune ou l'aspect du calcaire",
+        "back off": "reculer",
+        "simple": "simple",
+        "father": "père",
+        "be exorbitant": "être exorbité",
+        "be crossed out": "être barré",
+        "Friday": "vendredi",
+        "janitor": "gardien",
+        "be sweet": "être sucré",
+        "barner": "barner",
+        "put together": "mettre bout à bout",
+        "insult each other": "s'insulter mutuellement",
+        "paste": "coller",
+        "queen mother": "reine mère",
+        "mate": "s'accoupler",
+        "a kind of bugle": "sorte de clairon",
+        "scoff": "se moquer",
+        "carry on your back": "porter sur le dos",
+        "Sunday": "dimanche",
+        "win": "gagner",
+        "become liquid": "devenir liquide",
+        "poison": "poison",
+        "rice": "riz",
+        "scrap": "rebut",
+        "bamboo stool": "tabouret en bambou",
+        "heat": "chauffer",
+        "help": "aide",
+        "ear": "oreille",
+        "worm": "ver",
+        "saint": "saint",
+        "company": "société",
+        "rainy season": "saison des pluies",
+        "discard": "écarter",
+        "wildcat": "chat sauvage",
+        "gain in strength": "gagner en vigueur",
+        "to run": "sécourir",
+        "lawyer": "avocat",
+        "leather shoes": "chaussures en cuir",
+        "take": "prendre",
+        "history": "histoire",
+        "weave, weave": "tresser, tisser",
+        "minister of the interior": "ministre de l'intérieur",
+        "towel": "serviette",
+        "be slow": "être lent",
+        "sweet potato": "patate douce",
+        "prohibited": "interdits",
+        "test someone": "éprouver quelqu'un",
+        "overcoat": "pardessus",
+        "you": "toi",
+        "several": "porter à plusieurs",
+        "cut with one stroke": "couper d'un trait",
+        "sell": "vendre",
+        "workshop": "atelier",
+        "hummingbird": "colibri",
+        "Dschang": "Dschang",
+        "rub": "frotter",
+        "split into small blades": "fendre en petites lames",
+        "discord": "discorde",
+        "duck": "canard",
+        "quinine": "quinine",
+        "dog": "chien",
+        "gluttonous eating": "manger gloutonnement",
+        "girl": "jeune fille",
+        "spy": "espion",
+        "piece": "morceau",
+        "hurry": "se dépêcher",
+        "full": "plein",
+        "liana": "liane",
+        "non-venomous snake": "serpent non venimeux",
+        "chat": "bavarder",
+        "crab": "crabe",
+        "tap": "tapoter",
+        "hammer": "marteau",
+        "crawl": "ramper",
+        "go bad": "s'avarier",
+        "indefinitely": "indéfiniment",
+        "drag": "traîner",
+        "chew": "chique",
+        "strike to hurt or to pick": "frapper pour faire mal ou pour cueillir",
+        "deep": "profond",
+        "oppose": "s'opposer",
+        "charcoal": "charbon de bois",
+        "peak": "pic",
+        "bush": "brousse",
+        "blood": "sang",
+        "royal cemetery": "cimetière royal",
+        "professor": "professeur",
+        "elephant": "éléphant",
+        "beer": "bière",
+        "government sub-prefect cathedral": "gouvernement sous préfet cathédrale",
+        "circular cutting": "couper de façon circulaire",
+        "millet": "mil",
+        "vest": "gilet",
+        "be at the end of your rope": "être au bout du rouleau",
+        "baby": "bébé",
+        "kilo": "kilo",
+        "stu": "stu",
+        "rule": "règle",
+        "and by extension": "et par extension",
+        "tater": "tater",
+        "meter": "mètre",
+        "track and trace": "suivre à la trace",
+        "shrub": "arbuste",
+        "new corn cake": "gâteau de maís nouveau",
+        "collide": "heurter",
+        "safoutier": "safoutier",
+        "proliferate": "proliférer",
+        "cramer": "cramer",
+        "balàsì": "balàsì",
+        "spell": "sort",
+        "add up": "s'additionner",
+        "saucepan": "casserole",
+        "be tough": "être dur",
+        "be poor": "être pauvre",
+        "unhappiness": "malheur",
+        "take several things out of a whole": "retirer plusieurs choses d'un ensemble ou d'un tout",
+        "the President of the Republic.": "le Président de la République.",
+        "send each other": "s'envoyer mutuellement",
+        "shoulder": "épaule",
+        "hurt when it comes to the stomach": "faire mal s'agissant du ventre",
+        "arancer en saillies": "arancer en saillies",
+        "banana": "banane",
+        "exceed": "dépasser",
+        "call massively": "appeler massivement",
+        "clap hands": "frapper les mains",
+        "resonate": "résonner",
+        "bang": "se cogner",
+        "time": "temps",
+        "pocket money": "argent de poche",
+        "count": "compter",
+        "grow fast": "grandir rapidement",
+        "coast": "côte",
+        "break": "casser",
+        "vehicle rear axle": "arrière train d'un véhicule",
+        "found": "fonder",
+        "annoy": "gêner",
+        "die": "mourir",
+        "age of": "avoir l'age de",
+        "fast": "sépkò",
+        "seriously beat": "battre sérieusement",
+        "pig": "cochon",
+        "give birth": "accoucher",
+        "nibble": "grignoter",
+        "without": "sans",
+        "below": "en bas",
+        "idle": "oisif",
+        "shortly": "sous peu de temps",
+        "rosary": "chapelet",
+        "aunt": "tante",
+        "title for a servant": "titre pour un serviteur",
+        "twist": "tordre",
+        "order": "ordre",
+        "wing": "aile",
+        "wrinkle": "froisser",
+        "soldier": "soldat",
+        "vein": "veine",
+        "communicate with a pinch": "communiquer par un pincement",
+        "protrude": "saillir",
+        "stove": "poêle",
+        "hunger": "faim",
+        "rest easy": "être tranquille",
+        "shout": "crier",
+        "transform": "se transformer",
+        "share": "partager",
+        "squeeze very hard": "serrer très fort",
+        "roast well": "bien rôtir",
+        "be gentle": "être doux",
+        "applaud": "applaudir",
+        "knock": "cogner",
+        "roads": "voirie",
+        "Bandjoun": "Bandjoun",
+        "big and ugly": "gros et laid",
+        "cuddle": "cajoler",
+        "chef's mother": "mère du chef",
+        "drive": "conduire",
+        "navel": "nombril",
+        "be small": "être petit",
+        "not being clear": "ne pas être clair",
+        "criticize defects": "critiquer les défauts",
+        "thatch": "chaume",
+        "open": "ouvrir",
+        "reed": "roseau",
+        "tax": "impôt",
+        "bad behavior": "mauvais comportements",
+        "build": "construire",
+        "laziness": "paresse",
+        "heart": "cœur",
+        "boat": "bateau",
+        "patience": "patience",
+        "seventy": "soixante-dix",
+        "slumber": "sommeiller",
+        "cut": "couper",
+        "disagreement": "mésentente",
+        "stunted": "rabougri",
+        "weaver": "tisserand",
+        "oldest sister": "soeur aînée",
+        "frog": "grenouille",
+        "pout": "faire la moue",
+        "tranquility": "tranquillité",
+        "err with malice": "se tromper avec malice",
+        "write things": "écrire des choses",
+        "dame-jeanne": "dame-jeanne",
+        "wreck": "épave",
+        "lightning": "éclair",
+        "flowing": "couler à flots",
+        "harvest": "récolter",
+        "saw": "scie",
+        "only one": "un seul",
+        "at fault": "fautif",
+        "evoke": "évoquer",
+        "small market": "petit marché",
+        "slide": "glisser",
+        "fold several times": "plier plusieurs fois",
+        "rent": "louer",
+        "try": "essayer",
+        "my mother": "ma mère",
+        "peeled": "pelé",
+        "climb": "escalader",
+        "light": "léger",
+        "what what": "quoi qu'est-ce que",
+        "grandmother": "bàŋthà",
+        "my brother": "mon frère",
+        "woman": "femme",
+        "drop": "goutte",
+        "caquetter": "caquetter",
+        "pack": "empaqueter",
+        "excite": "exciter",
+        "render, return": "rendre, restituer",
+        "saliva": "salive",
+        "rattle": "faire trembler",
+        "be lukewarm": "être tiède",
+        "be doriott": "être doriotté",
+        "egg": "œuf",
+        "walk": "marcher",
+        "concern": "concerner",
+        "pipe": "pipe",
+        "tug": "tirailler",
+        "hugs": "embrassades",
+        "night watchman": "gardien de nuit",
+        "glass": "verre",
+        "nose": "nez",
+        "send in large numbers": "envoyer en grand nombre",
+        "formidable": "formidable",
+        "headless and tailless": "sans tête ni queue",
+        "floor": "plancher",
+        "Mr.": "monsieur",
+        "used": "usité",
+        "become fat": "devenir gras",
+        "poetry": "poésie",
+        "smallpox": "variole",
+        "full member of the council of nine notables": "membre titulaire du conseil des neuf notables",
+        "change": "muer",
+        "pants": "pantalon",
+        "toast": "griller",
+        "multiple deaths and cascades": "mourir à plusieurs et en cascades",
+        "chess game": "jeu d'échec",
+        "coal": "charbon",
+        "knock with small blows": "cogner à petits coups",
+        "decimate": "décimer",
+        "estimated": "estimé",
+        "dust": "poussière",
+        "designer": "créateur",
+        "weigh": "peser",
+        "to go around someone or something": "faire le tour de quelqu'un ou de quelque chose",
+        "slice": "trancher",
+        "hair": "poil",
+        "flowering herbs": "d'herbes à fleurs",
+        "wake up": "se reveiller",
+        "hoe": "houe",
+        "committee": "comité",
+        "watch": "guetter",
+        "stingy": "chiche",
+        "mud": "boue",
+        "stifle": "étouffer",
+        "swallow wrongly": "avaler de travers",
+        "ginger": "gingembre",
+        "retaliate inopportunely": "répliquer intempestivement",
+        "fault": "défaut",
+        "light in behavior": "léger dans le comportement",
+        "fold": "plier",
+        "disappear": "disparaître",
+        "carcass": "carcasse",
+        "monkey": "singe",
+        "thin": "mince",
+        "yellow": "jaune",
+        "amputate": "amputer",
+        "solid": "solide",
+        "move forward with great difficulty": "avancer avec grande peine",
+        "beauty": "beauté",
+        "take together": "prendre ensemble",
+        "young man": "jeune homme",
+        "arrive": "arriver",
+        "bypass": "contourner",
+        "make a fist": "forcer le poing",
+        "bicolor": "bicolor",
+        "Saturday": "samedi",
+        "driver helper": "aide chauffeur",
+        "misery": "misère",
+        "dance bell": "grelot servant à la danse",
+        "hold with delicacy": "tenir avec délicatesse",
+        "scorpion": "scorpion",
+        "store": "boutique",
+        "collector": "ramasseur",
+        "orange juice": "jus d'orange",
+        "belly": "ventre",
+        "be clean": "être propre",
+        "arc": "arc",
+        "hospital": "hôpital",
+        "environment": "milieu",
+        "tooth": "dent",
+        "old": "vieux",
+        "straighten up": "redresser",
+        "horse": "cheval",
+        "join forces": "s'associer",
+        "district": "quartier",
+        "firearm": "arme à feu",
+        "sewing": "coudre",
+        "be proud of yourself": "être fier de soi",
+        "male": "mâle",
+        "boredom": "ennui",
+        "denunciation": "délation",
+        "jump": "sauter",
+        "be acidic": "être acide",
+        "dead bamboo": "bambou mort",
+        "fat": "gras",
+        "swear": "jurer",
+        "the one who carries a heavy load": "celui qui porte une lourde charge",
+        "gulf": "goufre",
+        "one hundred": "cent",
+        "Cameroon": "Cameroun",
+        "tough": "coriace",
+        "border": "frontière",
+        "body": "corps",
+        "butcher": "dépecer",
+        "deny": "démentir",
+        "ash": "cendre",
+        "elect": "élire",
+        "WC": "WC",
+        "get pimples": "avoir des boutons",
+        "thinking": "pensée",
+        "totem": "totem",
+        "city": "ville",
+        "black": "noir",
+        "expression of wish": "expression du souhait",
+        "hunter": "chasseur",
+        "little": "peu",
+        "toilets": "toilettes",
+        "reflexion": "reflexion",
+        "of little value": "de peu de valeur",
+        "change skin": "changer de peau",
+        "pick up carefully": "ramasser minutieusement",
+        "to you": "à toi",
+        "take (give) on credit": "prendre (donner) à crédit",
+        "hesitate": "hésiter",
+        "improvement": "amélioration",
+        "claim": "reclamer",
+        "search randomly": "chercher au hazard",
+        "fill in": "remplir",
+        "exciting dogs to hunt": "exciter les chiens à la chasse",
+        "steering wheel": "volant",
+        "charcoal ember": "braise de charbon",
+        "mouth": "bouche",
+        "cyasàm": "cyasàm",
+        "licker": "lécheur",
+        "precipice": "précipice",
+        "have mercy": "avoir pitié",
+        "title; man-buffalo, great dignitaries of the kingdom and members of totemic societies; they enter the tv:faâm": "titre; homme-buffles, grands dignitaires du royaume et membres des sociétés totémiques; ils entrent au tv:faâm",
+        "be narrow": "être étroit",
+        "wow": "bvò",
+        "heat slightly": "chauffer légèrement",
+        "sand": "sable",
+        "seal": "cachet",
+        "sent": "envoyé",
+        "guitar": "guitare",
+        "respond in chorus": "répondre en chœur",
+        "pharmacy": "pharmacie",
+        "load": "charge",
+        "be sharp": "être tranchant",
+        "mother of the twins": "mère des jumeaux",
+        "be useless": "être inutile",
+        "be dizzy": "être étourdi",
+        "apply a small amount of oil or salt to the wound": "mettre une petite quantité d'huile ou de sel sur la plaie",
+        "be bitter": "être amer",
+        "respect": "respect",
+        "teach": "enseigner",
+        "have lots of pimples": "avoir beaucoup de boutons",
+        "four": "quatre",
+        "tell the story in detail": "raconter en détail",
+        "a cucurbit whose seeds are prized": "cucurbitacée dont on apprécie les graines",
+        "overflow": "déborder",
+        "polish": "cirage",
+        "absent-mindedness": "étourderie",
+        "attic": "grenier",
+        "announce": "annoncer",
+        "pick": "cueillir",
+        "blow": "souffler",
+        "mango": "mangue",
+        "protect": "protéger",
+        "wire": "fil",
+        "impregnated by a disease": "imprégné par une maladie",
+        "cut into small pieces": "découper en petits morceaux",
+        "veil": "voiler",
+        "forest": "forêt",
+        "slot": "fente",
+        "God": "Dieu",
+        "potter": "potier",
+        "so": "ainsi",
+        "grasp in the palm of the hand": "saisir dans la paume de la main",
+        "soil": "sol",
+        "insult": "injure",
+        "title of nobility": "titre de noblesse",
+        "the part of the bamboo that attaches to the trunk": "partie du bambou qui se rattache au tronc",
+        "set up a meeting": "prendre rendez-vous",
+        "hang all along": "accrocher tout au long",
+        "handcuffs": "menottes",
+        "voracious eating": "manger avec voracité",
+        "trade": "commerce",
+        "flatter": "flatter",
+        "relieve": "soulager",
+        "medium": "moyen",
+        "style": "style",
+        "houseboy": "garçon de maison",
+        "bewitchment": "envoûtement",
+        "carrying": "en trimballant",
+        "be a little warm": "être un peu chaud",
+        "drunk": "ivrogne",
+        "talk unnecessarily": "parler inutilement",
+        "joke": "blague",
+        "regret": "regretter",
+        "make or give a gift after a purchase": "faire ou donner un cadeau après un achat",
+        "nine": "neuf",
+        "swallow": "avaler",
+        "clogged": "bouchée",
+        "limestone": "calcaire",
+        "identify": "cerner",
+        "widow's blue suit": "habit bleu pour veuve",
+        "crucifix": "crucifix",
+        "pepper": "poivre",
+        "all": "tout",
+        "sort out the bad seeds": "trier les mauvais grains",
+        "range": "fourchette",
+        "stupidity": "stupiditié",
+        "the kingdom's second-in-command": "le second personnage du royaume",
+        "blue": "bleu",
+        "the worst": "le pire",
+        "nail": "coincer",
+        "pork": "porc",
+        "learn": "apprendre",
+        "red wine": "vin rouge",
+        "at least": "au moins",
+        "work": "travail",
+        "England": "Angleterre",
+        "frame": "encadrer",
+        "search at random": "chercher au hasard",
+        "blessing": "bénédiction",
+        "hat": "chapeau",
+        "leg": "jambe",
+        "staircase": "escalier",
+        "prick": "piquer",
+        "soap": "savon",
+        "hatch": "éclore",
+        "knead": "pétrir",
+        "quarter": "écarteler",
+        "France": "France",
+        "foot of tree": "pied de l'arbre",
+        "dad": "papa",
+        "sprain your foot": "se fouler le pied",
+        "be mild to the taste": "être doux au goût",
+        "doctor": "docteur",
+        "scissors": "ciseaux",
+        "drum": "tambour",
+        "train": "former",
+        "rosser": "rosser",
+        "tine": "tine",
+        "food": "nourriture",
+        "praise": "louange",
+        "coffee": "café",
+        "hustle and bustle": "se bousculer",
+        "appropriate": "s'approprier",
+        "look at each other from time to time": "se regarder de temps en temps",
+        "man": "homme",
+        "frog species": "espèce de grenouille",
+        "whore": "putain",
+        "bean": "haricot",
+        "woven bamboo pith used as a mat to cover the ceiling or hedges of notables' concessions or abandoned or proscribed areas": "moelle de bambou tissée servant de natte pour couvrir le plafond ou les haies des concessions de notables ou des lieux abandonnés ou proscrits",
+        "loan": "emprunt",
+        "clean inside": "nettoyer l'intérieur",
+        "beef": "boeuf",
+        "it's wrong": "ko'tá",
+        "ban": "interdire",
+        "star": "étoile",
+        "angry": "fâché",
+        "collaborate": "collaborer",
+        "say bad things repeatedly": "dire du mal à plusieurs reprises",
+        "squeeze": "se serrer",
+        "reject": "rejeter",
+        "sugar": "sucre",
+        "rifle": "fusil",
+        "length": "longueur",
+        "be at work": "être en travail",
+        "electricity": "électricité",
+        "rickshaw": "pousse-pousse",
+        "grab someone": "empoigner quelqu'un",
+        "child": "enfant",
+        "reprimand": "réprimender",
+        "car": "voiture",
+        "moan": "gémir",
+        "be brittle": "être friable",
+        "be less expensive": "être moins cher",
+        "file": "lime",
+        "pride": "orgueil",
+        "heel": "talon",
+        "be peaceful": "être paisible",
+        "garnish": "garnir",
+        "ploughman": "laboureur",
+        "I": "je",
+        "courage": "courage",
+        "be ungrateful": "être ingrat",
+        "one unit corresponding to five francs": "une unité correspondant à cinq francs",
+        "outside": "dehors",
+        "catch on the fly": "attraper au vol",
+        "bar": "barre",
+        "operate in several locations": "opérer en plusieurs endroits",
+        "stack": "empiler",
+        "fly": "mouche",
+        "macabo": "macabo",
+        "non-proportional": "non proportionnel",
+        "wild banana": "bananier sauvage",
+        "aurora": "aurore",
+        "bag": "sac",
+        "roof": "toit",
+        "press (to extract water)": "presser (pour extraire de l'eau)",
+        "Mifi village": "village de la Mifi",
+        "beast": "bête",
+        "sooner or later": "tôt ou tard",
+        "hill": "colline",
+        "lap": "lap",
+        "eventually be": "être à terme",
+        "snooze": "roupiller",
+        "location": "lieu",
+        "split into small pieces": "fendre en petits morceaux",
+        "coming soon": "bientôt",
+        "IEC": "CEI",
+        "want to": "avoir envie",
+        "family founder": "fondatrice de famille",
+        "scholarship": "bourse",
+        "taproot": "racine pivotante",
+        "breeze block": "parpaing",
+        "with nothing": "sans rien",
+        "thank you": "remerciement",
+        "search thoroughly": "chercher minutieusement",
+        "approach": "approcher",
+        "hole": "trou",
+        "give something to someone": "donner quelque chose à quelqu'un",
+        "disperse": "disperser",
+        "when": "quand",
+        "reach": "atteindre",
+        "submissive leader": "chef soumis",
+        "be tender": "être tendre",
+        "layer": "couche",
+        "carrier": "porteur",
+        "sheet": "drap",
+        "white": "blanc",
+        "district name": "nom d'un quartier",
+        "shadow": "ombre",
+        "remove something from a set or a whole": "retirer quelque chose d'un ensemble ou d'un tout",
+        "my father": "mon père",
+        "palm nut": "noix de palme",
+        "wash": "laver",
+        "heat slightly, make lukewarm": "chauffer légèrement, rendre tiède",
+        "divert": "détourner",
+        "keep on crying": "continuer de pleurer",
+        "trench": "tranchée",
+        "carpenter": "charpentier",
+        "title; blacksmith": "titre; forgeron",
+        "talking into each other's ears": "se parler à l'oreille",
+        "book": "livre",
+        "ewes": "brebis",
+        "tontine": "tontine",
+        "root": "racine",
+        "rain": "pluie",
+        "inaugurate": "inaugurer",
+        "recognize": "reconnaître",
+        "raffia wine": "vin de raphia",
+        "sketch a slit": "esquisser une fente",
+        "daredevil": "téméraire",
+        "decrease": "diminuer",
+        "line": "lignée",
+        "shredder": "destructeur",
+        "destiny": "destin",
+        "fun": "amusement",
+        "suitcase": "valise",
+        "title": "titre",
+        "secret": "secret",
+        "person": "personne",
+        "be crazy": "être fou",
+        "only": "seulement",
+        "eagerness": "empressement",
+        "Minister": "ministre",
+        "castrate": "castrer",
+        "sowing season": "saison de semence",
+        "grumble": "gronder",
+        "pou": "pou",
+        "get up": "se lever",
+        "left": "gauche",
+        "have fun": "s'amuser",
+        "single": "célibataire",
+        "be welcoming": "être accueillent",
+        "pigeon": "pigeon",
+        "hurdle jumping": "sauteур de haies",
+        "be rare": "être rare",
+        "tickling": "chatouillements",
+        "friend-to-friend call": "appel entre ami",
+        "hyena": "hyène",
+        "model": "modèle",
+        "ram": "bélier",
+        "simply": "simplement",
+        "vagina": "vagin",
+        "kind of flowers": "sorte de fleurs",
+        "son or daughter": "fils ou fille",
+        "fall from top to bottom": "tomber de haut en bas",
+        "valley": "vallée",
+        "oil-free": "sans huile",
+        "tronc": "tronc",
+        "termites": "termites",
+        "témoin": "témoin",
+        "to perform (in the case of dance)": "exécuter (dans le cas de la danse)",
+        "couteau": "couteau",
+        "pleurer": "pleurer",
+        "interpeller": "interpeller",
+        "answer": "réponse",
+        "kiss": "s'embrasser",
+        "coconut": "noix de coco",
+        "fuck": "foutre",
+        "to an elder": "à un aîné",
+        "lick": "lécher",
+        "pass again": "passer de nouveau",
+        "touch with care": "toucher avec soin",
+        "very old": "très vieux",
+        "grounded on a tree branch": "échouer sur une branche d'arbre",
+        "multiply": "se multiplier",
+        "be late": "être en retard",
+        "two": "deux",
+        "convert": "se convertir",
+        "firewood": "bois de chauffage",
+        "chain": "chaîne",
+        "my sister": "ma soeur",
+        "ask here and there": "quemander ça et là",
+        "round up": "arrondir",
+        "drill": "percer",
+        "market day": "jour du grand marché",
+        "being away from home late at night": "être encore hors de chez soi tard la nuit",
+        "very well": "très bien",
+        "call from both sides": "appeler de part et d'autre",
+        "flight": "vol",
+        "birthday": "anniversaire",
+        "persevering": "persévérant",
+        "arrow": "flèche",
+        "know": "savoir",
+        "basket": "corbeille",
+        "threaten": "menacer",
+        "anger": "colère",
+        "back": "dos",
+        "flour": "farine",
+        "chip": "puce",
+        "behind": "derrière",
+        "Bangangte": "Bangangté",
+        "lightly scrape": "gratter légèrement",
+        "divide in two": "diviser en deux",
+        "kitchen": "cuisine",
+        "pillow": "oreiller",
+        "government": "gouvernement",
+        "ass": "cul",
+        "mirror": "miroir",
+        "remember": "se souvenir",
+        "gather": "rassembler",
+        "shiver": "grelotter",
+        "urine": "urine",
+        "show": "montrer",
+        "promise": "promesse",
+        "cabbage": "chou",
+        "rivalry": "rivalité",
+        "cut out": "se découper",
+        "complete": "compléter",
+        "daughter-in-law": "belle-fille",
+        "numerical rank indication": "indication du rang numérique",
+        "season": "saison",
+        "pay": "verser",
+        "you nasty ant": "espèce de fourmi méchante",
+        "core": "noyau",
+        "want": "vouloir",
+        "sting with a spear": "piquer avec une lance",
+        "diverted": "détourné",
+        "coagulated": "coagulé",
+        "put": "mettre",
+        "district manager": "chef de district",
+        "coo": "roucouler",
+        "twenty": "vingt",
+        "highest title": "titre le plus élevé",
+        "designate": "désigner",
+        "sharpen": "aiguiser",
+        "woven straw basket": "panier en paille tissé",
+        "log": "bûchette",
+        "clean": "nettoyer",
+        "male genitalia": "organe génital masculin",
+        "avoir de l'embon point": "avoir de l'embon point",
+        "understand": "comprendre",
+        "type of container": "sorte de récipient",
+        "left-handed": "gaucher",
+        "tender": "tendre",
+        "e-mail": "heur",
+        "call drum": "tambour d'appel",
+        "Bangam": "Bangam",
+        "sour": "aigre",
+        "impasse": "impasse",
+        "refusal": "refus",
+        "weeper": "pleureur",
+        "go over something": "passer par-dessus quelque chose",
+        "be scary because of the way they look": "être effrayant à cause du physique",
+        "what is": "qu'est-ce que",
+        "bones": "os",
+        "soy": "soja",
+        "burn": "brûler",
+        "once": "fois",
+        "test": "essai",
+        "vampire": "vampire",
+        "the one who steers": "celui qui barre",
+        "go round and round": "tourner en rond",
+        "be": "être",
+        "wrap": "enrouler",
+        "slander": "calomnier",
+        "deculper": "déculpeur",
+        "borrow": "emprunter",
+        "successor": "successeur",
+        "sock": "chaussette",
+        "gradually diminish": "dimuer peu à peu",
+        "tear": "déchirer",
+        "habits and customs": "us et coutume",
+        "miss": "manquer",
+        "clumsy": "maladroit",
+        "taro tuber": "tubercule de taro",
+        "avoid": "éviter",
+        "radio": "radio",
+        "bicycle": "bicyclette",
+        "be enough": "être assez",
+        "sweat": "sueur",
+        "appear": "paraître",
+        "email": "escritement",
+        "cloud": "nuage",
+        "probe": "sonder",
+        "make a mess": "mettre le désordre",
+        "crane (an animal)": "grue (un animal)",
+        "fv:ñwala' 'from above' is the high priest": "fv:ñwala' 'd'un haut' est le grand prêtre",
+        "poultry": "la volaille",
+        "stretch": "étirer",
+        "be impatient": "être impatient",
+        "vassal": "vassal",
+        "king of kings": "roi des rois",
+        "door": "porte",
+        "weigh well": "bien peser",
+        "bother": "se déranger",
+        "messy cutting": "couper en désordre",
+        "twig": "brindille",
+        "donation": "don",
+        "press": "presser",
+        "bring in livestock": "faire entrer le bétail",
+        "going from strength to strength": "aller du coq à l'âne",
+        "fasten": "ficeler",
+        "be far away": "être éloigné",
+        "devour": "dévorer",
+        "tie": "nouer",
+        "get the hell out": "ficher le camp",
+        "race": "course",
+        "corpse": "cadavre",
+        "baboon": "babouin",
+        "cause": "cause",
+        "face to face": "être face à face",
+        "tear into small pieces": "se déchirer en petits morceaux",
+        "grab": "s'accaparer",
+        "Diligently flatter": "Flatter diligemment",
+        "be mature": "être mûr",
+        "light (get) fire from another fireplace": "allumer le (se procurer du) feu à partir d'un autre foyer",
+        "motte": "motte",
+        "collect": "recueillir",
+        "pestle": "pilon",
+        "moon": "lune",
+        "massage with care": "masser avec soin",
+        "happy": "hàŋ hàŋŏ",
+        "believe": "croire",
+        "Ladies and Gentlemen.": "Mesdames et Messieurs les Députés.",
+        "throwing projectiles at each other": "se lancer des projectiles",
+        "compete": "rivaliser",
+        "long calabash": "calebasse longue",
+        "all-purpose boy and especially hard labor": "boy à tout faire et surtout les travaux forcés",
+        "mortar": "mortier",
+        "stutter": "bégayer",
+        "question": "questionner",
+        "magic to find a long-lost or hidden object": "magie pour retrouver un objet caché ou perdu depuis longtemps",
+        "enter": "saisir",
+        "shake several times": "secouer plusieurs fois",
+        "divide": "diviser",
+        "idiot": "idiot",
+        "pauvre homme": "pauvre homme",
+        "spirit": "esprit",
+        "warm up": "s'échauffer",
+        "go to the trouble": "se mettre en peine",
+        "yes": "oui",
+        "window": "fenêtre",
+        "buttock": "fesse",
+        "magic": "magie",
+        "set a trap": "tendre un piège",
+        "no": "aucun",
+        "knocking here and there": "cogner ça et là",
+        "breaker": "casseur",
+        "gari": "gari",
+        "gain weight": "prendre du poids",
+        "identity": "identité",
+        "wound": "plaie",
+        "premeditate": "préméditer",
+        "invade": "envahir",
+        "be fond": "être friand",
+        "crafts": "artisanat",
+        "travel": "voyage",
+        "exterminate": "exierminer",
+        "water dripping from roofs at night": "eau qui dégoutte des toits la nuit",
+        "vagabond": "vagabond",
+        "be proud": "être orgueilleux",
+        "hate": "haine",
+        "hush": "se taire",
+        "publish": "publier",
+        "have an accident": "subir un accident",
+        "sterile": "stérile",
+        "cobbler": "cordonnier",
+        "death": "mort",
+        "step-parent": "beau-parent",
+        "tutor": "tuteur",
+        "support with care": "étayer avec précaution",
+        "cab": "taxi",
+        "be noble": "être noble",
+        "mark": "marquer",
+        "be deep": "être profond",
+        "card game": "jeu de cartes",
+        "collect a lot of stuff": "amasser beaucoup de choses",
+        "pasty": "pâteux",
+        "bike": "vélo",
+        "shape": "façonner",
+        "submit": "remettre",
+        "be indifferent": "être indifférent",
+        "grass species": "espèce d'herbe",
+        "word": "parole",
+        "be gay": "être gai",
+        "lime": "chaux",
+        "pick here and there": "piquer ça et là",
+        "take care": "prendre soin",
+        "listen to": "écouter",
+        "remove from fire": "retirer du feu",
+        "fatten up": "grassir",
+        "succer": "succer",
+        "look on in awe": "regarder avec crainte",
+        "better": "mieux",
+        "female cricket": "grillon femelle",
+        "path": "chemin",
+        "dying": "agonisant",
+        "letter": "lettre",
+        "tapioca": "tapioca",
+        "prowl": "rôder",
+        "be pretentious": "être prétentieux",
+        "thick": "épais",
+        "swirl": "tourbillonner",
+        "even": "même",
+        "plum": "prunier",
+        "faucher": "faucher",
+        "cat": "chat",
+        "remove by rubbing": "enlever en frottant",
+        "blow several times": "souffler plusieurs fois",
+        "mosquito": "moustique",
+        "reheat": "rechauffer",
+        "hit": "frapper",
+        "seven": "sept",
+        "castrated ram": "bélier castré",
+        "smile": "sourire",
+        "merchandise": "marchandise",
+        "house floor": "sol de la maison",
+        "owner possessor": "propriétaire possesseur",
+        "axe": "hache",
+        "mountain": "montagne",
+        "escape": "s'enfuir",
+        "cut (branches)": "couper (les branches)",
+        "facherie": "facherie",
+        "heavy": "lourd",
+        "whistling": "siffotements",
+        "respond in favor": "répondre en faveur",
+        "profit": "profit",
+        "make preparations": "faire des préparatifs",
+        "desire": "désirer",
+        "bigger": "plus grand",
+        "trap": "piéger",
+        "create": "créer",
+        "secret place": "lieu secret",
+        "diligent": "diligenter",
+        "taste the goodies": "goûter aux friandises",
+        "very": "très",
+        "raffia": "raphia",
+        "be white": "être blanc",
+        "break into several pieces": "briser en plusieurs morceaux",
+        "sufficiency": "suffisance",
+        "making your way": "se frayer un chemin",
+        "share by splitting": "partager en fendant",
+        "tease": "taquiner",
+        "currency": "monnaie",
+        "laugh out loud": "rire aux éclats",
+        "predict": "prédire",
+        "panic": "s'affoler",
+        "be melancholy": "être mélancolique",
+        "be lucky": "être chanceux",
+        "whoring": "se prostituer",
+        "footwear worn for dancing": "parure portée au pied pour danser",
+        "be cold": "être froid",
+        "exhibition": "salon",
+        "refuse": "refuser",
+        "son-in-law": "beau-fils",
+        "heat up": "se chauffer",
+        "first day of the traditional week": "premier jour de la semaine traditionnelle",
+        "sparrowhawk": "épervier",
+        "bloom": "fleurir",
+        "cowries": "cauris",
+        "sacrament": "sacrement",
+        "separating people": "séparer les gens",
+        "banana hand": "main de banane",
+        "write": "écrire",
+        "capacity": "capacité",
+        "vase": "vase",
+        "game": "jeu",
+        "enfoncer": "enfoncer",
+        "héritier": "héritier",
+        "mais": "mais",
+        "the one who thanks": "celui qui remercie",
+        "endless": "interminable",
+        "make narrow": "rendre étroit",
+        "interweave": "entrecroiser",
+        "cemetery": "cimetière",
+        "be linked to": "être lié à",
+        "to": "vers",
+        "get to know": "connaître",
+        "refistoler": "raffistoler",
+        "conjuring trick": "tour de prestidigitation",
+        "push": "pousser",
+        "can": "bidon",
+        "farmer": "cultivateur",
+        "tiger cat": "chat-tigre",
+        "cough": "toux",
+        "milk": "lait",
+        "outcast": "paria",
+        "massage": "masser",
+        "squirrel": "écureuil",
+        "background": "fond",
+        "be injured": "être accidenté",
+        "fagot": "fagot",
+        "grow here and there": "croître ça et là",
+        "respectful' prince": "prince 'respectueux'",
+        "hook": "hameçon",
+        "look at themselves": "se regarder",
+        "morning": "matin",
+        "overexcite": "surexciter",
+        "indicate": "indiquer",
+        "ladle": "louche",
+        "knee": "genou",
+        "trunk": "tronc",
+        "greet": "saluer",
+        "title for a superior servant": "titre pour un serviteur supérieur",
+        "suffice": "suffir",
+        "earth": "terre",
+        "soak in liquid": "tremper dans un liquide",
+        "several steps": "plusieurs étapes",
+        "cabinet": "armoire",
+        "color": "couleur",
+        "vacation": "vacances",
+        "vote": "vote",
+        "impatience": "impatience",
+        "stirring up the quarrel on several occasions": "attiser la querelle à plusieurs reprises",
+        "or": "or",
+        "cock": "coq",
+        "Noun": "Noun",
+        "noon": "midi",
+        "cheap": "bon marché",
+        "tell a lie": "dire du mensonge",
+        "cloth": "chiffon",
+        "photo": "photo",
+        "be busy": "être occupé",
+        "destroy": "détruire",
+        "not": "pas",
+        "village": "village",
+        "be filled to the brim": "être rempli jusqu'au bord",
+        "strange being": "être étrange",
+        "pass a liquid": "passer un liquide",
+        "to know more about words": "avavncer des mots",
+        "pin": "épingle",
+        "fees": "frais",
+        "shelling (peanuts, pistachios, etc.), crushing": "décortiquer (les arachides, pistaches, etc.), concasser",
+        "be gallant": "être galant",
+        "franc": "franc",
+        "mutually": "mutuellement",
+        "church": "église",
+        "calabash": "calebasse",
+        "gradually decrease": "diminuer progressivement",
+        "take turns": "prendre tour à tour",
+        "sob": "sanglotter",
+        "studies": "études",
+        "carry by stick": "porter au moyen de bâton",
+        "carrying a heavy load": "porter péniblement une lourde charge",
+        "unceremoniously throwing a full bag on the ground": "jetter par terre sans ménagement un sac plein",
+        "lemon": "citron",
+        "honeymoon": "voyage de noce",
+        "vice": "vice",
+        "manioc": "manioc",
+        "snack": "goûter",
+        "te": "te",
+        "cricket": "criquet",
+        "habit": "habitude",
+        "title; in charge of one of Bandjoun's seven divisions, commanding district chiefs and vassal chiefs": "titre; responsable d'une des sept divisions de Bandjoun qui commande des chefs de quartiers et des chefs vassaux",
+        "that": "que",
+        "say goodbye": "dire aurevoir",
+        "talk": "s'entretenir",
+        "eye": "œil",
+        "sector": "secteur",
+        "buy retail": "acheter en détail",
+        "shaper": "façonneur",
+        "amar": "amar",
+        "buffalo": "buffle",
+        "choose": "choisir",
+        "loincloth": "pagne",
+        "one-eyed": "borgne",
+        "disclose": "divulguer",
+        "thorax": "thorax",
+        "bugle": "clairon",
+        "a saucepan": "d'une casserole",
+        "repel": "repousser",
+        "the roof": "le comble",
+        "grandparents' residence": "résidence des grandsparents",
+        "have already left": "être déjà parti",
+        "night": "nuit",
+        "paint": "peindre",
+        "thunder": "tonnerre",
+        "stutterer": "bègue",
+        "lament": "se lamenter",
+        "enduring": "endurant",
+        "servant": "serviteur",
+        "justice": "justice",
+        "fart": "péter",
+        "unnecessary": "inutile",
+        "ten": "dix",
+        "caisse": "caisse",
+        "prefect": "préfet",
+        "belt": "ceinture",
+        "hassle": "embêtement",
+        "lizard": "lézard",
+        "daughter": "fille",
+        "be dark": "être sombre",
+        "art": "art",
+        "cassava stick": "bâton de manioc",
+        "vestments": "habit d'apparat",
+        "stick": "bâton",
+        "cigarette": "cigarette",
+        "cover with earth": "couvrir de terre",
+        "repeatedly insult": "insulter à plusieurs reprises",
+        "half": "moitié",
+        "toie": "toie",
+        "fifty": "cinquante",
+        "detaching fibers from an assembly": "détacher les fibres d'un ensemble",
+        "animal": "animal",
+        "get drunk": "s'enivrer",
+        "be dishonest": "être malhonnête",
+        "pastor": "pasteur",
+        "victory": "victoire",
+        "plant": "planter",
+        "look": "regard",
+        "krîsi": "krîsi",
+        "burden": "fardeau",
+        "any alcoholic beverage": "toute boisson alcoolisée",
+        "hare": "lièvre",
+        "be able to": "être capable",
+        "assomer": "assomer",
+        "moron": "débile",
+        "be all dirty": "être tout sale",
+        "scale": "échelle",
+        "begin to mature": "commencer à mûrir",
+        "five": "cinq",
+        "pencil": "crayon",
+        "(Re)activating fire": "(ré)activer le feu",
+        "small fruit": "petit fruit",
+        "detail": "détailler",
+        "if it weren't": "si ce n'était",
+        "snore": "ronfler",
+        "anus": "anus",
+        "polemize": "polémiquer",
+        "hard": "dur",
+        "near": "près de",
+        "sow": "semer",
+        "hear": "entendre",
+        "eyes": "yeux",
+        "tear together": "déchirer ensemble",
+        "bark": "aboyer",
+        "white ant": "fourmi blanche",
+        "always": "toujours",
+        "lend": "prêter",
+        "white man": "homme blanc",
+        "give": "donner",
+        "fully": "pleinement",
+        "preferably": "de préférence",
+        "milking": "traire",
+        "cardboard": "carton",
+        "clothing": "vêtement",
+        "skirt": "jupe",
+        "smooth": "lisser",
+        "master": "maître",
+        "blade": "lame",
+        "spider": "araignée",
+        "bundle": "faire des paquets",
+        "pour": "se verser",
+        "chain bracelet": "gourmette",
+        "vice du chef": "vice du chef",
+        "get confused": "s'embrouiller",
+        "barred": "barré",
+        "land": "terrains",
+        "set of": "lot de",
+        "penknife": "canif",
+        "prostitute": "prostituée",
+        "grow slightly": "grossir légèrement",
+        "pick up one by one": "ramasser un à un",
+        "brand of the future": "marque du futur",
+        "rattan": "rotin",
+        "think carefully": "réfléchir minutieusement",
+        "liter": "litre",
+        "youth": "jeunesse",
+        "blow on": "souffler sur",
+        "udder": "mamelle",
+        "calm down": "se calmer",
+        "feather": "plume",
+        "a": "un",
+        "cassava couscous": "couscous de manioc",
+        "remove husks from certain fruits (corn, beans)": "enlever l'enveloppe de certains fruits (maïs, haricot)",
+        "get lost": "se perdre",
+        "dismiss": "éconduire",
+        "medication": "médicament",
+        "hedgehog": "hérisson",
+        "sketch out the sounds or steps of a well-known dance": "esquisser des sonorités ou des pas d'une danse connue",
+        "name of a western river": "nom d'un cours d'eau de l'Ouest",
+        "inventory": "inventaire",
+        "dissolve": "se dissoudre",
+        "already": "déjà",
+        "far": "loin",
+        "doctor blade": "racle",
+        "get on all fours": "aller à quatre pattes",
+        "cast-iron pot": "marmite en fonte",
+        "offender": "délinquant",
+        "fish species": "espèce de poisson",
+        "condiment": "condiment",
+        "lick here and there": "lécher ça et là",
+        "from the grassfield": "originaire du grassfield",
+        "hairstyle": "coiffure",
+        "caterpillar": "chenille",
+        "ingredient": "ingrédient",
+        "swallow a lot and fast": "avaler beaucoup de choses et vite",
+        "kilogram": "kilogramme",
+        "foot": "pied",
+        "seize": "s'emparer de",
+        "dance": "danser",
+        "condemn evil": "condamner le mal",
+        "arrange": "disposer",
+        "vinegar": "vinaigre",
+        "ghost": "fantôme",
+        "get fat": "devenir gros",
+        "heritage": "héritage",
+        "sulk": "bouder",
+        "get around": "se déplacer",
+        "abyss": "abîme",
+        "split": "fendre",
+        "hurt": "blesser",
+        "torch": "torche",
+        "be broken": "être cassé",
+        "be heavy": "être lourd",
+        "ornaments": "parures",
+        "best": "meilleur",
+        "peck": "picorer",
+        "thorn": "épine",
+        "plow": "labourer",
+        "kulâŋ": "kulâŋ",
+        "stumble": "trébucher",
+        "corn": "maïs",
+        "not having a share in a partition": "ne pas avoir sa part dans un partage",
+        "crocodile": "crocodile",
+        "bear fruit": "porter des fruits",
+        "prince": "prince",
+        "be yellow": "être jaune",
+        "weave lightly": "tisser légèrement",
+        "being a beggar": "être mendiant",
+        "bishop": "évêque"
     }
 }
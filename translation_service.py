@@ -0,0 +1,1287 @@
+from aho_corasick import AhoCorasickAutomaton
+from compiled_dictionary import CompiledDictionary, CompiledDictionaryFile, content_hash, snapshot_hash
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import cached_property, partial
+from key_trie import KeyTrie
+from Levenshtein import distance as edit_distance
+from lookup_cache import LookupCache, NegativeLookupCache
+from pair_registry import PairRegistry
+from phrase_segmenter import PhraseTrie, segment, tokenize
+from prefix_index import PrefixIndex
+from pivot_router import LanguageGraph, compose_route, route_pair_keys, translate_senses
+from reverse_index import ReverseIndex
+from scoring_engines import get_scoring_engine
+from symspell_index import SymSpellIndex
+from text_normalization import ORTHOGRAPHY_FOLDING, fold_key, fold_orthography, fold_with_offsets
+from trigram_index import TrigramIndex
+import hashlib
+import importlib
+import json
+import logging
+import os
+import threading
+import time
+import unicodedata
+
+logger = logging.getLogger(__name__)
+
+# Minimum WRatio score for a fuzzy match to be returned
+FUZZY_SCORE_THRESHOLD = 30
+
+# Scorer used by the fuzzy and typo paths, chosen with the FUZZY_ENGINE
+# environment variable ('fuzzywuzzy' or 'rapidfuzz')
+SCORING_ENGINE = get_scoring_engine()
+
+# Match modes a client can select for the non-exact lookup ('segment'
+# translates a sentence phrase by phrase)
+MATCH_MODES = ('fuzzy', 'typo', 'segment')
+
+# Candidate generators for the fuzzy branch: the trigram shortlist, or the
+# keys within AUTOMATON_MAX_DISTANCE edits found by walking the key trie
+FUZZY_BACKENDS = ('trigram', 'automaton')
+DEFAULT_FUZZY_BACKEND = 'trigram'
+AUTOMATON_MAX_DISTANCE = 2
+
+# Largest number of alternatives a client can ask for
+MAX_ALTERNATIVES = 10
+
+# Query types of the key search endpoint
+SEARCH_MODES = ('wildcard', 'prefix', 'fuzzy')
+
+# Largest number of items accepted by /api/translate/batch
+MAX_BATCH_ITEMS = 1000
+
+# A batch's misses are scored together against the union of their
+# shortlists only while the union is at most this many times larger than the
+# shortlists themselves; past that, scoring each shortlist is cheaper
+BATCH_UNION_FACTOR = 2
+
+# Largest number of completions /api/suggest returns
+MAX_SUGGESTIONS = 50
+
+# Results of the typo and fuzzy paths, keyed by (dict_key, text, match mode,
+# backend, number of alternatives)
+LOOKUP_CACHE = LookupCache(
+    max_size=int(os.environ.get('LOOKUP_CACHE_SIZE', 10000)),
+    ttl=float(os.environ.get('LOOKUP_CACHE_TTL', 3600))
+)
+
+# Generated Python dictionaries, and the snapshot written next to them by
+# excel_dict_to_py_dict.py (or compiled_dictionary.py)
+DICTIONARY_MODULE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'translation_dictionaries.py')
+DICTIONARY_SNAPSHOT_PATH = os.path.join(os.path.dirname(DICTIONARY_MODULE_PATH), 'translation_dictionaries.gdict')
+
+
+def _compiled_dictionaries_path():
+    # COMPILED_DICTIONARIES names the snapshot to load ('' imports the Python
+    # module); otherwise the default snapshot is used unless it is older than
+    # the module, i.e. was not rebuilt with it
+    path = os.environ.get('COMPILED_DICTIONARIES')
+    if path is not None:
+        return path or None
+
+    if not os.path.exists(DICTIONARY_SNAPSHOT_PATH):
+        return None
+    if (os.path.exists(DICTIONARY_MODULE_PATH)
+            and os.path.getmtime(DICTIONARY_MODULE_PATH) > os.path.getmtime(DICTIONARY_SNAPSHOT_PATH)):
+        logger.warning("Ignoring %s, older than %s", DICTIONARY_SNAPSHOT_PATH, DICTIONARY_MODULE_PATH)
+        return None
+    return DICTIONARY_SNAPSHOT_PATH
+
+
+# When set, dictionaries are mapped from this snapshot instead of importing
+# translation_dictionaries, and indexes are only built when first used
+COMPILED_DICTIONARIES_PATH = _compiled_dictionaries_path()
+
+# Language pairs are built on first use unless LAZY_PAIRS is '0', and
+# unloaded after PAIR_IDLE_SECONDS without use (0 keeps them loaded)
+LAZY_PAIRS = os.environ.get('LAZY_PAIRS', '1') != '0'
+PAIR_IDLE_SECONDS = float(os.environ.get('PAIR_IDLE_SECONDS', 0))
+
+# Seconds between checks of the dictionary source file by
+# start_dictionary_watcher (0 disables it)
+DICTIONARY_WATCH_SECONDS = float(os.environ.get('DICTIONARY_WATCH_SECONDS', 0))
+
+# Pivot pairs (no dictionary of their own) composed into a dictionary at
+# startup, comma-separated; other pivot pairs are translated hop by hop
+MATERIALIZED_PIVOT_PAIRS = [
+    dict_key.strip()
+    for dict_key in os.environ.get('MATERIALIZED_PIVOT_PAIRS', '').split(',')
+    if dict_key.strip()
+]
+
+# Lookups known to score below FUZZY_SCORE_THRESHOLD, so that repeated misses
+# skip the typo and fuzzy paths
+NEGATIVE_CACHE = NegativeLookupCache(max_bytes=int(os.environ.get('NEGATIVE_CACHE_BYTES', 1024 * 1024)))
+
+
+def reverse_pair_key(dict_key):
+    """Return the opposite direction of a language pair, e.g. 'ghomala-english' for 'english-ghomala'"""
+    source_lang, target_lang = dict_key.split('-', 1)
+    return f"{target_lang}-{source_lang}"
+
+
+def pivot_match_type(senses):
+    """
+    Return the matchType of a text found exactly in the first dictionary of
+    a pivot route.
+
+    A pivot language word often stands for many words of the target language
+    (the Ghomala "cú" is gutter, bad, remove and stop), so a route fanning
+    out to several senses gives candidates rather than a translation.
+
+    Args:
+        senses (list): Translations at the end of the route
+
+    Returns:
+        str: 'exact' for a single sense, 'ambiguous' otherwise
+    """
+    return 'exact' if len(senses) == 1 else 'ambiguous'
+
+
+class PairIndex:
+    """
+    Dictionary of a language pair together with its lookup indexes.
+
+    Indexes are built the first time they are used, so a pair only pays for
+    the lookups it serves; build_all() builds them up front.
+    """
+
+    LAZY_INDEXES = ('trigrams', 'typos', 'key_trie', 'phrases', 'prefixes', 'toneless_keys', 'annotator')
+
+    def __init__(self, dictionary, pivot_languages=None, orthography=None, pivot_senses=None):
+        self.dictionary = dictionary
+        # Reverse directions can translate a key in several ways
+        self.multi_sense = isinstance(dictionary, ReverseIndex)
+        # Intermediate languages of a composed pivot pair, and every
+        # translation of its keys (the dictionary joins them with ", ")
+        self.pivot_languages = pivot_languages
+        self.pivot_senses = pivot_senses
+        # Folding table of the source language, see toneless_keys
+        self.orthography = orthography
+        # Folded key -> original key, so that "easter" finds "Easter" without
+        # fuzzy search; compiled dictionaries look it up in the mapped file
+        if isinstance(dictionary, CompiledDictionary):
+            self.folded_keys = dictionary.folded_keys
+        else:
+            self.folded_keys = {}
+            for key in dictionary:
+                self.folded_keys.setdefault(fold_key(key), key)
+
+    @cached_property
+    def trigrams(self):
+        return TrigramIndex(self.dictionary.keys())
+
+    @cached_property
+    def typos(self):
+        return SymSpellIndex(self.dictionary.keys())
+
+    @cached_property
+    def key_trie(self):
+        return KeyTrie(self.dictionary.keys())
+
+    @cached_property
+    def phrases(self):
+        return PhraseTrie(self.dictionary.keys())
+
+    @cached_property
+    def prefixes(self):
+        # Every limit /api/suggest accepts is read from the precomputed completions
+        return PrefixIndex(self.dictionary.keys(), top_k=MAX_SUGGESTIONS)
+
+    @cached_property
+    def toneless_keys(self):
+        """Tone- and orthography-folded key -> original keys, on pairs whose
+        source language has an ORTHOGRAPHY_FOLDING table (None otherwise)"""
+        if self.orthography is None:
+            return None
+
+        toneless_keys = {}
+        for key in self.dictionary:
+            toneless_keys.setdefault(fold_orthography(key, self.orthography), []).append(key)
+        return toneless_keys
+
+    @cached_property
+    def annotator(self):
+        return AhoCorasickAutomaton(list(self.folded_keys.items()))
+
+    @cached_property
+    def exact_responses(self):
+        """Folded key -> encoded body of its exact-hit response, filled as keys
+        are hit (see translation_api.exact_response_body)"""
+        return {}
+
+    def build_all(self):
+        """Build every index now rather than on first use"""
+        self.build(self.LAZY_INDEXES)
+
+    def build(self, names):
+        """Build the named indexes now rather than on first use"""
+        for name in names:
+            getattr(self, name)
+
+    def built_indexes(self):
+        """Return the names of the indexes built so far"""
+        return [name for name in self.LAZY_INDEXES if name in self.__dict__]
+
+    def add(self, source_text, target_text):
+        """Add an entry to the dictionary and to every index"""
+        self.dictionary[source_text] = target_text
+        self.index_key(source_text)
+
+    def index_key(self, key):
+        """Add a key already present in the dictionary to every index"""
+        self.folded_keys[fold_key(key)] = key
+
+        # Indexes that are not built yet will include the key when they are
+        built = self.__dict__
+        for name in ('trigrams', 'typos', 'key_trie', 'phrases', 'prefixes'):
+            if name in built:
+                built[name].add(key)
+
+        if built.get('toneless_keys') is not None:
+            originals = built['toneless_keys'].setdefault(fold_orthography(key, self.orthography), [])
+            if key not in originals:
+                originals.append(key)
+
+        if 'annotator' in built:
+            # Readers keep using the previous automaton until the new one is complete
+            self.annotator = AhoCorasickAutomaton(list(self.folded_keys.items()))
+
+        # A new key can change the senses of other keys on reverse directions
+        built.pop('exact_responses', None)
+
+    def senses(self, key):
+        """Return every translation of a key"""
+        if self.multi_sense:
+            return self.dictionary.senses(key)
+        if self.pivot_senses is not None:
+            return self.pivot_senses[key]
+        return [self.dictionary[key]]
+
+    def translation_fields(self, key):
+        """Return the response fields translating a key: its translation and, on
+        reverse directions and pivot pairs, the list of all its senses"""
+        fields = {'translation': self.dictionary[key]}
+        if self.multi_sense or self.pivot_languages:
+            fields['senses'] = self.senses(key)
+        if self.pivot_languages:
+            fields['pivotLanguages'] = self.pivot_languages
+        return fields
+
+    def exact_match_type(self, key):
+        """Return the matchType of an exact hit on a key: 'ambiguous' when a
+        pivot pair translates it in several ways, 'exact' otherwise"""
+        return pivot_match_type(self.senses(key)) if self.pivot_languages else 'exact'
+
+
+def load_dictionaries(reload=False):
+    """
+    Load the dictionaries of every direct language pair.
+
+    Args:
+        reload (bool): Re-import translation_dictionaries rather than reuse the
+            module already imported
+
+    Returns:
+        tuple: (language pair -> {source text: translation}, language pair ->
+        content hash); dictionaries are CompiledDictionary mappings when
+        COMPILED_DICTIONARIES_PATH is set
+    """
+    if COMPILED_DICTIONARIES_PATH:
+        compiled = CompiledDictionaryFile(COMPILED_DICTIONARIES_PATH)
+        logger.info("Mapped dictionary snapshot %s from %s", compiled.content_hash[:12], COMPILED_DICTIONARIES_PATH)
+        dictionaries = {dict_key: compiled.open_pair(dict_key) for dict_key in compiled.pairs}
+        return dictionaries, {dict_key: compiled.pair_hash(dict_key) for dict_key in compiled.pairs}
+
+    import translation_dictionaries
+    if reload:
+        importlib.reload(translation_dictionaries)
+    dictionaries = translation_dictionaries.TEMPORARY_DICTIONARIES
+    return dictionaries, {dict_key: content_hash(dictionary) for dict_key, dictionary in dictionaries.items()}
+
+
+def source_orthography(dict_key):
+    """Return the ORTHOGRAPHY_FOLDING table of the pair's source language, if it has one"""
+    return ORTHOGRAPHY_FOLDING.get(dict_key.split('-', 1)[0])
+
+
+def load_pair_index(dict_key, dictionary, reverse=False):
+    """
+    Build the PairIndex of a language pair.
+
+    Args:
+        dict_key (str): Language pair, e.g. 'english-ghomala'
+        dictionary (dict): Dictionary of the pair, or of its forward direction if `reverse`
+        reverse (bool): Index the reverse direction of the dictionary
+
+    Returns:
+        PairIndex: Index of the pair
+    """
+    if reverse:
+        dictionary = ReverseIndex(dictionary)
+    pair_index = PairIndex(dictionary, orthography=source_orthography(dict_key))
+    _build_indexes(pair_index)
+    logger.info("Indexed %d entries for %s", len(dictionary), dict_key)
+    return pair_index
+
+
+def _build_indexes(pair_index):
+    # Python dictionaries get every index at load time (so that a preloading
+    # server shares them with its workers); compiled ones build them on first use
+    if not COMPILED_DICTIONARIES_PATH:
+        pair_index.build_all()
+
+
+def build_pair_indexes(dictionaries):
+    """
+    Register the lookup indexes of every language pair, built on first use.
+
+    Each pair also gets its reverse direction (e.g. 'ghomala-english' for
+    'english-ghomala') unless it exists as a dictionary of its own. Reverse
+    directions are ReverseIndex views over the forward dictionary, not copies.
+
+    Args:
+        dictionaries (dict): Language pair -> {source text: translation}
+
+    Returns:
+        PairRegistry: Language pair -> PairIndex
+    """
+    pair_indexes = PairRegistry(idle_seconds=PAIR_IDLE_SECONDS)
+    for dict_key, dictionary in dictionaries.items():
+        pair_indexes.register(dict_key, partial(load_pair_index, dict_key, dictionary))
+
+    for dict_key, dictionary in dictionaries.items():
+        reverse_key = reverse_pair_key(dict_key)
+        if reverse_key not in pair_indexes:
+            pair_indexes.register(reverse_key, partial(load_pair_index, reverse_key, dictionary, reverse=True))
+
+    return pair_indexes
+
+
+def build_pivot_pair(pair_indexes, route):
+    """
+    Compose the dictionaries along a pivot route into a pair of its own.
+
+    Args:
+        pair_indexes (dict): Language pair -> PairIndex of the direct pairs
+        route (list): Languages of the route, e.g. ['english', 'ghomala', 'french']
+
+    Returns:
+        PairIndex: Index of the composed dictionary
+    """
+    composed = compose_route([pair_indexes[dict_key] for dict_key in route_pair_keys(route)])
+    pair_index = PairIndex(
+        {key: ', '.join(senses) for key, senses in composed.items()},
+        pivot_languages=route[1:-1],
+        pivot_senses=composed
+    )
+    _build_indexes(pair_index)
+    logger.info("Composed %d entries for %s-%s", len(composed), route[0], route[-1])
+    return pair_index
+
+
+class DictionaryGeneration:
+    """
+    One published set of dictionaries: the indexes of every language pair,
+    the routes between languages and the content hashes of the dictionaries
+    they were built from.
+
+    reload_dictionaries builds a new generation next to the current one and
+    publishes it by swapping a single reference. Requests that pinned the
+    previous generation finish on it; it is freed with its last reference.
+    """
+
+    def __init__(self, number, dictionaries, pair_hashes):
+        """
+        Args:
+            number (int): Generation number, 1 for the dictionaries loaded at startup
+            dictionaries (dict): Language pair -> {source text: translation}
+            pair_hashes (dict): Language pair -> content hash of its dictionary
+        """
+        self.number = number
+        self.dictionaries = dictionaries
+        self.pair_hashes = pair_hashes
+        self.content_hash = snapshot_hash(pair_hashes)
+        self.created_at = time.time()
+        self.pair_indexes = build_pair_indexes(dictionaries)
+
+        # Every translatable pair with its route through the dictionaries; pairs
+        # without a dictionary of their own go through pivot languages
+        self.language_routes = LanguageGraph(self.pair_indexes).routes()
+        self.pivot_routes = {
+            dict_key: route for dict_key, route in self.language_routes.items() if dict_key not in self.pair_indexes
+        }
+
+        for dict_key in MATERIALIZED_PIVOT_PAIRS:
+            if dict_key in self.pivot_routes:
+                self.pair_indexes.register(
+                    dict_key, partial(build_pivot_pair, self.pair_indexes, self.pivot_routes[dict_key])
+                )
+
+        # (language pair, source text, translation) added with add_translation,
+        # replayed on the next generation
+        self.contributions = []
+        # Pairs changed by contributions since the generation was built
+        self.changed_pairs = set()
+        # Dictionary -> hash of the contributions it got, in order
+        self.revisions = {}
+        # Pair -> number of contributions that changed it, part of its lookup
+        # cache keys
+        self.pair_changes = {}
+
+    def pair_sources(self, dict_key):
+        """Return the (dictionary, content hash) a registered pair is built from, in route order"""
+        if dict_key in self.pair_hashes:
+            return ((dict_key, self.pair_hashes[dict_key]),)
+
+        reverse_key = reverse_pair_key(dict_key)
+        if reverse_key in self.pair_hashes:
+            return ((reverse_key, self.pair_hashes[reverse_key]),)
+
+        route = self.pivot_routes[dict_key]
+        return tuple(source for hop_key in route_pair_keys(route) for source in self.pair_sources(hop_key))
+
+    def summary(self):
+        """Return the number, content hash and creation time of the generation"""
+        return {'number': self.number, 'contentHash': self.content_hash, 'createdAt': self.created_at}
+
+
+_generation = DictionaryGeneration(1, *load_dictionaries())
+if not LAZY_PAIRS:
+    _generation.pair_indexes.load_all()
+
+# Serializes reloads and contributions; lookups never take it
+_generation_lock = threading.Lock()
+
+# Generation pinned by the running request, see pinned_generation
+_pinned_generation = ContextVar('pinned_generation', default=None)
+
+_dictionary_watcher = None
+
+
+def current_generation():
+    """
+    Return the generation pinned by the running request, or else the one
+    currently published.
+
+    Lookups made outside a pinned request each read the latest generation,
+    so a series of them may span a reload.
+    """
+    return _pinned_generation.get() or _generation
+
+
+def pin_generation():
+    """
+    Pin the current generation for the rest of the request, so that all its
+    lookups see the same dictionaries even if a reload publishes new ones.
+    Nested pins keep the outer one.
+
+    Returns:
+        Token: To pass to unpin_generation
+    """
+    return _pinned_generation.set(current_generation())
+
+
+def unpin_generation(token):
+    """Release the generation pinned by pin_generation"""
+    _pinned_generation.reset(token)
+
+
+@contextmanager
+def pinned_generation():
+    """Context manager pinning the current generation, yielding it"""
+    token = pin_generation()
+    try:
+        yield _pinned_generation.get()
+    finally:
+        unpin_generation(token)
+
+
+def reload_dictionaries():
+    """
+    Rebuild the dictionaries and their indexes from their source file and
+    publish them.
+
+    The new generation is built while requests keep being served by the
+    current one. Pairs whose dictionaries and routes have the same content
+    hashes, and got no contributions, are taken over as they are; the other
+    pairs loaded in the current generation are rebuilt with the same indexes
+    before publishing, so that no request pays for the build. Contributions
+    are replayed on the new dictionaries. If loading fails, the current
+    generation stays published.
+
+    Returns:
+        dict: Published generation, with the pairs reused and rebuilt and the
+        reload time
+    """
+    global _generation
+
+    start = time.perf_counter()
+    with _generation_lock:
+        previous = _generation
+        dictionaries, pair_hashes = load_dictionaries(reload=True)
+
+        # Dictionaries with unchanged content are taken over as objects, so that
+        # the pairs reused below and the loaders of the new generation (which
+        # rebuild pairs unloaded when idle) share them, along with the
+        # contributions made after the reload
+        dictionaries = {
+            dict_key: previous.dictionaries[dict_key]
+            if dict_key not in previous.changed_pairs and previous.pair_hashes.get(dict_key) == pair_hash
+            else dictionaries[dict_key]
+            for dict_key, pair_hash in pair_hashes.items()
+        }
+        generation = DictionaryGeneration(previous.number + 1, dictionaries, pair_hashes)
+
+        reused = []
+        rebuilt = []
+        for dict_key, pair_index in previous.pair_indexes.loaded_items():
+            if dict_key not in generation.pair_indexes:
+                continue
+            if dict_key not in previous.changed_pairs and \
+                    previous.pair_sources(dict_key) == generation.pair_sources(dict_key):
+                generation.pair_indexes.adopt(dict_key, pair_index)
+                reused.append(dict_key)
+            else:
+                rebuilt.append((dict_key, pair_index.built_indexes()))
+
+        for contribution in previous.contributions:
+            _add_translation(generation, *contribution)
+        generation.contributions = list(previous.contributions)
+
+        for dict_key, index_names in rebuilt:
+            generation.pair_indexes[dict_key].build(index_names)
+        if not LAZY_PAIRS:
+            generation.pair_indexes.load_all()
+
+        _generation = generation
+
+    # Cached results of every pair that was not taken over may be stale
+    for dict_key in set(previous.pair_indexes) | set(generation.pair_indexes):
+        if dict_key not in reused:
+            _invalidate_pair(dict_key)
+
+    seconds = time.perf_counter() - start
+    logger.info("Published dictionary generation %d (%s) in %.2f s: %d pairs reused, %d rebuilt",
+                generation.number, generation.content_hash[:12], seconds, len(reused), len(rebuilt))
+    return {
+        'generation': generation.summary(),
+        'reusedPairs': sorted(reused),
+        'rebuiltPairs': sorted(dict_key for dict_key, _ in rebuilt),
+        'seconds': round(seconds, 4)
+    }
+
+
+def preload_dictionaries():
+    """
+    Load every language pair of the current generation with all of its
+    indexes, whether the dictionaries come from the Python module or from a
+    compiled snapshot (whose indexes are otherwise built on first use).
+
+    Returns:
+        int: Number of pairs loaded
+    """
+    pair_indexes = current_generation().pair_indexes
+    pair_indexes.load_all()
+    loaded = pair_indexes.loaded_items()
+    for _, pair_index in loaded:
+        pair_index.build_all()
+    return len(loaded)
+
+
+def dictionary_source_path():
+    """Return the file the dictionaries are loaded from"""
+    return COMPILED_DICTIONARIES_PATH or DICTIONARY_MODULE_PATH
+
+
+def start_dictionary_watcher(interval=DICTIONARY_WATCH_SECONDS):
+    """
+    Start a daemon thread reloading the dictionaries whenever their source
+    file changes. Each serving process runs its own, started after forking.
+
+    Args:
+        interval (float): Seconds between checks of the file (0 does nothing)
+
+    Returns:
+        threading.Thread: Watcher thread, or None if disabled
+    """
+    global _dictionary_watcher
+
+    if not interval:
+        return None
+    if _dictionary_watcher is not None and _dictionary_watcher.is_alive():
+        return _dictionary_watcher
+
+    def modified_time():
+        try:
+            return os.stat(dictionary_source_path()).st_mtime_ns
+        except OSError:
+            return None
+
+    def watch():
+        last_modified = modified_time()
+        while True:
+            time.sleep(interval)
+            modified = modified_time()
+            if modified is None or modified == last_modified:
+                continue
+            last_modified = modified
+            try:
+                reload_dictionaries()
+            except Exception as e:
+                # A file caught mid-write is retried when its next write changes the time
+                logger.error("Error reloading dictionaries: %s", e)
+
+    _dictionary_watcher = threading.Thread(target=watch, name='dictionary-watcher', daemon=True)
+    _dictionary_watcher.start()
+    logger.info("Watching %s every %s s", dictionary_source_path(), interval)
+    return _dictionary_watcher
+
+
+def add_translation(dict_key, source_text, target_text):
+    """
+    Add a validated entry to a language pair.
+
+    The pair's indexes are updated in place and its cached lookup results
+    and misses are dropped, since the new key can change any fuzzy answer of
+    the pair. The same happens to its reverse direction; contributions to a
+    reverse direction are stored in the forward dictionary. Contributions
+    are kept across reloads.
+
+    Args:
+        dict_key (str): Language pair, e.g. 'english-ghomala'
+        source_text (str): Source-side text
+        target_text (str): Translation
+
+    Returns:
+        bool: False if the language pair is not supported
+    """
+    with _generation_lock:
+        if not _add_translation(_generation, dict_key, source_text, target_text):
+            return False
+        _generation.contributions.append((dict_key, source_text, target_text))
+        return True
+
+
+def _add_translation(generation, dict_key, source_text, target_text):
+    pair_indexes = generation.pair_indexes
+    if dict_key not in pair_indexes:
+        return False
+
+    pair_index = pair_indexes[dict_key]
+    if pair_index.pivot_languages:
+        return False
+
+    if pair_index.multi_sense:
+        return _add_translation(generation, reverse_pair_key(dict_key), target_text, source_text)
+
+    contribution = json.dumps([generation.revisions.get(dict_key, ''), source_text, target_text])
+    generation.revisions[dict_key] = hashlib.sha256(contribution.encode('utf-8')).hexdigest()
+
+    previous_value = pair_index.dictionary.get(source_text)
+    pair_index.add(source_text, target_text)
+    _invalidate_pair(dict_key)
+    logger.info("Added '%s' to %s", source_text, dict_key)
+
+    # A reverse direction that is not loaded will be built from the updated
+    # forward dictionary when needed
+    reverse_key = reverse_pair_key(dict_key)
+    if pair_indexes.is_loaded(reverse_key) and pair_indexes[reverse_key].multi_sense:
+        reverse_index = pair_indexes[reverse_key]
+        reverse_index.dictionary.add(source_text, target_text, previous_value)
+        if previous_value is not None and previous_value not in reverse_index.dictionary:
+            # The old translation lost its last sense; indexes cannot drop keys
+            pair_indexes.unload(reverse_key)
+        else:
+            reverse_index.index_key(target_text)
+    _invalidate_pair(reverse_key)
+
+    # Composed pivot pairs going through either direction are recomposed on next use
+    changed_keys = {dict_key, reverse_key}
+    for pivot_key, route in generation.pivot_routes.items():
+        if pivot_key in pair_indexes and changed_keys.intersection(route_pair_keys(route)):
+            pair_indexes.unload(pivot_key)
+            _invalidate_pair(pivot_key)
+            changed_keys.add(pivot_key)
+
+    generation.changed_pairs.update(changed_keys)
+    # Counted once the indexes are updated: a lookup that read the previous
+    # count may have seen the old entries, and its result is keyed with it
+    for changed_key in changed_keys:
+        generation.pair_changes[changed_key] = generation.pair_changes.get(changed_key, 0) + 1
+    return True
+
+
+def _invalidate_pair(dict_key):
+    LOOKUP_CACHE.invalidate_pair(dict_key)
+    NEGATIVE_CACHE.reset_pair(dict_key)
+
+
+def _cache_key(generation, dict_key, *lookup):
+    # Results are keyed with the data of the pair they were computed from, so
+    # that a request still pinned to a previous generation, or racing a
+    # contribution to the pair, cannot store a result that later lookups would
+    # be served after the pair was invalidated
+    return (dict_key, generation.number, generation.pair_changes.get(dict_key, 0)) + lookup
+
+
+def is_supported_pair(dict_key):
+    """Return True if the language pair (forward or reverse) can be translated"""
+    return dict_key in current_generation().pair_indexes
+
+
+def is_pair_loaded(dict_key):
+    """Return True if the pair's indexes are loaded, i.e. looking it up will not build it"""
+    return current_generation().pair_indexes.is_loaded(dict_key)
+
+
+def needs_pivot(dict_key):
+    """Return True if the pair has no dictionary and is translated hop by hop through pivot languages"""
+    generation = current_generation()
+    return dict_key in generation.pivot_routes and dict_key not in generation.pair_indexes
+
+
+def language_routes():
+    """Return every translatable pair with the languages of its route"""
+    return current_generation().language_routes
+
+
+def pair_version(dict_key):
+    """
+    Return the version of a translatable pair's data: it changes when a
+    dictionary on the pair's route is reloaded with other content or gets a
+    contribution, and is the same in every process serving the same data.
+
+    Args:
+        dict_key (str): Language pair, with a dictionary or a pivot route
+
+    Returns:
+        str: Hex digest
+    """
+    generation = current_generation()
+    sources = [
+        [source_key, source_hash, generation.revisions.get(source_key, '')]
+        for source_key, source_hash in generation.pair_sources(dict_key)
+    ]
+    version = json.dumps([dict_key, generation.language_routes.get(dict_key), sources])
+    return hashlib.sha256(version.encode('utf-8')).hexdigest()[:32]
+
+
+def get_dictionary(dict_key):
+    """Return the source text -> translation mapping of a language pair"""
+    return current_generation().pair_indexes[dict_key].dictionary
+
+
+def translation_fields(dict_key, key):
+    """Return the translation response fields of a dictionary key"""
+    return current_generation().pair_indexes[dict_key].translation_fields(key)
+
+
+def exact_match_type(dict_key, key):
+    """Return the matchType of an exact hit on a dictionary key, see PairIndex.exact_match_type"""
+    return current_generation().pair_indexes[dict_key].exact_match_type(key)
+
+
+def exact_responses(dict_key):
+    """Return the pair's table of encoded exact-hit response bodies, by folded key"""
+    return current_generation().pair_indexes[dict_key].exact_responses
+
+
+def exact_match(dict_key, text):
+    """
+    Find the dictionary key equal to the text once both are folded.
+
+    Args:
+        dict_key (str): Language pair, e.g. 'english-ghomala'
+        text (str): Folded text to look up
+
+    Returns:
+        str: Original dictionary key, or None if there is no exact match
+    """
+    return current_generation().pair_indexes[dict_key].folded_keys.get(text)
+
+
+def toneless_match(dict_key, text):
+    """
+    Resolve a text typed without tones or special letters.
+
+    Returns:
+        dict: Response fields of the closest toned form (translation,
+        matchType, matchedWord) with every toned form listed in 'tonedForms',
+        or None if the text has no toned form
+    """
+    toned_forms = toneless_matches(dict_key, text)
+    if not toned_forms:
+        return None
+
+    pair_index = current_generation().pair_indexes[dict_key]
+    matched_word = toned_forms[0][0]
+    return {
+        **pair_index.translation_fields(matched_word),
+        'matchType': 'toneless',
+        'matchedWord': matched_word,
+        'tonedForms': [
+            {'matchedWord': key, **pair_index.translation_fields(key), 'editDistance': distance}
+            for key, distance in toned_forms
+        ]
+    }
+
+
+def toneless_matches(dict_key, text):
+    """
+    Find the keys that only differ from the text by tones and special letters,
+    e.g. "ca" -> "cá", "caà"... on Ghomala-source pairs.
+
+    Args:
+        dict_key (str): Language pair, e.g. 'ghomala-english'
+        text (str): Folded text to look up
+
+    Returns:
+        list: (original key, edit distance to the text) tuples, closest first
+        and in dictionary order on ties; empty if the pair has no folding table
+    """
+    pair_index = current_generation().pair_indexes[dict_key]
+    if pair_index.toneless_keys is None:
+        return []
+
+    originals = pair_index.toneless_keys.get(fold_orthography(text, pair_index.orthography), [])
+    matches = [(key, edit_distance(text, fold_key(key))) for key in originals]
+    return sorted(matches, key=lambda match: match[1])
+
+
+def find_match(dict_key, text, match_mode='fuzzy', fuzzy_backend=DEFAULT_FUZZY_BACKEND, alternatives=0):
+    """
+    Resolve a text that has no exact match with the typo and fuzzy paths.
+
+    Results and misses are cached per language pair and generation of the
+    dictionaries, until the pair's dictionary changes.
+
+    Args:
+        dict_key (str): Language pair, e.g. 'english-ghomala'
+        text (str): Normalized text to look up
+        match_mode (str): One of MATCH_MODES
+        fuzzy_backend (str): One of FUZZY_BACKENDS
+        alternatives (int): Number of best candidates to list in an
+            'alternatives' field (none if 0)
+
+    Returns:
+        dict: Response fields (translation, matchType, matchedWord and the
+        score or edit distance), or None if nothing matches
+    """
+    generation = current_generation()
+    cache_key = _cache_key(generation, dict_key, text, match_mode, fuzzy_backend, alternatives)
+    result = LOOKUP_CACHE.get(cache_key)
+    if result is not None:
+        return result
+
+    if NEGATIVE_CACHE.contains(cache_key):
+        return None
+
+    pair_index = generation.pair_indexes[dict_key]
+
+    # In typo mode, try correcting a one- or two-character typo first
+    if match_mode == 'typo':
+        matches = typo_matches(dict_key, text, max(alternatives, 1))
+        if matches:
+            best_match, distance = matches[0]
+            result = {
+                **pair_index.translation_fields(best_match),
+                'matchType': 'typo',
+                'editDistance': distance,
+                'matchedWord': best_match
+            }
+            if alternatives:
+                result['alternatives'] = [
+                    {'matchedWord': key, **pair_index.translation_fields(key), 'editDistance': key_distance}
+                    for key, key_distance in matches
+                ]
+
+    if result is None:
+        matches = fuzzy_matches(dict_key, text, fuzzy_backend, max(alternatives, 1))
+        if matches:
+            best_match, score = matches[0]
+            result = {
+                **pair_index.translation_fields(best_match),
+                'matchType': 'fuzzy',
+                'fuzzyMatchScore': score,
+                'matchedWord': best_match
+            }
+            if alternatives:
+                result['alternatives'] = [
+                    {'matchedWord': key, **pair_index.translation_fields(key), 'fuzzyMatchScore': key_score}
+                    for key, key_score in matches
+                ]
+
+    if result is not None:
+        LOOKUP_CACHE.put(cache_key, result)
+    else:
+        NEGATIVE_CACHE.add(cache_key)
+
+    return result
+
+
+def translate_batch(dict_key, texts, fuzzy_backend=DEFAULT_FUZZY_BACKEND):
+    """
+    Translate many texts of one language pair at once.
+
+    Duplicates are resolved once and exact and tone-less hits are found in a
+    single pass. With a vectorized scoring engine, the remaining misses are
+    scored in one extract_batch call against the union of their shortlists
+    when the shortlists overlap enough (see BATCH_UNION_FACTOR); a text may
+    then match a key from another text's shortlist that scores higher than
+    its own best. Otherwise each miss is scored against its own shortlist.
+
+    Args:
+        dict_key (str): Language pair, e.g. 'english-ghomala'
+        texts (list): Folded texts to translate
+        fuzzy_backend (str): One of FUZZY_BACKENDS
+
+    Returns:
+        dict: Text -> response fields as returned by find_match (matchType
+        'exact', 'ambiguous', 'toneless' or 'fuzzy'), or None if nothing matches
+    """
+    generation = current_generation()
+    pair_index = generation.pair_indexes[dict_key]
+    results = {}
+    misses = []
+
+    for text in dict.fromkeys(texts):
+        matched_word = pair_index.folded_keys.get(text)
+        if matched_word is not None:
+            results[text] = {
+                **pair_index.translation_fields(matched_word),
+                'matchType': pair_index.exact_match_type(matched_word),
+                'matchedWord': matched_word
+            }
+            continue
+
+        results[text] = toneless_match(dict_key, text)
+        if results[text] is not None:
+            continue
+
+        cache_key = _cache_key(generation, dict_key, text, 'fuzzy', fuzzy_backend, 0)
+        results[text] = LOOKUP_CACHE.get(cache_key)
+        if results[text] is None and not NEGATIVE_CACHE.contains(cache_key):
+            misses.append(text)
+
+    if not misses:
+        return results
+
+    shortlists = [fuzzy_candidates(dict_key, text, fuzzy_backend) for text in misses]
+    # Candidates shared by every miss, in first-seen order
+    candidates = list(dict.fromkeys(key for shortlist in shortlists for key in shortlist))
+
+    union_cost = len(candidates) * len(misses)
+    shortlist_cost = sum(len(shortlist) for shortlist in shortlists)
+    if SCORING_ENGINE.vectorized and union_cost <= BATCH_UNION_FACTOR * shortlist_cost:
+        best_matches = SCORING_ENGINE.extract_batch(misses, candidates, score_cutoff=FUZZY_SCORE_THRESHOLD)
+    else:
+        best_matches = [
+            SCORING_ENGINE.extract_one(text, shortlist, score_cutoff=FUZZY_SCORE_THRESHOLD) if shortlist else None
+            for text, shortlist in zip(misses, shortlists)
+        ]
+
+    for text, best in zip(misses, best_matches):
+        cache_key = _cache_key(generation, dict_key, text, 'fuzzy', fuzzy_backend, 0)
+        if best is None:
+            NEGATIVE_CACHE.add(cache_key)
+            continue
+
+        best_match, score = best
+        results[text] = {
+            **pair_index.translation_fields(best_match),
+            'matchType': 'fuzzy',
+            'fuzzyMatchScore': score,
+            'matchedWord': best_match
+        }
+        LOOKUP_CACHE.put(cache_key, results[text])
+
+    return results
+
+
+def fuzzy_candidates(dict_key, text, backend=DEFAULT_FUZZY_BACKEND):
+    """
+    Shortlist the keys worth scoring for a text.
+
+    The 'automaton' backend shortlists the keys within AUTOMATON_MAX_DISTANCE
+    edits and falls back to the trigram shortlist when there are none.
+
+    Returns:
+        list: Candidate keys
+    """
+    pair_index = current_generation().pair_indexes[dict_key]
+    candidates = None
+
+    if backend == 'automaton':
+        candidates = [key for key, _ in pair_index.key_trie.search_within(text, AUTOMATON_MAX_DISTANCE)]
+
+    if not candidates:
+        candidates = pair_index.trigrams.candidates(text)
+
+    return candidates
+
+
+def fuzzy_match(dict_key, text, backend=DEFAULT_FUZZY_BACKEND):
+    """
+    Find the dictionary key closest to the text.
+
+    Returns:
+        tuple: (best_match, score), or None if no key scores above the threshold
+    """
+    matches = fuzzy_matches(dict_key, text, backend)
+    return matches[0] if matches else None
+
+
+def fuzzy_matches(dict_key, text, backend=DEFAULT_FUZZY_BACKEND, limit=1):
+    """
+    Find the dictionary keys closest to the text.
+
+    Only a bounded set of candidates (see fuzzy_candidates) is scored, so
+    the cost of a lookup does not grow with the size of the dictionary.
+
+    Args:
+        dict_key (str): Language pair, e.g. 'english-ghomala'
+        text (str): Normalized text to look up
+        backend (str): One of FUZZY_BACKENDS
+        limit (int): Maximum number of keys to return
+
+    Returns:
+        list: Up to `limit` (key, score) tuples scoring above the threshold, best first
+    """
+    candidates = fuzzy_candidates(dict_key, text, backend)
+
+    if not candidates:
+        return []
+
+    return SCORING_ENGINE.extract(text, candidates, limit, score_cutoff=FUZZY_SCORE_THRESHOLD)
+
+
+def typo_match(dict_key, text):
+    """
+    Correct a typo of up to two edits with the symmetric delete index.
+
+    Returns:
+        tuple: (best_match, edit_distance), or None if no key is close enough
+    """
+    matches = typo_matches(dict_key, text)
+    return matches[0] if matches else None
+
+
+def typo_matches(dict_key, text, limit=1):
+    """
+    Find the keys within two edits of the text with the symmetric delete index.
+
+    The keys within two edits are ranked with the fuzzy path's scorer, so that
+    whenever the fuzzy path's best match is itself within two edits of the
+    query, both paths return the same key.
+
+    Args:
+        dict_key (str): Language pair, e.g. 'english-ghomala'
+        text (str): Normalized text to look up
+        limit (int): Maximum number of keys to return
+
+    Returns:
+        list: Up to `limit` (key, edit_distance) tuples, best first
+    """
+    matches = current_generation().pair_indexes[dict_key].typos.lookup(text)
+
+    if not matches:
+        return []
+
+    distances = dict(matches)
+    ranked = SCORING_ENGINE.extract(text, distances.keys(), limit)
+
+    return [(key, distances[key]) for key, _ in ranked]
+
+
+def search_keys(dict_key, query, mode, max_distance=AUTOMATON_MAX_DISTANCE, limit=None):
+    """
+    Search the source-side keys of a language pair with the key trie.
+
+    Args:
+        dict_key (str): Language pair, e.g. 'english-ghomala'
+        query (str): Wildcard pattern, prefix or text depending on the mode
+        mode (str): One of SEARCH_MODES
+        max_distance (int): Maximum edit distance in 'fuzzy' mode
+        limit (int): Maximum number of results (all if None)
+
+    Returns:
+        list: (key, edit distance) tuples, the distance being None outside 'fuzzy' mode
+    """
+    key_trie = current_generation().pair_indexes[dict_key].key_trie
+
+    if mode == 'wildcard':
+        return [(key, None) for key in key_trie.match_wildcard(query, limit)]
+
+    if mode == 'prefix':
+        return [(key, None) for key in key_trie.with_prefix(query, limit)]
+
+    return key_trie.search_within(query, max_distance)[:limit]
+
+
+def suggest(dict_key, prefix, limit=10):
+    """
+    Complete a prefix with the most popular source-side keys of a language pair.
+
+    Args:
+        dict_key (str): Language pair, e.g. 'english-ghomala'
+        prefix (str): What the user has typed so far
+        limit (int): Maximum number of completions
+
+    Returns:
+        list: Original keys, most popular first
+    """
+    return current_generation().pair_indexes[dict_key].prefixes.complete(prefix, limit)
+
+
+def translate_segments(dict_key, text, fuzzy_backend=DEFAULT_FUZZY_BACKEND):
+    """
+    Translate a sentence phrase by phrase.
+
+    The sentence is split into the longest dictionary phrases (greedy longest
+    match on the token trie); tokens that start no phrase go through the
+    exact and fuzzy lookups, memoized for the duration of the call.
+
+    Args:
+        dict_key (str): Language pair, e.g. 'english-ghomala'
+        text (str): Folded sentence
+        fuzzy_backend (str): One of FUZZY_BACKENDS
+
+    Returns:
+        list: One dict per segment with its text, translation (None when
+        nothing matches), matchType and, for fuzzy matches, matchedWord and
+        fuzzyMatchScore
+    """
+    pair_index = current_generation().pair_indexes[dict_key]
+    tokens = tokenize(text)
+    memo = {}
+    segments = []
+
+    for start, end, key in segment(tokens, pair_index.phrases):
+        segment_text = ' '.join(tokens[start:end])
+
+        if key is not None:
+            segments.append({
+                'text': segment_text,
+                **pair_index.translation_fields(key),
+                'matchType': pair_index.exact_match_type(key),
+                'matchedWord': key
+            })
+            continue
+
+        if segment_text not in memo:
+            memo[segment_text] = find_match(dict_key, segment_text, 'fuzzy', fuzzy_backend)
+
+        match = memo[segment_text]
+        if match is None:
+            segments.append({'text': segment_text, 'translation': None, 'matchType': 'none'})
+        else:
+            segments.append({'text': segment_text, **match})
+
+    return segments
+
+
+def annotate(dict_key, text, overlapping=True):
+    """
+    Find every dictionary term occurring in a document.
+
+    The text is scanned once by the pair's Aho-Corasick automaton; only
+    occurrences starting and ending on word boundaries are kept.
+
+    Args:
+        dict_key (str): Language pair, e.g. 'english-ghomala'
+        text (str): Document to annotate
+        overlapping (bool): Keep nested and overlapping terms; otherwise keep
+            the leftmost-longest non-overlapping ones
+
+    Returns:
+        tuple: (NFC-normalized text, list of spans with start and end offsets
+        into it, the matched text, matchedWord and translation)
+    """
+    pair_index = current_generation().pair_indexes[dict_key]
+    annotator = pair_index.annotator
+    text = unicodedata.normalize('NFC', text)
+    folded, offsets = fold_with_offsets(text)
+
+    spans = []
+    for start, end, key in annotator.find_all(folded):
+        if start > 0 and folded[start - 1].isalnum():
+            continue
+        if end < len(folded) and folded[end].isalnum():
+            continue
+
+        original_start = offsets[start]
+        original_end = offsets[end - 1] + 1
+        spans.append({
+            'start': original_start,
+            'end': original_end,
+            'text': text[original_start:original_end],
+            'matchedWord': key,
+            **pair_index.translation_fields(key)
+        })
+
+    spans.sort(key=lambda span: (span['start'], -span['end']))
+
+    if not overlapping:
+        selected = []
+        for span in spans:
+            if not selected or span['start'] >= selected[-1]['end']:
+                selected.append(span)
+        spans = selected
+
+    return text, spans
+
+
+def pivot_translate(dict_key, text, match_mode='fuzzy', fuzzy_backend=DEFAULT_FUZZY_BACKEND):
+    """
+    Translate through the pivot languages of a pair without a dictionary.
+
+    The text is matched (exactly, then with the typo or fuzzy paths) in the
+    first dictionary of the route; its translations are then looked up
+    exactly in the following ones.
+
+    Args:
+        dict_key (str): Language pair, e.g. 'english-french'
+        text (str): Folded text to translate
+        match_mode (str): One of MATCH_MODES, used for the first hop
+        fuzzy_backend (str): One of FUZZY_BACKENDS
+
+    Returns:
+        dict: Response fields (translation, senses, pivotLanguages, matchType,
+        matchedWord and score), or None if the text cannot be translated.
+        matchType is 'ambiguous' rather than 'exact' when the route gives
+        several senses, see pivot_match_type
+    """
+    generation = current_generation()
+    route = generation.pivot_routes[dict_key]
+    hop_keys = route_pair_keys(route)
+    first = generation.pair_indexes[hop_keys[0]]
+
+    matched_word = exact_match(hop_keys[0], text)
+    if matched_word is not None:
+        result = {'matchedWord': matched_word}
+    else:
+        match = find_match(hop_keys[0], text, 'typo' if match_mode == 'typo' else 'fuzzy', fuzzy_backend)
+        if match is None:
+            return None
+        result = {field: value for field, value in match.items() if field not in ('translation', 'senses')}
+        matched_word = match['matchedWord']
+
+    senses = first.senses(matched_word)
+    for hop_key in hop_keys[1:]:
+        senses = translate_senses(generation.pair_indexes[hop_key], senses)
+        if not senses:
+            return None
+
+    # An exact first hop is only an exact translation if the route does not fan out
+    if 'matchType' not in result:
+        result['matchType'] = pivot_match_type(senses)
+
+    return {
+        **result,
+        'translation': ', '.join(senses),
+        'senses': senses,
+        'pivotLanguages': route[1:-1]
+    }
@@ -0,0 +1,109 @@
+import heapq
+from array import array
+from collections import defaultdict
+from text_normalization import fold_key
+
+# Maximum number of keys handed to the fuzzy scorer for a single query
+DEFAULT_CANDIDATE_LIMIT = 200
+
+# Trigrams shared by more keys than this are too common to discriminate
+# between candidates (e.g. "  a", "ed "), so they are skipped when counting
+DEFAULT_STOP_TRIGRAM_LIMIT = 5000
+
+
+def extract_trigrams(text):
+    """
+    Return the set of character trigrams of a string.
+
+    The text is folded and padded so that short words ("up", "on") and word
+    boundaries still produce trigrams.
+
+    Args:
+        text (str): Text to split into trigrams
+
+    Returns:
+        set: Distinct trigrams of the padded text
+    """
+    padded = f"  {fold_key(text)} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TrigramIndex:
+    """
+    Inverted index from character trigrams to dictionary keys.
+
+    It is built once per language pair and used to shortlist a bounded set of
+    candidate keys sharing the most trigrams with a query, so that the fuzzy
+    scorer never has to visit every key of the dictionary.
+    """
+
+    def __init__(self, keys, candidate_limit=DEFAULT_CANDIDATE_LIMIT,
+                 stop_trigram_limit=DEFAULT_STOP_TRIGRAM_LIMIT):
+        self.candidate_limit = candidate_limit
+        self.stop_trigram_limit = stop_trigram_limit
+        self._keys = []
+        self._key_ids = {}
+        # Trigram -> array of key ids; flat arrays hold no per-id objects, so
+        # reading them never writes refcounts to memory shared between forked
+        # workers
+        self._postings = {}
+
+        for key in keys:
+            self.add(key)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def add(self, key):
+        """Index a new key (no-op if the key is already indexed)"""
+        if key in self._key_ids:
+            return
+
+        key_id = len(self._keys)
+        self._keys.append(key)
+        self._key_ids[key] = key_id
+
+        for trigram in extract_trigrams(key):
+            posting = self._postings.get(trigram)
+            if posting is None:
+                posting = self._postings[trigram] = array('I')
+            posting.append(key_id)
+
+    def candidates(self, query, limit=None):
+        """
+        Return the keys sharing the most trigrams with the query.
+
+        Args:
+            query (str): Text to look up
+            limit (int): Maximum number of candidates (defaults to candidate_limit)
+
+        Returns:
+            list: Up to `limit` keys, best candidates first
+        """
+        limit = limit or self.candidate_limit
+
+        # Small dictionaries are cheaper to score entirely
+        if len(self._keys) <= limit:
+            return list(self._keys)
+
+        # Visit the rarest trigrams first, they are the most selective
+        postings = sorted(
+            (self._postings[trigram] for trigram in extract_trigrams(query) if trigram in self._postings),
+            key=len
+        )
+
+        shared_counts = defaultdict(int)
+        for posting in postings:
+            if len(posting) > self.stop_trigram_limit and shared_counts:
+                break
+            for key_id in posting:
+                shared_counts[key_id] += 1
+
+        # Rank by shared trigrams, then by closeness in length to the query
+        query_length = len(query)
+        best_ids = heapq.nlargest(
+            limit,
+            shared_counts,
+            key=lambda key_id: (shared_counts[key_id], -abs(len(self._keys[key_id]) - query_length))
+        )
+        return [self._keys[key_id] for key_id in best_ids]